@@ -0,0 +1,109 @@
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    operations: int
+    total_seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.total_seconds if self.total_seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<40} ops={self.operations:<7} {self.throughput:>10.1f} ops/s "
+            f"p50={self.p50_ms:>8.3f}ms p95={self.p95_ms:>8.3f}ms p99={self.p99_ms:>8.3f}ms"
+        )
+
+
+def summarize(name: str, latencies: list[float], total_seconds: float) -> BenchmarkResult:
+    """
+    Builds a benchmark result from a list of per-operation latencies.
+
+    :param name: Name of the benchmark case.
+    :type name: str
+    :param latencies: Per-operation latencies in seconds.
+    :type latencies: list[float]
+    :param total_seconds: Wall-clock duration of the whole run in seconds.
+    :type total_seconds: float
+    :returns: Aggregated benchmark result.
+    :rtype: BenchmarkResult
+    """
+    if len(latencies) > 1:
+        quantiles = statistics.quantiles(latencies, n=100)
+        p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+
+    return BenchmarkResult(
+        name=name,
+        operations=len(latencies),
+        total_seconds=total_seconds,
+        p50_ms=p50 * 1000,
+        p95_ms=p95 * 1000,
+        p99_ms=p99 * 1000,
+    )
+
+
+def run_sync(name: str, operation: Callable[[], object], iterations: int) -> BenchmarkResult:
+    """
+    Measures a synchronous operation executed sequentially.
+
+    :param name: Name of the benchmark case.
+    :type name: str
+    :param operation: Callable to measure.
+    :type operation: Callable[[], object]
+    :param iterations: Number of times the operation is executed.
+    :type iterations: int
+    :returns: Aggregated benchmark result.
+    :rtype: BenchmarkResult
+    """
+    latencies = []
+    started = time.perf_counter()
+
+    for _ in range(iterations):
+        op_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - op_started)
+
+    return summarize(name=name, latencies=latencies, total_seconds=time.perf_counter() - started)
+
+
+async def run_concurrent(
+    name: str, operation: Callable[[], Awaitable[object]], iterations: int, concurrency: int
+) -> BenchmarkResult:
+    """
+    Measures an asynchronous operation executed with bounded concurrency.
+
+    :param name: Name of the benchmark case.
+    :type name: str
+    :param operation: Coroutine factory to measure.
+    :type operation: Callable[[], Awaitable[object]]
+    :param iterations: Total number of operations.
+    :type iterations: int
+    :param concurrency: Maximum number of operations in flight.
+    :type concurrency: int
+    :returns: Aggregated benchmark result.
+    :rtype: BenchmarkResult
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def _measure() -> None:
+        async with semaphore:
+            op_started = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - op_started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_measure() for _ in range(iterations)))
+
+    return summarize(name=name, latencies=latencies, total_seconds=time.perf_counter() - started)
@@ -0,0 +1,145 @@
+"""
+Side-by-side latency and throughput benchmark of the Motor and native PyMongo asyncio drivers.
+
+Requires a reachable MongoDB configured by `DB_URL`. Run from the repository root:
+
+    ENV_FOR_DYNACONF=dev python -m benchmarks.mongo_driver_benchmark --iterations 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import random
+
+from bson import ObjectId
+
+from benchmarks.bench_utils import BenchmarkResult, run_concurrent
+from src.core.settings import get_settings
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.enums.mongo_driver_enum import MongoDriverEnum
+from src.entities.schemas.project_data.project_schemas import (
+    ProjectCreateSchema,
+    ProjectSchema,
+)
+from src.infrastructure.database.mongo_dependency import MongoDBDependency
+from src.infrastructure.database.mongo_manager import MongoManager
+
+BENCHMARK_COLLECTION = "benchmark_project"
+
+
+def _build_projects(projects: int, instances: int) -> list[ProjectCreateSchema]:
+    return [
+        ProjectCreateSchema.model_validate(
+            {
+                "name": f"project {project}",
+                "instances": [
+                    {
+                        "instance_id": str(ObjectId()),
+                        "instance_name": f"instance {instance}",
+                        "project_id": str(ObjectId()),
+                        "fat": ["epic", "task"],
+                        "chat_id": -100123456789,
+                        "language": LanguageEnum.EN,
+                    }
+                    for instance in range(instances)
+                ],
+            }
+        )
+        for project in range(projects)
+    ]
+
+
+def _instance_pipeline(instance_id: str) -> list[dict]:
+    return [
+        {"$match": {"instances.instance_id": instance_id}},
+        {
+            "$project": {
+                "instances": {
+                    "$filter": {
+                        "input": "$instances",
+                        "as": "instance",
+                        "cond": {"$eq": ["$$instance.instance_id", instance_id]},
+                    }
+                },
+                "name": 1,
+                "_id": 1,
+            }
+        },
+        {"$group": {"_id": None, "items": {"$push": {"instances": "$instances", "name": "$name", "_id": "$_id"}}}},
+    ]
+
+
+async def benchmark_driver(
+    driver: MongoDriverEnum, projects: list[ProjectCreateSchema], iterations: int, concurrency: int
+) -> list[BenchmarkResult]:
+    """
+    Seeds the benchmark collection and measures point lookups and aggregations for one driver.
+
+    :param driver: Driver to benchmark.
+    :type driver: MongoDriverEnum
+    :param projects: Projects to seed the collection with.
+    :type projects: list[ProjectCreateSchema]
+    :param iterations: Number of operations per case.
+    :type iterations: int
+    :param concurrency: Maximum number of operations in flight.
+    :type concurrency: int
+    :returns: Results of the point lookup and aggregation cases.
+    :rtype: list[BenchmarkResult]
+    """
+    get_settings().set("DB_DRIVER", driver.value)
+    MongoDBDependency._instance = None
+    mongo_dep = MongoDBDependency()
+    manager = MongoManager(mongo_dep)
+
+    collection = await mongo_dep.get_collection(BENCHMARK_COLLECTION)
+    await collection.drop()
+    await collection.create_index({"instances.instance_id": 1})
+    await manager.insert_many(collection=collection, data_list=projects)
+
+    instance_ids = [instance.instance_id for project in projects for instance in project.instances]
+
+    async def _point_lookup() -> None:
+        await manager.find_one(
+            collection=collection,
+            schema=ProjectSchema,
+            value=random.choice(instance_ids),
+            field="instances.instance_id",
+        )
+
+    async def _aggregation() -> None:
+        await manager.aggregate(
+            pipeline=_instance_pipeline(random.choice(instance_ids)),
+            collection=collection,
+            schema=ProjectSchema,
+            item_key="items",
+        )
+
+    results = [
+        await run_concurrent(f"{driver.value}: point lookup", _point_lookup, iterations, concurrency),
+        await run_concurrent(f"{driver.value}: aggregation", _aggregation, iterations, concurrency),
+    ]
+
+    await collection.drop()
+    await mongo_dep.close()
+
+    return results
+
+
+async def main(iterations: int, concurrency: int, projects_count: int, instances_count: int) -> None:
+    projects = _build_projects(projects=projects_count, instances=instances_count)
+
+    for driver in MongoDriverEnum:
+        for result in await benchmark_driver(
+            driver=driver, projects=projects, iterations=iterations, concurrency=concurrency
+        ):
+            print(result)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--instances", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.concurrency, args.projects, args.instances))
@@ -0,0 +1,75 @@
+"""
+FSM state payload size and update latency of the navigation history over long admin sessions.
+
+Compares the previous unbounded `callback_history` dict with the bounded LRU kept by `get_info_for_state`.
+The payload size is the JSON size of the state data, as it is stored by the Redis FSM storage. Run from the
+repository root:
+
+    ENV_FOR_DYNACONF=dev python -m benchmarks.state_history_benchmark --callbacks 10000 --distinct 2000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from types import SimpleNamespace
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from benchmarks.bench_utils import summarize
+from src.utils.state_utils import get_info_for_state
+
+
+async def _unbounded_history(callback: SimpleNamespace, state: FSMContext) -> str:
+    data = await state.get_data()
+    callback_history = data.get("callback_history", {})
+    current_callback = data.get("current_callback")
+
+    if current_callback is None:
+        callback_history[callback.data] = "menu"
+    elif callback.data not in callback_history:
+        callback_history[callback.data] = current_callback
+
+    data["current_callback"] = callback.data
+    data["callback_history"] = callback_history
+    await state.set_data(data)
+
+    return callback_history[callback.data]
+
+
+async def _run_case(name: str, handler, callbacks: list[str], checkpoints: set[int]) -> None:
+    state = FSMContext(storage=MemoryStorage(), key=StorageKey(bot_id=1, chat_id=1, user_id=1))
+    latencies = []
+    started = time.perf_counter()
+
+    for number, data in enumerate(callbacks, start=1):
+        op_started = time.perf_counter()
+        await handler(SimpleNamespace(data=data), state)
+        latencies.append(time.perf_counter() - op_started)
+
+        if number in checkpoints:
+            payload = json.dumps(await state.get_data())
+            print(f"{name:<12} after {number:>7} callbacks: {len(payload):>10} bytes")
+
+    print(summarize(name=name, latencies=latencies, total_seconds=time.perf_counter() - started))
+
+
+async def main(callbacks: int, distinct: int) -> None:
+    random.seed(0)
+    session = [f"instance_menu:{random.randrange(distinct)}" for _ in range(callbacks)]
+    checkpoints = {10**power for power in range(1, 8) if 10**power <= callbacks} | {callbacks}
+
+    await _run_case(name="unbounded", handler=_unbounded_history, callbacks=session, checkpoints=checkpoints)
+    await _run_case(name="bounded", handler=get_info_for_state, callbacks=session, checkpoints=checkpoints)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callbacks", type=int, default=10000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(main(callbacks=args.callbacks, distinct=args.distinct))
@@ -0,0 +1,69 @@
+"""
+Cold-start cost of loading the strings: YAML parsing versus the compiled catalog.
+
+Each case runs in a fresh interpreter so that no parsed data or YAML constructors are shared between runs. The first
+two cases time loading only; the third one times `import src.core.settings` together with the first `get_strings()`. Run from the
+repository root:
+
+    ENV_FOR_DYNACONF=dev python -m benchmarks.strings_catalog_benchmark --runs 20
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.bench_utils import summarize
+
+YAML_CASE = """
+import time
+from src.utils.yaml_utils import generate_strings_dict
+started = time.perf_counter()
+generate_strings_dict(path="{path}")
+print(time.perf_counter() - started)
+"""
+
+CATALOG_CASE = """
+import time
+from src.utils.yaml_utils import load_strings_catalog
+started = time.perf_counter()
+load_strings_catalog(path="{path}", cache_dir="{cache_dir}")
+print(time.perf_counter() - started)
+"""
+
+SETTINGS_CASE = """
+import time
+started = time.perf_counter()
+from src.core.settings import get_strings
+get_strings()
+print(time.perf_counter() - started)
+"""
+
+
+def _run_case(name: str, code: str, runs: int) -> None:
+    latencies = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(runs)
+    ]
+    print(summarize(name=name, latencies=latencies, total_seconds=sum(latencies)))
+
+
+def main(path: str, runs: int) -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        catalog_case = CATALOG_CASE.format(path=path, cache_dir=cache_dir)
+        # the first run compiles the catalog
+        subprocess.run([sys.executable, "-c", catalog_case], check=True, capture_output=True)
+
+        _run_case(name="yaml parse", code=YAML_CASE.format(path=path), runs=runs)
+        _run_case(name="compiled catalog", code=catalog_case, runs=runs)
+
+    _run_case(name="settings import + get_strings", code=SETTINGS_CASE, runs=runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", default="strings")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    main(path=args.path, runs=args.runs)
@@ -0,0 +1,106 @@
+"""
+Per-update CPU cost of Telegram update ingestion.
+
+Compares the previous path, where FastAPI validated the JSON body into an unbound `Update` and the dispatcher rebuilt it
+through `model_dump`/`model_validate` to mount the bot, with a single `Update.model_validate_json` in the bot context.
+Uses a mix of text messages and callback queries. Run from the repository root:
+
+    ENV_FOR_DYNACONF=dev python -m benchmarks.update_parsing_benchmark --updates 20000 --callback-share 0.7
+"""
+
+import argparse
+import json
+import random
+import time
+
+from aiogram.types import Update
+
+from benchmarks.bench_utils import summarize
+from src.core.settings import Configuration
+
+USER = {"id": 123456789, "is_bot": False, "first_name": "Admin", "last_name": "User", "language_code": "en"}
+CHAT = {"id": 123456789, "first_name": "Admin", "last_name": "User", "type": "private"}
+BOT_USER = {"id": 987654321, "is_bot": True, "first_name": "Taigram", "username": "taigram_bot"}
+
+
+def _message_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "from": USER,
+            "chat": CHAT,
+            "date": 1729300000,
+            "text": "/start",
+            "entities": [{"offset": 0, "length": 6, "type": "bot_command"}],
+        },
+    }
+
+
+def _callback_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": USER,
+            "chat_instance": "-123456789",
+            "data": f"instance_menu:{update_id % 50}",
+            "message": {
+                "message_id": update_id,
+                "from": BOT_USER,
+                "chat": CHAT,
+                "date": 1729300000,
+                "text": "Instance settings\nChat: -100123456789\nEvents: epic, task, issue",
+                "reply_markup": {
+                    "inline_keyboard": [
+                        [{"text": f"Button {row}-{column}", "callback_data": f"action:{row}:{column}"}]
+                        for row in range(5)
+                        for column in range(2)
+                    ]
+                },
+            },
+        },
+    }
+
+
+def _previous_path(body: bytes) -> Update:
+    update = Update.model_validate(json.loads(body))
+    return Update.model_validate(update.model_dump(), context={"bot": Configuration.bot})
+
+
+def _single_parse(body: bytes) -> Update:
+    return Update.model_validate_json(body, context={"bot": Configuration.bot})
+
+
+def _run_case(name: str, parse, bodies: list[bytes]) -> None:
+    latencies = []
+    started = time.perf_counter()
+
+    for body in bodies:
+        op_started = time.process_time()
+        parse(body)
+        latencies.append(time.process_time() - op_started)
+
+    print(summarize(name=name, latencies=latencies, total_seconds=time.perf_counter() - started))
+
+
+def main(updates: int, callback_share: float) -> None:
+    random.seed(0)
+    bodies = [
+        json.dumps(
+            _callback_update(update_id) if random.random() < callback_share else _message_update(update_id)
+        ).encode()
+        for update_id in range(updates)
+    ]
+
+    _run_case(name="fastapi + dispatcher remount", parse=_previous_path, bodies=bodies)
+    _run_case(name="model_validate_json", parse=_single_parse, bodies=bodies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=20000)
+    parser.add_argument("--callback-share", type=float, default=0.7)
+    args = parser.parse_args()
+
+    main(updates=args.updates, callback_share=args.callback_share)
@@ -0,0 +1,65 @@
+"""
+Per-webhook CPU cost of rejecting event types that the instance does not follow.
+
+Compares the previous path, where FastAPI validated the whole body into `WebhookPayload` before the followed action
+types were checked, with reading only the type and the action first and validating the payload of followed events.
+Uses the Taiga fixtures with a share of webhooks for unfollowed types. Run from the repository root:
+
+    ENV_FOR_DYNACONF=dev python -m benchmarks.webhook_gate_benchmark --webhooks 20000 --filtered-share 0.5
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from benchmarks.bench_utils import summarize
+from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+from src.logic.web_app_logic.webhook_parser import parse_webhook, peek_webhook_event
+
+FIXTURES = Path("tests/entities/fixtures")
+FOLLOWED_FIXTURES = ("task_raw.json", "user_story_raw.json")
+FILTERED_FIXTURES = ("milestone_raw.json",)
+FOLLOWED_TYPES = frozenset({"task", "userstory"})
+
+
+def _previous_path(body: bytes) -> WebhookPayload | None:
+    wh_data = WebhookPayload.model_validate_json(body)
+    return wh_data if wh_data.type in FOLLOWED_TYPES else None
+
+
+def _peek_gate(body: bytes) -> WebhookPayload | None:
+    if peek_webhook_event(body=body)["type"] not in FOLLOWED_TYPES:
+        return None
+    return parse_webhook(body=body)
+
+
+def _run_case(name: str, parse, bodies: list[bytes]) -> None:
+    latencies = []
+    started = time.perf_counter()
+
+    for body in bodies:
+        op_started = time.process_time()
+        parse(body)
+        latencies.append(time.process_time() - op_started)
+
+    print(summarize(name=name, latencies=latencies, total_seconds=time.perf_counter() - started))
+
+
+def main(webhooks: int, filtered_share: float) -> None:
+    random.seed(0)
+    followed = [(FIXTURES / name).read_bytes() for name in FOLLOWED_FIXTURES]
+    filtered = [(FIXTURES / name).read_bytes() for name in FILTERED_FIXTURES]
+    bodies = [random.choice(filtered if random.random() < filtered_share else followed) for _ in range(webhooks)]
+
+    _run_case(name="validate, then filter", parse=_previous_path, bodies=bodies)
+    _run_case(name="peek type, then validate", parse=_peek_gate, bodies=bodies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--webhooks", type=int, default=20000)
+    parser.add_argument("--filtered-share", type=float, default=0.5)
+    args = parser.parse_args()
+
+    main(webhooks=args.webhooks, filtered_share=args.filtered_share)
@@ -14,3 +14,44 @@ class MessageFormatterError(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class AttachmentTooLargeError(Exception):
+    """
+    The exception raised when an attachment exceeds the configured size limit while it is being streamed.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class ChatUnavailableError(Exception):
+    """
+    The exception raised when Telegram permanently refuses to deliver to a chat, e.g. the bot was removed from it.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class NotificationDeliveryError(Exception):
+    """
+    The exception raised when sending a batch of notifications fails, possibly after some of them have been sent.
+    """
+
+    def __init__(self, message, delivered: int, retry_after: float | None = None):
+        self.message = message
+        self.delivered = delivered
+        self.retry_after = retry_after
+
+
+class DeliveryDeferredError(Exception):
+    """
+    The exception raised by a delivery lane handler to put the undelivered items of a chat back into the lane for a
+    while, e.g. under Telegram flood control, without holding up the other chats of the lane.
+    """
+
+    def __init__(self, message, items: list, delay: float):
+        self.message = message
+        self.items = items
+        self.delay = delay
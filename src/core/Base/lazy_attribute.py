@@ -0,0 +1,37 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class LazyAttribute:
+    """
+    Class attribute created by a factory on first access and then stored on the owner class.
+
+    After the first access the attribute is a plain class attribute, so later reads cost nothing and the value can be
+    replaced or patched as usual.
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """
+        Initializes the attribute with the factory of its value.
+
+        :param factory: Callable creating the value on first access.
+        :type factory: Callable[[], Any]
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._name: str | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        with self._lock:
+            # another thread may have created the value while this one was waiting
+            if (value := owner.__dict__.get(self._name)) is not self:
+                return value
+
+            value = self._factory()
+            setattr(owner, self._name, value)
+
+        return value
@@ -1,64 +1,26 @@
-import asyncio
-from contextlib import asynccontextmanager
-
 import uvicorn
 from fastapi import FastAPI
 
-from src.core.settings import Configuration, get_settings
+from src.core.settings import get_logger, get_settings
 from src.entities.enums.environment_enum import EnvironmentEnum
-from src.infrastructure.database.mongo_dependency import MongoDBDependency
-from src.logic.bot_logic.handlers.service_handlers.service_events_handlers import (
-    start_bot,
-    stop_bot,
-)
-from src.logic.services.project_service import ProjectService
-from src.logic.web_app_logic.exception_handler import handling_exceptions
-from src.presentation.bot_routers.init_router import (
-    register_bot_middlewares,
-    register_bot_routers,
-)
-from src.presentation.web_app_routes import web_app_router
-
-
-@asynccontextmanager
-async def prod_lifespan(app: FastAPI):
-    settings = get_settings()
-    bot = Configuration.bot
-
-    url_webhook = f"{settings.WEBHOOK_DOMAIN}{settings.UPDATES_PATH}"
-    await bot.set_webhook(
-        url=url_webhook,
-        allowed_updates=Configuration.dispatcher.resolve_used_update_types(),
-        drop_pending_updates=True,
-    )
-    await start_bot()
-
-    yield
-
-    MongoDBDependency().close()
-
-    await stop_bot()
-
-    await bot.delete_webhook()
-    await bot.session.close()
 
 
-@asynccontextmanager
-async def dev_lifespan(app: FastAPI):
-    async def _start_polling():
-        await Configuration.dispatcher.start_polling(Configuration.bot, handle_signals=False)
+def create_app() -> FastAPI:
+    """
+    Creates the web application for the current environment.
 
-    polling_task = asyncio.create_task(_start_polling())
+    Used as the uvicorn factory, so each worker process builds its own application and performs the asynchronous
+    startup inside its own event loop. The lifespans, the bot handlers and the web routes are imported here, since
+    they pull in aiogram, so importing this module and starting the server supervisor stay cheap.
 
-    yield
+    :return: The configured FastAPI application.
+    :rtype: FastAPI
+    :raises RuntimeError: If the current environment is unknown.
+    """
+    from src.core.lifespan import dev_lifespan, prod_lifespan
+    from src.logic.web_app_logic.exception_handler import handling_exceptions
+    from src.presentation.web_app_routes import web_app_router
 
-    MongoDBDependency().close()
-
-    polling_task.cancel()
-    await Configuration.bot.session.close()
-
-
-def run_app():
     match current_env := get_settings().current_env:
         case EnvironmentEnum.PROD:
             web_app = FastAPI(lifespan=prod_lifespan)
@@ -67,9 +29,25 @@ def run_app():
         case _:
             raise RuntimeError(f"Unknown environment {current_env}")
 
-    asyncio.run(register_bot_middlewares())
-    asyncio.run(register_bot_routers())
-    web_app = asyncio.run(handling_exceptions(app=web_app))
+    handling_exceptions(app=web_app)
     web_app.include_router(web_app_router)
-    asyncio.run(ProjectService().create_indexes())
-    uvicorn.run(web_app, host="0.0.0.0", port=8000, loop="asyncio", log_config=None)
+
+    return web_app
+
+
+def run_app():
+    workers = get_settings().WORKERS
+
+    if workers > 1 and get_settings().current_env != EnvironmentEnum.PROD:
+        get_logger(name=__name__).warning("Polling supports a single worker only, WORKERS=%s is ignored", workers)
+        workers = 1
+
+    uvicorn.run(
+        "src.core.app:create_app",
+        factory=True,
+        workers=workers,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio",
+        log_config=None,
+    )
@@ -0,0 +1,173 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.core.settings import (
+    Configuration,
+    get_settings,
+    init_configuration,
+    load_strings,
+)
+from src.core.startup import StartupOrchestrator
+from src.entities.named_tuples.startup_tuples import StartupStepTuple
+from src.infrastructure.broker.leader_election import LeaderElection, is_multi_worker
+from src.infrastructure.database.mongo_dependency import MongoDBDependency
+from src.logic.bot_logic.handlers.service_handlers.service_events_handlers import (
+    start_bot,
+    stop_bot,
+)
+from src.logic.services.event_stats import EventStats
+from src.logic.services.health_service import HealthService
+from src.logic.services.notification_queue_service import NotificationQueueService
+from src.logic.services.project_service import ProjectService
+from src.logic.services.webhook_archive import WebhookArchive
+from src.logic.web_app_logic.update_parser import get_allowed_update_types, parse_update
+from src.logic.web_app_logic.update_processor import UpdateProcessor
+from src.presentation.bot_routers.init_router import (
+    register_bot_middlewares,
+    register_bot_routers,
+    register_bot_storage,
+)
+from src.utils.strings_watcher import StringsWatcher
+
+WARM_UP_UPDATE = b'{"update_id": 0, "message": {"message_id": 0, "date": 0, "chat": {"id": 0, "type": "private"}}}'
+
+
+async def register_dispatcher() -> None:
+    """
+    Registers the FSM storage, middlewares and routers with the dispatcher.
+    """
+    await register_bot_storage()
+    await register_bot_middlewares()
+    await register_bot_routers()
+
+
+async def load_bot_strings() -> None:
+    """
+    Loads the YAML strings in a worker thread so that file parsing does not block the event loop.
+    """
+    await asyncio.to_thread(load_strings)
+
+
+async def warm_up_schemas() -> None:
+    """
+    Resolves the allowed update types and builds the lazily initialised parts of the update model.
+    """
+    get_allowed_update_types()
+    parse_update(body=WARM_UP_UPDATE)
+
+
+async def register_webhook(drop_pending_updates: bool) -> None:
+    """
+    Registers the webhook of the bot.
+
+    :param drop_pending_updates: Whether the updates Telegram has not delivered yet are dropped.
+    :type drop_pending_updates: bool
+    """
+    settings = get_settings()
+
+    url_webhook = f"{settings.WEBHOOK_DOMAIN}{settings.UPDATES_PATH}"
+    await Configuration.bot.set_webhook(
+        url=url_webhook,
+        allowed_updates=Configuration.dispatcher.resolve_used_update_types(),
+        drop_pending_updates=drop_pending_updates,
+    )
+
+
+async def on_leader_elected() -> None:
+    """
+    Registers the webhook and notifies admins; executed only by the leader elected on startup.
+    """
+    await register_webhook(drop_pending_updates=True)
+    await start_bot()
+
+
+async def on_leader_takeover() -> None:
+    """
+    Registers the webhook again, keeping the pending updates; executed by a process taking the leadership over.
+    """
+    await register_webhook(drop_pending_updates=False)
+
+
+async def start_leader_election() -> None:
+    """
+    Starts the leader election, which runs the leader startup in the elected process.
+    """
+    await LeaderElection().start(on_elected=on_leader_elected, on_takeover=on_leader_takeover)
+
+
+def get_startup_steps() -> list[StartupStepTuple]:
+    """
+    Returns the startup steps shared by all environments.
+
+    :return: The startup steps.
+    :rtype: list[StartupStepTuple]
+    """
+    return [
+        StartupStepTuple(name="strings", func=load_bot_strings),
+        StartupStepTuple(name="strings_watcher", func=StringsWatcher().start, depends_on=("strings",)),
+        StartupStepTuple(name="indexes", func=ProjectService().create_indexes),
+        StartupStepTuple(name="dispatcher", func=register_dispatcher),
+        StartupStepTuple(name="schemas", func=warm_up_schemas, depends_on=("dispatcher",)),
+        StartupStepTuple(name="notifications", func=NotificationQueueService().start, depends_on=("strings",)),
+        StartupStepTuple(name="archive", func=WebhookArchive().start),
+        StartupStepTuple(name="stats", func=EventStats().start),
+        StartupStepTuple(name="health", func=HealthService().start),
+    ]
+
+
+@asynccontextmanager
+async def prod_lifespan(app: FastAPI):
+    init_configuration()
+    bot = Configuration.bot
+    election = LeaderElection()
+
+    await StartupOrchestrator().run(
+        steps=[
+            *get_startup_steps(),
+            StartupStepTuple(name="webhook", func=start_leader_election, depends_on=("strings", "dispatcher")),
+        ]
+    )
+
+    yield
+
+    await UpdateProcessor().close(timeout=get_settings().UPDATES_SHUTDOWN_TIMEOUT)
+    await NotificationQueueService().stop()
+    await WebhookArchive().stop()
+    await EventStats().stop()
+    await HealthService().stop()
+    await StringsWatcher().stop()
+    await MongoDBDependency().close()
+
+    if election.is_leader:
+        await stop_bot()
+
+        # the webhook is shared by all workers, so it is kept when the others keep serving it
+        if not is_multi_worker():
+            await bot.delete_webhook()
+
+    await election.stop()
+    await bot.session.close()
+
+
+@asynccontextmanager
+async def dev_lifespan(app: FastAPI):
+    async def _start_polling():
+        await Configuration.dispatcher.start_polling(Configuration.bot, handle_signals=False)
+
+    init_configuration()
+    await StartupOrchestrator().run(steps=get_startup_steps())
+    polling_task = asyncio.create_task(_start_polling())
+
+    yield
+
+    await NotificationQueueService().stop()
+    await WebhookArchive().stop()
+    await EventStats().stop()
+    await HealthService().stop()
+    await StringsWatcher().stop()
+    await MongoDBDependency().close()
+
+    polling_task.cancel()
+    await Configuration.bot.session.close()
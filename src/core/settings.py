@@ -1,18 +1,59 @@
+import time
 from logging import Logger
+from typing import TYPE_CHECKING
 
-from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
 from dynaconf import Dynaconf
 from dynaconf.validator import Validator
 
+from src.core.Base.lazy_attribute import LazyAttribute
 from src.core.Base.singleton import Singleton
 from src.utils.logger_utils import LoggerUtils
-from src.utils.yaml_utils import generate_strings_dict
+
+if TYPE_CHECKING:
+    from aiogram import Bot, Dispatcher
+
+
+def _create_logger() -> LoggerUtils:
+    """
+    Creates the logger utility, which also creates the log directory.
+
+    :returns: The configured logger utility.
+    :rtype: LoggerUtils
+    """
+    return LoggerUtils(settings=Configuration.settings)
+
+
+def _create_bot() -> "Bot":
+    """
+    Creates the aiogram bot.
+
+    :returns: The bot with HTML parse mode by default.
+    :rtype: Bot
+    """
+    from aiogram import Bot
+    from aiogram.client.default import DefaultBotProperties
+
+    return Bot(token=Configuration.settings.TELEGRAM_BOT_TOKEN, default=DefaultBotProperties(parse_mode="HTML"))
+
+
+def _create_dispatcher() -> "Dispatcher":
+    """
+    Creates the aiogram dispatcher.
+
+    :returns: The dispatcher.
+    :rtype: Dispatcher
+    """
+    from aiogram import Dispatcher
+
+    return Dispatcher()
 
 
 class Configuration(Singleton):
     """
     Singleton implementation for managing application configuration.
+
+    Settings are validated, and the logger, bot and dispatcher are created, on first access, so importing this module
+    is cheap. The application initialises them explicitly with `init_configuration` on startup.
     """
 
     settings = Dynaconf(
@@ -23,8 +64,18 @@ class Configuration(Singleton):
             Validator("ADMIN_IDS", must_exist=True),
             Validator("ERRORS_CHAT_ID", must_exist=True),
             Validator("UPDATES_PATH", default="/updates"),
+            Validator("UPDATES_BACKGROUND", default=False),
+            Validator("UPDATES_MAX_CONCURRENCY", default=100, gt=0),
+            Validator("UPDATES_REPLY_TIMEOUT", default=0, gte=0),
+            Validator("UPDATES_SHUTDOWN_TIMEOUT", default=10, gte=0),
+            Validator("UPDATES_DEDUP_WINDOW", default=10000, gt=0),
+            Validator("UPDATES_DEDUP_REDIS", default=False),
+            Validator("UPDATES_DEDUP_KEY_PREFIX", default="taigram:update"),
+            Validator("UPDATES_DEDUP_TTL", default=3600, gt=0),
             Validator("WEBHOOK_DOMAIN", must_exist=True),
             Validator("YAML_FILE_PATH", default="strings"),
+            Validator("STRINGS_CACHE_DIR", default=".cache/strings"),
+            Validator("STRINGS_RELOAD_INTERVAL", default=0, gte=0),
             Validator("LOG_DIR", default="logs"),
             Validator("LOG_FILE", default="logs.txt"),
             Validator("LOG_LEVEL", default="INFO"),
@@ -37,17 +88,100 @@ class Configuration(Singleton):
             Validator("TIMESTAMP_FORMAT", default="%H:%M %d.%m.%Y"),
             Validator("TIME_ZONE", default="Europe/Moscow"),
             Validator("TRUNCATED_STRING_LENGTH", default=100),
+            Validator("WEBHOOK_MAX_BODY_SIZE_MB", default=5, gt=0),
+            Validator("WEBHOOK_MAX_FIELD_LENGTH", default=10000, gt=0),
+            Validator("CALLBACK_HISTORY_SIZE", default=50, gt=0),
+            Validator("ATTACHMENTS_ENABLED", default=True),
+            Validator("ATTACHMENT_MAX_SIZE_MB", default=20, gt=0),
+            Validator("ATTACHMENTS_MAX_TOTAL_SIZE_MB", default=50, gt=0),
+            Validator("ATTACHMENT_CHUNK_SIZE", default=65536, gt=0),
+            Validator("ATTACHMENT_TIMEOUT", default=60, gt=0),
             Validator("TELEGRAM_BOT_TOKEN", must_exist=True),
             Validator("DB_URL", must_exist=True),
             Validator("DB_NAME", default="taigram"),
+            Validator("DB_DRIVER", default="motor", is_in=["motor", "pymongo"]),
+            Validator("DB_MIN_POOL_SIZE", default=0),
+            Validator("DB_MAX_POOL_SIZE", default=100),
+            Validator("DB_MAX_IDLE_TIME_MS", default=None),
+            Validator("DB_WAIT_QUEUE_TIMEOUT_MS", default=None),
+            Validator("DB_COMPRESSORS", default=[]),
+            Validator("DB_SESSION_POLICY", default="multi_step", is_in=["always", "multi_step"]),
             Validator("REDIS_URL", default="redis://redis:6379/0"),
             Validator("REDIS_MAX_CONNECTIONS", default=20),
+            Validator("FSM_STORAGE", default="redis", is_in=["memory", "redis"]),
+            Validator("FSM_KEY_PREFIX", default="fsm"),
+            Validator("FSM_STATE_TTL", default=None),
+            Validator("WORKERS", default=1, gte=1),
+            Validator("LEADER_ELECTION", default=False),
+            Validator(
+                "FSM_STORAGE",
+                eq="redis",
+                when=Validator("WORKERS", gt=1),
+                messages={"operations": 'FSM_STORAGE must be "redis" with several workers, got {value}'},
+            ),
+            Validator(
+                "FSM_STORAGE",
+                eq="redis",
+                when=Validator("LEADER_ELECTION", eq=True),
+                messages={"operations": 'FSM_STORAGE must be "redis" with leader election, got {value}'},
+            ),
+            Validator("LEADER_LOCK_KEY", default="taigram:leader"),
+            Validator("LEADER_LOCK_TTL", default=30, gt=0),
+            Validator("NOTIFICATIONS_QUEUE_ENABLED", default=False),
+            Validator("NOTIFICATIONS_STREAM", default="taigram:notifications"),
+            Validator("NOTIFICATIONS_GROUP", default="notifiers"),
+            Validator("NOTIFICATIONS_BATCH_SIZE", default=50, gt=0),
+            Validator("NOTIFICATIONS_LANES", default=8, gt=0),
+            Validator("NOTIFICATIONS_MERGE_BACKLOG", default=True),
+            Validator("NOTIFICATIONS_FLOOD_RETRIES", default=3, gte=0),
+            Validator(
+                "NOTIFICATIONS_PRIORITY_RULES",
+                default=[
+                    {"field": "is_blocked", "priority": "high"},
+                    {"type": "issue", "field": "severity", "values": ["Critical"], "priority": "high"},
+                    {"type": "issue", "field": "priority", "values": ["High"], "priority": "high"},
+                    {"type": "wikipage", "priority": "low"},
+                ],
+            ),
+            Validator("NOTIFICATIONS_PRIORITY_MAX_WAIT", default=30, gt=0),
+            Validator("NOTIFICATIONS_BLOCK_MS", default=5000, gt=0),
+            Validator("NOTIFICATIONS_CLAIM_IDLE_MS", default=60000, gt=0),
+            Validator("NOTIFICATIONS_MAX_ATTEMPTS", default=8, gt=0),
+            Validator("NOTIFICATIONS_BACKOFF_BASE", default=2, gt=0),
+            Validator("NOTIFICATIONS_BACKOFF_MAX", default=600, gt=0),
+            Validator("DEAD_LETTERS_PER_PAGE", default=5, gt=0),
+            Validator("CHAT_BREAKER_THRESHOLD", default=3, gt=0),
+            Validator("CHAT_BREAKER_PROBE_INTERVAL", default=600, gt=0),
+            Validator("EVENT_STATS_KEY_PREFIX", default="taigram:stats"),
+            Validator("EVENT_STATS_FLUSH_INTERVAL", default=10, gt=0),
+            Validator("EVENT_ROLLUPS_HOURLY_DAYS", default=14, gt=0),
+            Validator("EVENT_ROLLUPS_DAILY_DAYS", default=400, gt=0),
+            Validator("WEBHOOK_ARCHIVE_ENABLED", default=False),
+            Validator("WEBHOOK_ARCHIVE_CODEC", default="zstd", is_in=["zstd", "zlib"]),
+            Validator("WEBHOOK_ARCHIVE_LEVEL", default=3, gte=0),
+            Validator("WEBHOOK_ARCHIVE_TTL_DAYS", default=7, gt=0),
+            Validator("WEBHOOK_ARCHIVE_BATCH_SIZE", default=100, gt=0),
+            Validator("WEBHOOK_ARCHIVE_FLUSH_INTERVAL", default=5, gt=0),
+            Validator("WEBHOOK_ARCHIVE_MAX_BUFFER", default=10000, gt=0),
+            Validator("HEALTH_PROBE_TTL", default=5, gte=0),
+            Validator("HEALTH_BOT_PROBE_TTL", default=60, gte=0),
+            Validator("HEALTH_PROBE_TIMEOUT", default=2, gt=0),
+            Validator("HEALTH_LOOP_LAG_INTERVAL", default=0.5, gt=0),
+            Validator("HEALTH_MAX_LOOP_LAG", default=1, gt=0),
         ],
     )
-    logger = LoggerUtils(settings=settings)
-    strings = generate_strings_dict(path=settings.YAML_FILE_PATH)
-    bot = Bot(token=settings.TELEGRAM_BOT_TOKEN, default=DefaultBotProperties(parse_mode="HTML"))
-    dispatcher = Dispatcher()
+    logger = LazyAttribute(_create_logger)
+    strings: dict | None = None
+    bot = LazyAttribute(_create_bot)
+    dispatcher = LazyAttribute(_create_dispatcher)
+
+
+def init_configuration() -> None:
+    """
+    Validates the settings and creates the logger, bot and dispatcher ahead of the first request.
+    """
+    Configuration.settings.validators.validate()
+    _ = Configuration.logger, Configuration.bot, Configuration.dispatcher
 
 
 def get_settings() -> Dynaconf:
@@ -60,13 +194,51 @@ def get_settings() -> Dynaconf:
     return Configuration.settings
 
 
+def build_strings() -> dict:
+    """
+    Builds the string configurations from the YAML files without touching the loaded ones.
+
+    With `STRINGS_CACHE_DIR` set, a compiled catalog is used while the YAML files are unchanged.
+
+    :returns: A dictionary with configuration strings.
+    :rtype: dict
+    """
+    from src.utils.yaml_utils import generate_strings_dict, load_strings_catalog
+
+    settings = Configuration.settings
+
+    if settings.STRINGS_CACHE_DIR:
+        return load_strings_catalog(path=settings.YAML_FILE_PATH, cache_dir=settings.STRINGS_CACHE_DIR)
+
+    return generate_strings_dict(path=settings.YAML_FILE_PATH)
+
+
+def load_strings() -> dict:
+    """
+    Loads the string configurations and stores them in the configuration.
+
+    :returns: A dictionary with configuration strings.
+    :rtype: dict
+    """
+    started = time.perf_counter()
+    Configuration.strings = build_strings()
+
+    get_logger(name=__name__).info("Strings loaded in %.1f ms", (time.perf_counter() - started) * 1000)
+    return Configuration.strings
+
+
 def get_strings() -> dict:
     """
     Returns the dictionary containing string configurations.
 
+    The strings are loaded on the first call unless they have already been loaded at startup.
+
     :returns: A dictionary with configuration strings.
     :rtype: dict
     """
+    if Configuration.strings is None:
+        return load_strings()
+
     return Configuration.strings
 
 
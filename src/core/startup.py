@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger
+from src.entities.named_tuples.startup_tuples import StartupStepTuple
+
+logger = get_logger(name=__name__)
+
+
+class StartupOrchestrator(Singleton):
+    """
+    Runs the application startup as a graph of asynchronous steps in the lifespan event loop.
+
+    Independent steps run concurrently, each step starts as soon as the steps it depends on have finished, and the
+    duration of every step is logged. The application is marked as ready only after the whole graph has succeeded.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the readiness state.
+
+        :ivar self._durations: Duration of each finished step in milliseconds.
+        :type self._durations: dict[str, float]
+        :ivar self._ready: Whether the whole startup graph has finished.
+        :type self._ready: bool
+        """
+        if getattr(self, "_durations", None) is not None:
+            return
+
+        self._durations: dict[str, float] = {}
+        self._ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Indicates whether the startup has finished and the application may accept traffic.
+
+        :return: True if all startup steps have succeeded, False otherwise.
+        :rtype: bool
+        """
+        return self._ready
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """
+        Returns the duration of each finished startup step.
+
+        :return: A mapping of step names to durations in milliseconds.
+        :rtype: dict[str, float]
+        """
+        return dict(self._durations)
+
+    async def run(self, steps: list[StartupStepTuple]) -> None:
+        """
+        Runs the startup steps respecting their dependencies.
+
+        :param steps: The startup steps.
+        :type steps: list[StartupStepTuple]
+        :raises ValueError: If a step depends on an unknown step or the dependencies form a cycle.
+        :raises Exception: The first error raised by a step; the remaining steps are cancelled.
+        """
+        self._validate(steps=steps)
+        self._ready = False
+
+        started = time.perf_counter()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _run_step(step: StartupStepTuple) -> None:
+            for dependency in step.depends_on:
+                await tasks[dependency]
+
+            step_started = time.perf_counter()
+            await step.func()
+            self._durations[step.name] = (time.perf_counter() - step_started) * 1000
+            logger.info("Startup step %s finished in %.1f ms", step.name, self._durations[step.name])
+
+        for step in steps:
+            tasks[step.name] = asyncio.create_task(_run_step(step=step), name=f"startup:{step.name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self._ready = True
+        logger.info("Startup finished in %.1f ms", (time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def _validate(steps: list[StartupStepTuple]) -> None:
+        """
+        Checks that all dependencies exist and do not form a cycle.
+
+        :param steps: The startup steps.
+        :type steps: list[StartupStepTuple]
+        :raises ValueError: If a dependency is unknown or cyclic.
+        """
+        graph = {step.name: step.depends_on for step in steps}
+
+        for name, dependencies in graph.items():
+            if unknown := set(dependencies) - graph.keys():
+                raise ValueError(f"Startup step {name} depends on unknown steps: {', '.join(sorted(unknown))}")
+
+        resolved: set[str] = set()
+        while len(resolved) < len(graph):
+            ready = {
+                name for name, dependencies in graph.items() if name not in resolved and resolved >= set(dependencies)
+            }
+            if not ready:
+                cyclic = ", ".join(sorted(graph.keys() - resolved))
+                raise ValueError(f"Startup steps have cyclic dependencies: {cyclic}")
+            resolved |= ready
@@ -45,3 +45,19 @@ class AdminAddData(CallbackData, prefix="add_admin"):
     """
 
     pass
+
+
+class DeadLettersMenuData(CallbackData, prefix="dead_letters_menu"):
+    """
+    Represents the data for opening the list of undelivered notifications.
+    """
+
+    pass
+
+
+class DeadLettersReplayData(CallbackData, prefix="dead_letters_replay"):
+    """
+    Represents the data for sending the undelivered notifications again.
+    """
+
+    pass
@@ -49,6 +49,19 @@ class ConfirmProjectEditName(ProjectEditName, prefix="confirm_project_edit_name"
     pass
 
 
+class ProjectHistory(ProjectID, prefix="project_history"):
+    """
+    История событий "Проекта" по дням:
+        - количество дней: {"days": int}
+    """
+
+    days: int = 7
+
+
+class ProjectHistoryMonth(ProjectHistory, prefix="project_history_month"):
+    days: int = 30
+
+
 class EditProjectInstance(ProjectID, ProjectMenuData, prefix="edit_instance"):
     pass
 
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class ArchiveCodecEnum(str, Enum):
+    """
+    Enum class to represent the compression codecs of the webhook archive.
+
+    :ivar ZSTD: Zstandard, the default.
+    :type ZSTD: str
+    :ivar ZLIB: zlib from the standard library, for archives written with it.
+    :type ZLIB: str
+    """
+
+    ZSTD = "zstd"
+    ZLIB = "zlib"
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class CircuitStateEnum(str, Enum):
+    """
+    Enum class to represent the states of a per-chat circuit breaker.
+
+    :ivar CLOSED: Notifications are delivered normally.
+    :type CLOSED: str
+    :ivar OPEN: The chat is unavailable and notifications are skipped.
+    :type OPEN: str
+    :ivar HALF_OPEN: The probe interval has passed and the next notification checks whether the chat is back.
+    :type HALF_OPEN: str
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
@@ -11,8 +11,14 @@ class DBCollectionEnum(str, Enum):
     :type PROJECT_TYPE: str
     :ivar USERS: Name of the users collection.
     :type USERS: str
+    :ivar WEBHOOK_ARCHIVE: Name of the collection with archived webhook bodies.
+    :type WEBHOOK_ARCHIVE: str
+    :ivar EVENT_ROLLUPS: Name of the collection with hourly and daily event counters.
+    :type EVENT_ROLLUPS: str
     """
 
     PROJECT = "project"
     PROJECT_TYPE = "project_type"
     USERS = "users"
+    WEBHOOK_ARCHIVE = "webhook_archive"
+    EVENT_ROLLUPS = "event_rollups"
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class FSMStorageEnum(str, Enum):
+    """
+    Enum class to represent the supported FSM storages.
+
+    :ivar MEMORY: In-process storage, valid only for a single worker.
+    :type MEMORY: str
+    :ivar REDIS: Redis storage shared by all workers and replicas.
+    :type REDIS: str
+    """
+
+    MEMORY = "memory"
+    REDIS = "redis"
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class MongoDriverEnum(str, Enum):
+    """
+    Enum class to represent the supported asynchronous MongoDB drivers.
+
+    :ivar MOTOR: Motor client, which offloads PyMongo operations to a thread pool.
+    :type MOTOR: str
+    :ivar PYMONGO: Native asyncio client shipped with PyMongo.
+    :type PYMONGO: str
+    """
+
+    MOTOR = "motor"
+    PYMONGO = "pymongo"
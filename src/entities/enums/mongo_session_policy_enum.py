@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class MongoSessionPolicyEnum(str, Enum):
+    """
+    Enum class to represent when MongoManager starts explicit client sessions.
+
+    :ivar ALWAYS: An explicit session is started for every operation.
+    :type ALWAYS: str
+    :ivar MULTI_STEP: An explicit session is started only for operations made of several commands.
+    :type MULTI_STEP: str
+    """
+
+    ALWAYS = "always"
+    MULTI_STEP = "multi_step"
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class NotificationPriorityEnum(str, Enum):
+    """
+    Enum class to represent the delivery priority classes of notifications.
+
+    :ivar HIGH: Urgent events, e.g. a blocked story or a critical issue, delivered first.
+    :type HIGH: str
+    :ivar NORMAL: Regular events.
+    :type NORMAL: str
+    :ivar LOW: Noisy events, e.g. wiki edits, delivered when nothing more urgent is waiting.
+    :type LOW: str
+    """
+
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class RollupGranularityEnum(str, Enum):
+    """
+    Enum class to represent the sizes of the time buckets of event rollups.
+
+    :ivar HOUR: One document per instance and hour.
+    :type HOUR: str
+    :ivar DAY: One document per instance and day in the configured time zone.
+    :type DAY: str
+    """
+
+    HOUR = "hour"
+    DAY = "day"
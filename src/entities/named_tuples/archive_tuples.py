@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class ReplayStatsTuple(NamedTuple):
+    replayed: int
+    skipped: int
+    failed: int
+    elapsed: float
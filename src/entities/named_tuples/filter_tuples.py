@@ -0,0 +1,7 @@
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class CompiledFiltersTuple(NamedTuple):
+    rules: list[Any]
+    predicates: tuple[Callable[[Any], bool], ...]
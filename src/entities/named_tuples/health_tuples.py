@@ -0,0 +1,8 @@
+from typing import Any, NamedTuple
+
+
+class ProbeTuple(NamedTuple):
+    ok: bool
+    latency_ms: float
+    error: str | None = None
+    details: Any = None
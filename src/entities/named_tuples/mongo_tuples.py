@@ -4,3 +4,15 @@ from typing import NamedTuple
 class AggregateTuple(NamedTuple):
     items: list = []
     count: int = 0
+
+
+class PoolStatsTuple(NamedTuple):
+    connections_open: int = 0
+    connections_in_use: int = 0
+    connections_created: int = 0
+    connections_closed: int = 0
+    checkouts: int = 0
+    checkout_failures: int = 0
+    checkout_wait_avg_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+    pool_clears: int = 0
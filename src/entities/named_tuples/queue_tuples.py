@@ -0,0 +1,41 @@
+from typing import Any, NamedTuple
+
+from src.entities.enums.notification_priority_enum import NotificationPriorityEnum
+
+
+class NotificationEntryTuple(NamedTuple):
+    entry_id: str
+    instance_id: str
+    chat_id: int
+    payload: str
+    attempts: int = 0
+    priority: NotificationPriorityEnum = NotificationPriorityEnum.NORMAL
+
+
+class DeadLetterTuple(NamedTuple):
+    entry_id: str
+    instance_id: str
+    chat_id: int
+    attempts: int
+    error: str
+    failed_at: str
+
+
+class LaneStatsTuple(NamedTuple):
+    lane: int
+    depth: int
+    processed: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+class ChatCircuitTuple(NamedTuple):
+    failures: int
+    opened_at: float | None = None
+
+
+class LaneItemTuple(NamedTuple):
+    submitted: float
+    chat_id: int
+    level: int
+    item: Any
@@ -0,0 +1,8 @@
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+
+class StartupStepTuple(NamedTuple):
+    name: str
+    func: Callable[[], Awaitable[None]]
+    depends_on: tuple[str, ...] = ()
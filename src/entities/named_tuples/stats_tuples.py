@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class InstanceStatsTuple(NamedTuple):
+    events: dict[str, int]
+    skipped: int
+    failed: int
+    last_seen: float | None
@@ -4,3 +4,8 @@ from typing import NamedTuple
 class AdminStrTuple(NamedTuple):
     admin_str: str | None = None
     bot_link: str | None = None
+
+
+class PackedTextTuple(NamedTuple):
+    text: str
+    count: int
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.entities.enums.archive_codec_enum import ArchiveCodecEnum
+
+
+class ArchivedWebhookModel(BaseModel):
+    """
+    Represents a raw webhook body kept in the archive.
+
+    :ivar instance_id: Unique identifier of the instance that received the webhook.
+    :type instance_id: str
+    :ivar received_at: Time when the webhook was received, in UTC.
+    :type received_at: datetime
+    :ivar codec: Compression codec of the body.
+    :type codec: ArchiveCodecEnum
+    :ivar body: The compressed body.
+    :type body: bytes
+    """
+
+    instance_id: str
+    received_at: datetime
+    codec: ArchiveCodecEnum
+    body: bytes
@@ -3,12 +3,74 @@ from typing import Annotated, Self
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, model_validator
 
 from src.core.settings import get_settings
-from src.entities.enums.event_enums import EventTypeEnum
+from src.entities.enums.event_enums import (
+    EventActionEnum,
+    EventChangeEnum,
+    EventTypeEnum,
+)
 from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.enums.notification_priority_enum import NotificationPriorityEnum
 from src.entities.schemas.base_data.base_schemas import IDSchema
 from src.entities.schemas.validators.project_validators import validate_object_id
 
 
+class PriorityRuleModel(BaseModel):
+    """
+    Represents a rule assigning a delivery priority to the matching events.
+
+    :ivar priority: Priority of the matching events
+    :type priority: NotificationPriorityEnum
+    :ivar type: Event type to match, any type if not set
+    :type type: EventTypeEnum | None
+    :ivar action: Event action to match, any action if not set
+    :type action: EventActionEnum | None
+    :ivar field: Field the event must change, e.g. "is_blocked"; with `values`, the field of the object to compare
+    :type field: str | None
+    :ivar values: Accepted values or value names of the object field, e.g. ["Critical", "Important"] for "severity"
+    :type values: list[str]
+    """
+
+    priority: NotificationPriorityEnum
+    type: EventTypeEnum | None = None
+    action: EventActionEnum | None = None
+    field: str | None = None
+    values: list[str] = []
+
+
+class FilterRuleModel(BaseModel):
+    """
+    Represents a rule deciding whether the matching events are delivered.
+
+    A rule matches an event when all of its conditions are met; a rule without conditions matches every event.
+
+    :ivar drop: Whether the matching events are dropped or delivered
+    :type drop: bool
+    :ivar type: Event type to match, any type if not set
+    :type type: EventTypeEnum | None
+    :ivar action: Event action to match, any action if not set
+    :type action: EventActionEnum | None
+    :ivar changes: Fields of which the event must change at least one, e.g. ["status"]
+    :type changes: list[EventChangeEnum]
+    :ivar changes_only: Whether the event must change nothing but `changes`, e.g. a tag-only change
+    :type changes_only: bool
+    :ivar tags: Tags of which the object must have at least one
+    :type tags: list[str]
+    :ivar assignees: Usernames of which one must be assigned to the object
+    :type assignees: list[str]
+    :ivar authors: Usernames of which one must have made the change
+    :type authors: list[str]
+    """
+
+    drop: bool = True
+    type: EventTypeEnum | None = None
+    action: EventActionEnum | None = None
+    changes: list[EventChangeEnum] = []
+    changes_only: bool = False
+    tags: list[str] = []
+    assignees: list[str] = []
+    authors: list[str] = []
+
+
 class InstanceCreateModel(BaseModel):
     """
     Represents the schema for instance
@@ -23,6 +85,14 @@ class InstanceCreateModel(BaseModel):
     :type webhook_url: str | None
     :ivar language: Option for language of telegram notifications
     :type language: LanguageEnum
+    :ivar disabled: Whether notifications are suspended because the chat is unavailable
+    :type disabled: bool
+    :ivar priority_rules: Rules for the delivery priority of events, the first matching rule wins;
+        `NOTIFICATIONS_PRIORITY_RULES` are used if empty
+    :type priority_rules: list[PriorityRuleModel]
+    :ivar filter_rules: Rules for dropping events before they are rendered, the first matching rule wins;
+        events matching no rule are delivered
+    :type filter_rules: list[FilterRuleModel]
     """
 
     instance_id: Annotated[str, BeforeValidator(validate_object_id), Field(alias="instance_id")]
@@ -34,6 +104,9 @@ class InstanceCreateModel(BaseModel):
     thread_id: int | None = None
     webhook_url: str | None = None
     language: LanguageEnum
+    disabled: bool = False
+    priority_rules: list[PriorityRuleModel] = []
+    filter_rules: list[FilterRuleModel] = []
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -48,6 +121,20 @@ class InstanceModel(InstanceCreateModel):
     pass
 
 
+class InstanceSummaryModel(BaseModel):
+    """
+    Represents the lightweight projection of an instance used for list keyboards.
+
+    :ivar instance_id: Unique identifier of the instance.
+    :type instance_id: str
+    :ivar instance_name: Name of the instance.
+    :type instance_name: str
+    """
+
+    instance_id: Annotated[str, BeforeValidator(validate_object_id)]
+    instance_name: str
+
+
 class ProjectCreateSchema(BaseModel):
     """
     Represents the schema for creating a project.
@@ -76,3 +163,16 @@ class ProjectSchema(IDSchema, ProjectCreateSchema):
     """
 
     pass
+
+
+class ProjectSummarySchema(IDSchema):
+    """
+    Represents the lightweight projection of a project used for list keyboards.
+
+    :ivar id: The unique identifier of the project.
+    :type id: str (inherited from IDSchema)
+    :ivar name: Name of the project.
+    :type name: str
+    """
+
+    name: str
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.entities.enums.rollup_granularity_enum import RollupGranularityEnum
+
+
+class EventRollupModel(BaseModel):
+    """
+    Represents the event counters of an instance over one time bucket.
+
+    :ivar instance_id: Unique identifier of the instance.
+    :type instance_id: str
+    :ivar granularity: Size of the bucket.
+    :type granularity: RollupGranularityEnum
+    :ivar bucket: Start of the bucket, in UTC.
+    :type bucket: datetime
+    :ivar counts: Counters by field, e.g. "event:task:change" or "failed".
+    :type counts: dict[str, int]
+    :ivar total: Number of received events.
+    :type total: int
+    """
+
+    instance_id: str
+    granularity: RollupGranularityEnum
+    bucket: datetime
+    counts: dict[str, int] = {}
+    total: int = 0
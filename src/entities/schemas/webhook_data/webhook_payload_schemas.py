@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import TypedDict
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, field_validator
@@ -18,6 +19,20 @@ from src.entities.schemas.webhook_data.nested_schemas import (
 )
 
 
+class WebhookEventHeader(TypedDict):
+    """
+    Represents the fields of a webhook that identify the event, read without validating the rest of the payload.
+
+    :ivar type: Type of the changed object.
+    :type type: str
+    :ivar action: Performed action.
+    :type action: str
+    """
+
+    type: str
+    action: str
+
+
 class WebhookPayload(BaseModel):
     action: str
     type: EventTypeEnum
@@ -0,0 +1,33 @@
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage
+from aiogram.fsm.storage.memory import DisabledEventIsolation, MemoryStorage
+from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
+
+from src.core.settings import get_settings
+from src.entities.enums.fsm_storage_enum import FSMStorageEnum
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+
+
+def get_fsm_storage() -> tuple[BaseStorage, BaseEventIsolation]:
+    """
+    Creates the FSM storage and the events isolation selected by the `FSM_STORAGE` setting.
+
+    The Redis storage shares the connection pool of `RedisSessionDependency`, so FSM state and data survive restarts
+    and are visible to every worker. Its events isolation serialises updates of the same chat across workers.
+
+    :returns: A tuple of the FSM storage and the matching events isolation.
+    :rtype: tuple[BaseStorage, BaseEventIsolation]
+    :raises ValueError: If the configured storage is not supported.
+    """
+    match FSMStorageEnum(get_settings().FSM_STORAGE):
+        case FSMStorageEnum.REDIS:
+            storage = RedisStorage(
+                redis=RedisSessionDependency().get_client(),
+                key_builder=DefaultKeyBuilder(prefix=get_settings().FSM_KEY_PREFIX, with_destiny=True),
+                state_ttl=get_settings().FSM_STATE_TTL,
+                data_ttl=get_settings().FSM_STATE_TTL,
+            )
+            return storage, storage.create_isolation()
+        case FSMStorageEnum.MEMORY:
+            return MemoryStorage(), DisabledEventIsolation()
+        case _:
+            raise ValueError(f"Unknown FSM storage: {get_settings().FSM_STORAGE}")
@@ -0,0 +1,168 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError, RedisError
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+
+logger = get_logger(name=__name__)
+
+
+def is_multi_worker() -> bool:
+    """
+    Checks whether the application runs in multi-worker mode.
+
+    Multi-worker mode is enabled by running several uvicorn workers or explicitly via `LEADER_ELECTION`
+    when several replicas with a single worker each are deployed.
+
+    :return: True if leader election is required, False otherwise.
+    :rtype: bool
+    """
+    settings = get_settings()
+    return settings.WORKERS > 1 or bool(settings.LEADER_ELECTION)
+
+
+class LeaderElection(Singleton):
+    """
+    Elects a single leader among workers and replicas with a Redis lock.
+
+    Only the leader performs process-wide side effects: webhook registration, startup and shutdown notifications and
+    scheduled jobs. Followers keep trying to take the lock, so one of them takes over when the leader dies and the
+    lock expires. In single-worker mode the process is always the leader and no lock is used.
+
+    The startup callback runs only when the lock is taken during the startup of the process; a leadership taken over
+    later, after a failover or a lost renewal, runs the takeover callback instead, so the one-time startup effects are
+    not repeated.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the leader lock.
+
+        :ivar self._ttl: Lifetime of the lock in seconds; the leader renews it three times per period.
+        :type self._ttl: int
+        :ivar self._lock: Redis lock held by the leader.
+        :type self._lock: Lock | None
+        :ivar self._is_leader: Whether the current process holds the lock.
+        :type self._is_leader: bool
+        """
+        if getattr(self, "_initialized", False):
+            return
+
+        self._initialized = True
+        self._ttl = get_settings().LEADER_LOCK_TTL
+        self._lock: Lock | None = None
+        self._is_leader = False
+        self._on_takeover: Callable[[], Awaitable[None]] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        """
+        Indicates whether the current process is the leader.
+
+        :return: True if the process holds leadership, False otherwise.
+        :rtype: bool
+        """
+        return self._is_leader
+
+    async def start(
+        self, on_elected: Callable[[], Awaitable[None]], on_takeover: Callable[[], Awaitable[None]] | None = None
+    ) -> None:
+        """
+        Starts the election and runs a callback whenever the process becomes the leader.
+
+        :param on_elected: Coroutine function executed if the process becomes the leader on startup.
+        :type on_elected: Callable[[], Awaitable[None]]
+        :param on_takeover: Coroutine function executed whenever the process takes the leadership over later;
+            nothing is executed if not set.
+        :type on_takeover: Callable[[], Awaitable[None]] | None
+        """
+        self._on_takeover = on_takeover
+
+        if not is_multi_worker():
+            self._is_leader = True
+            await on_elected()
+            return
+
+        client = RedisSessionDependency().get_client()
+        self._lock = client.lock(
+            name=get_settings().LEADER_LOCK_KEY,
+            timeout=self._ttl,
+            blocking=False,
+            thread_local=False,
+        )
+        await self._try_acquire(callback=on_elected)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the election loop and releases the lock if it is held.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._lock is not None and self._is_leader:
+            try:
+                await self._lock.release()
+            except (LockError, RedisError):
+                logger.warning("Leader lock has already been released")
+
+        self._is_leader = False
+
+    async def _run(self) -> None:
+        """
+        Renews the lock while leading and retries to acquire it while following.
+        """
+        while True:
+            await asyncio.sleep(self._ttl / 3)
+
+            if self._is_leader:
+                await self._renew()
+            else:
+                await self._try_acquire(callback=self._on_takeover)
+
+    async def _try_acquire(self, callback: Callable[[], Awaitable[None]] | None) -> None:
+        """
+        Attempts to acquire the lock without blocking and runs the callback on success.
+
+        :param callback: Coroutine function executed if the lock is acquired.
+        :type callback: Callable[[], Awaitable[None]] | None
+        """
+        try:
+            acquired = await self._lock.acquire()
+        except RedisError:
+            logger.exception("Failed to acquire the leader lock")
+            return
+
+        if not acquired:
+            return
+
+        self._is_leader = True
+        logger.info("Current process has been elected as the leader")
+
+        if callback is None:
+            return
+
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Leader startup failed")
+
+    async def _renew(self) -> None:
+        """
+        Extends the lock lifetime and steps down if the lock has been lost.
+        """
+        try:
+            await self._lock.reacquire()
+        except (LockError, RedisError):
+            self._is_leader = False
+            logger.warning("Leader lock has been lost, stepping down")
@@ -23,6 +23,10 @@ class RedisSessionDependency(Singleton):
         :ivar self._pool: The connection pool used to manage connections to the Redis server.
         :type self._pool: ConnectionPool
         """
+        # the singleton keeps its connection pool between instantiations
+        if getattr(self, "_pool", None) is not None:
+            return
+
         self._url = get_settings().REDIS_URL
         self._pool: ConnectionPool = self._init_pool()
 
@@ -56,3 +60,22 @@ class RedisSessionDependency(Singleton):
             yield redis_client
         finally:
             await redis_client.aclose()
+
+    async def ping(self) -> None:
+        """
+        Checks that the server responds to a ping.
+        """
+        async with self.session() as session:
+            await session.ping()
+
+    def get_client(self) -> Redis:
+        """
+        Returns a long-lived Redis client bound to the shared connection pool.
+
+        Unlike `session`, the client is not closed automatically and is meant for components that live as long as
+        the application, such as the FSM storage or the leader lock.
+
+        :return: A Redis client using the shared connection pool.
+        :rtype: Redis
+        """
+        return Redis(connection_pool=self._pool)
@@ -38,3 +38,71 @@ class RedisManager:
         """
         async with self._redis_dep.session() as session:
             await session.delete(key)
+
+    async def set_if_absent(self, key: str, value: str, ttl: int) -> bool:
+        """
+        Sets data in the Redis database only if the key does not exist yet.
+
+        :param key: The key under which the value will be stored.
+        :type key: str
+        :param value: The value to be set for the given key.
+        :type value: str
+        :param ttl: Lifetime of the key in seconds.
+        :type ttl: int
+        :return: True if the key has been set, False if it already existed.
+        :rtype: bool
+        """
+        async with self._redis_dep.session() as session:
+            return bool(await session.set(key, value, nx=True, ex=ttl))
+
+    async def increment_hashes(self, counters: dict[str, dict[str, int]]) -> None:
+        """
+        Increments fields of several hashes in one round trip.
+
+        :param counters: Increments of the fields by the key of the hash.
+        :type counters: dict[str, dict[str, int]]
+        """
+        async with self._redis_dep.session() as session:
+            async with session.pipeline(transaction=False) as pipe:
+                for key, fields in counters.items():
+                    for field, amount in fields.items():
+                        pipe.hincrby(key, field, amount)
+                await pipe.execute()
+
+    async def set_max_scores(self, key: str, scores: dict[str, float]) -> None:
+        """
+        Sets scores of sorted set members, keeping the existing score where it is higher.
+
+        :param key: The key of the sorted set.
+        :type key: str
+        :param scores: Scores by member.
+        :type scores: dict[str, float]
+        """
+        async with self._redis_dep.session() as session:
+            await session.zadd(key, scores, gt=True)
+
+    async def get_hash(self, key: str) -> dict[str, str]:
+        """
+        Returns all fields of a hash.
+
+        :param key: The key of the hash.
+        :type key: str
+        :return: The fields and their values, empty if the hash does not exist.
+        :rtype: dict[str, str]
+        """
+        async with self._redis_dep.session() as session:
+            return await session.hgetall(key)
+
+    async def get_score(self, key: str, member: str) -> float | None:
+        """
+        Returns the score of a sorted set member.
+
+        :param key: The key of the sorted set.
+        :type key: str
+        :param member: The member.
+        :type member: str
+        :return: The score, or None if the member does not exist.
+        :rtype: float | None
+        """
+        async with self._redis_dep.session() as session:
+            return await session.zscore(key, member)
@@ -0,0 +1,265 @@
+from redis.exceptions import ResponseError
+
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+
+# moves due retries from the sorted set back to the stream atomically, so that a retry is neither lost nor duplicated
+# when several consumers promote retries at the same time
+PROMOTE_RETRIES_SCRIPT = """
+local entries = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, entry in ipairs(entries) do
+    redis.call('ZREM', KEYS[1], entry)
+    local fields = cjson.decode(entry)
+    local args = {}
+    for key, value in pairs(fields) do
+        table.insert(args, key)
+        table.insert(args, value)
+    end
+    redis.call('XADD', KEYS[2], '*', unpack(args))
+end
+return #entries
+"""
+
+
+class RedisStreamManager:
+    """
+    Manages Redis Streams and the sorted sets used to schedule delayed entries.
+    """
+
+    def __init__(self, redis_dep: RedisSessionDependency) -> None:
+        """
+        Initializes the instance of the class with a Redis session dependency.
+
+        :param redis_dep: Dependency for Redis session management.
+        :type redis_dep: RedisSessionDependency
+        """
+        self._redis_dep = redis_dep
+
+    async def ensure_group(self, stream: str, group: str) -> None:
+        """
+        Creates the consumer group and the stream if they do not exist yet.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        """
+        async with self._redis_dep.session() as session:
+            try:
+                await session.xgroup_create(name=stream, groupname=group, id="0", mkstream=True)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def add(self, stream: str, fields: dict[str, str | int]) -> str:
+        """
+        Appends an entry to the stream.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param fields: Fields of the entry.
+        :type fields: dict[str, str | int]
+        :return: The identifier of the new entry.
+        :rtype: str
+        """
+        async with self._redis_dep.session() as session:
+            return await session.xadd(name=stream, fields=fields)
+
+    async def read_group(
+        self, stream: str, group: str, consumer: str, count: int, block_ms: int
+    ) -> list[tuple[str, dict[str, str]]]:
+        """
+        Reads new entries for the consumer, waiting up to `block_ms` for them to arrive.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        :param consumer: Name of the consumer.
+        :type consumer: str
+        :param count: Maximum number of entries to read.
+        :type count: int
+        :param block_ms: Time to wait for new entries in milliseconds.
+        :type block_ms: int
+        :return: The entries as pairs of identifier and fields.
+        :rtype: list[tuple[str, dict[str, str]]]
+        """
+        async with self._redis_dep.session() as session:
+            response = await session.xreadgroup(
+                groupname=group, consumername=consumer, streams={stream: ">"}, count=count, block=block_ms
+            )
+
+        return response[0][1] if response else []
+
+    async def claim_idle(
+        self, stream: str, group: str, consumer: str, min_idle_ms: int, count: int
+    ) -> list[tuple[str, dict[str, str]]]:
+        """
+        Takes over entries that other consumers have read but not acknowledged for `min_idle_ms`.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        :param consumer: Name of the consumer taking the entries over.
+        :type consumer: str
+        :param min_idle_ms: Minimum idle time of an entry in milliseconds.
+        :type min_idle_ms: int
+        :param count: Maximum number of entries to claim.
+        :type count: int
+        :return: The claimed entries as pairs of identifier and fields.
+        :rtype: list[tuple[str, dict[str, str]]]
+        """
+        async with self._redis_dep.session() as session:
+            response = await session.xautoclaim(
+                name=stream, groupname=group, consumername=consumer, min_idle_time=min_idle_ms, count=count
+            )
+
+        # entries deleted from the stream while pending are returned without fields
+        return [(entry_id, fields) for entry_id, fields in response[1] if fields]
+
+    async def ack(self, stream: str, group: str, entry_ids: list[str]) -> None:
+        """
+        Acknowledges entries and removes them from the stream.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        :param entry_ids: Identifiers of the entries.
+        :type entry_ids: list[str]
+        """
+        async with self._redis_dep.session() as session:
+            async with session.pipeline(transaction=True) as pipe:
+                pipe.xack(stream, group, *entry_ids)
+                pipe.xdel(stream, *entry_ids)
+                await pipe.execute()
+
+    async def ack_and_add(self, stream: str, group: str, entry_id: str, target: str, fields: dict) -> None:
+        """
+        Acknowledges an entry and appends a new entry to another stream in one transaction.
+
+        :param stream: Name of the stream of the acknowledged entry.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        :param entry_id: Identifier of the acknowledged entry.
+        :type entry_id: str
+        :param target: Name of the stream receiving the new entry.
+        :type target: str
+        :param fields: Fields of the new entry.
+        :type fields: dict
+        """
+        async with self._redis_dep.session() as session:
+            async with session.pipeline(transaction=True) as pipe:
+                pipe.xack(stream, group, entry_id)
+                pipe.xdel(stream, entry_id)
+                pipe.xadd(name=target, fields=fields)
+                await pipe.execute()
+
+    async def ack_and_schedule(
+        self, stream: str, group: str, entry_id: str, schedule: str, member: str, due: float
+    ) -> None:
+        """
+        Acknowledges an entry and schedules its copy in a sorted set in one transaction.
+
+        :param stream: Name of the stream of the acknowledged entry.
+        :type stream: str
+        :param group: Name of the consumer group.
+        :type group: str
+        :param entry_id: Identifier of the acknowledged entry.
+        :type entry_id: str
+        :param schedule: Name of the sorted set.
+        :type schedule: str
+        :param member: Serialised fields of the scheduled entry.
+        :type member: str
+        :param due: Unix time when the entry is due.
+        :type due: float
+        """
+        async with self._redis_dep.session() as session:
+            async with session.pipeline(transaction=True) as pipe:
+                pipe.xack(stream, group, entry_id)
+                pipe.xdel(stream, entry_id)
+                pipe.zadd(schedule, {member: due})
+                await pipe.execute()
+
+    async def promote_due(self, schedule: str, stream: str, now: float, count: int) -> int:
+        """
+        Moves entries that are due from the sorted set to the stream.
+
+        :param schedule: Name of the sorted set.
+        :type schedule: str
+        :param stream: Name of the stream.
+        :type stream: str
+        :param now: Current Unix time.
+        :type now: float
+        :param count: Maximum number of entries to move.
+        :type count: int
+        :return: The number of moved entries.
+        :rtype: int
+        """
+        async with self._redis_dep.session() as session:
+            return await session.eval(PROMOTE_RETRIES_SCRIPT, 2, schedule, stream, now, count)
+
+    async def length(self, stream: str) -> int:
+        """
+        Returns the number of entries in the stream.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :return: The number of entries.
+        :rtype: int
+        """
+        async with self._redis_dep.session() as session:
+            return await session.xlen(stream)
+
+    async def count_scheduled(self, schedule: str) -> int:
+        """
+        Returns the number of entries in the sorted set.
+
+        :param schedule: Name of the sorted set.
+        :type schedule: str
+        :return: The number of entries.
+        :rtype: int
+        """
+        async with self._redis_dep.session() as session:
+            return await session.zcard(schedule)
+
+    async def latest(self, stream: str, count: int) -> list[tuple[str, dict[str, str]]]:
+        """
+        Returns the most recent entries of the stream, newest first.
+
+        :param stream: Name of the stream.
+        :type stream: str
+        :param count: Maximum number of entries.
+        :type count: int
+        :return: The entries as pairs of identifier and fields.
+        :rtype: list[tuple[str, dict[str, str]]]
+        """
+        async with self._redis_dep.session() as session:
+            return await session.xrevrange(stream, count=count)
+
+    async def move(self, source: str, target: str, count: int, fields_update: dict) -> int:
+        """
+        Moves the oldest entries from one stream to another.
+
+        :param source: Name of the source stream.
+        :type source: str
+        :param target: Name of the target stream.
+        :type target: str
+        :param count: Maximum number of entries to move.
+        :type count: int
+        :param fields_update: Fields overridden in the moved entries.
+        :type fields_update: dict
+        :return: The number of moved entries.
+        :rtype: int
+        """
+        async with self._redis_dep.session() as session:
+            entries = await session.xrange(source, count=count)
+
+            for entry_id, fields in entries:
+                async with session.pipeline(transaction=True) as pipe:
+                    pipe.xadd(name=target, fields={**fields, **fields_update})
+                    pipe.xdel(source, entry_id)
+                    await pipe.execute()
+
+        return len(entries)
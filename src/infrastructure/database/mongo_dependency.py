@@ -6,9 +6,17 @@ from motor.motor_asyncio import (
     AsyncIOMotorClientSession,
     AsyncIOMotorCollection,
 )
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
 
 from src.core.Base.singleton import Singleton
-from src.core.settings import get_settings
+from src.core.settings import get_logger, get_settings
+from src.entities.enums.mongo_driver_enum import MongoDriverEnum
+from src.entities.named_tuples.mongo_tuples import PoolStatsTuple
+from src.infrastructure.database.mongo_pool_monitor import MongoPoolStatsListener
+
+logger = get_logger(name=__name__)
 
 
 class MongoDBDependency(Singleton):
@@ -23,39 +31,112 @@ class MongoDBDependency(Singleton):
         """
         Initialize the database connection for the application.
 
-        This method sets up an asynchronous MongoDB client using `AsyncIOMotorClient` and connects to a specified database.
+        This method sets up an asynchronous MongoDB client for the driver selected by `DB_DRIVER` and connects to a specified database.
         It retrieves the database URL and name from the application's configuration settings and establishes the connection to be used throughout the application.
         """
-        self._client = AsyncIOMotorClient(get_settings().DB_URL)
+        # the singleton keeps its client and connection pool between instantiations
+        if getattr(self, "_client", None) is not None:
+            return
+
+        self._driver = MongoDriverEnum(get_settings().DB_DRIVER)
+        self._pool_listener = MongoPoolStatsListener()
+        self._client = self._init_client()
         self._db = self._client[get_settings().DB_NAME]
 
+    def _get_client_options(self) -> dict:
+        """
+        Builds the connection pool and wire compression options for the client from the settings.
+
+        :returns: Keyword arguments passed to the client constructor.
+        :rtype: dict
+        """
+        settings = get_settings()
+        options = {
+            "minPoolSize": settings.DB_MIN_POOL_SIZE,
+            "maxPoolSize": settings.DB_MAX_POOL_SIZE,
+            "event_listeners": [self._pool_listener],
+        }
+
+        if settings.DB_MAX_IDLE_TIME_MS:
+            options["maxIdleTimeMS"] = settings.DB_MAX_IDLE_TIME_MS
+        if settings.DB_WAIT_QUEUE_TIMEOUT_MS:
+            options["waitQueueTimeoutMS"] = settings.DB_WAIT_QUEUE_TIMEOUT_MS
+        if settings.DB_COMPRESSORS:
+            options["compressors"] = ",".join(settings.DB_COMPRESSORS)
+
+        return options
+
+    def _init_client(self) -> AsyncIOMotorClient | AsyncMongoClient:
+        """
+        Creates the MongoDB client for the configured driver.
+
+        :returns: A Motor client or a native asyncio PyMongo client.
+        :rtype: AsyncIOMotorClient | AsyncMongoClient
+        :raises ValueError: If the configured driver is not supported.
+        """
+        match self._driver:
+            case MongoDriverEnum.MOTOR:
+                return AsyncIOMotorClient(get_settings().DB_URL, **self._get_client_options())
+            case MongoDriverEnum.PYMONGO:
+                return AsyncMongoClient(get_settings().DB_URL, **self._get_client_options())
+            case _:
+                raise ValueError(f"Unknown MongoDB driver: {self._driver}")
+
+    def get_pool_stats(self) -> PoolStatsTuple:
+        """
+        Returns the connection pool and checkout statistics of the client.
+
+        :returns: Current pool statistics.
+        :rtype: PoolStatsTuple
+        """
+        return self._pool_listener.get_stats()
+
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncIOMotorClientSession, None]:
+    async def session(self) -> AsyncGenerator[AsyncIOMotorClientSession | AsyncClientSession, None]:
         """
         Manages the lifecycle of an asynchronous MongoDB session.
 
-        :returns: AsyncGenerator yielding a MotorClientSession instance.
-        :rtype: AsyncGenerator[AsyncIOMotorClientSession, None]
+        :returns: AsyncGenerator yielding a client session of the configured driver.
+        :rtype: AsyncGenerator[AsyncIOMotorClientSession | AsyncClientSession, None]
         """
-        session = await self._client.start_session()
+        match self._driver:
+            case MongoDriverEnum.PYMONGO:
+                session = self._client.start_session()
+            case _:
+                session = await self._client.start_session()
 
         yield session
 
         await session.end_session()
 
-    async def get_collection(self, collection_name: str) -> AsyncIOMotorCollection:
+    async def get_collection(self, collection_name: str) -> AsyncIOMotorCollection | AsyncCollection:
         """
         Retrieves an asynchronous MongoDB collection by its name.
 
         :param collection_name: The name of the collection to retrieve.
         :type collection_name: str
-        :returns: The specified asyncIOMotorCollection object.
-        :rtype: AsyncIOMotorCollection
+        :returns: The specified collection object of the configured driver.
+        :rtype: AsyncIOMotorCollection | AsyncCollection
         """
         return self._db[collection_name]
 
-    def close(self) -> None:
-        self._client.close()
+    async def ping(self) -> None:
+        """
+        Checks that the server responds to a ping.
+        """
+        await self._db.command("ping")
+
+    async def close(self) -> None:
+        """
+        Closes the MongoDB client of the configured driver and logs the final pool statistics.
+        """
+        logger.info(f"MongoDB pool stats: {self.get_pool_stats()._asdict()}")
+
+        match self._driver:
+            case MongoDriverEnum.PYMONGO:
+                await self._client.close()
+            case _:
+                self._client.close()
 
 
 async def get_mongo_db() -> MongoDBDependency:
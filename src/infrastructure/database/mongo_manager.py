@@ -1,14 +1,21 @@
+import inspect
 from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorCollection
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
 from pymongo.results import InsertManyResult, InsertOneResult
 
+from src.core.settings import get_settings
 from src.entities.enums.collection_enum import DBCollectionEnum
+from src.entities.enums.mongo_session_policy_enum import MongoSessionPolicyEnum
 from src.entities.named_tuples.mongo_tuples import AggregateTuple
 from src.infrastructure.database.mongo_dependency import MongoDBDependency
 
+INDEX_OPTIONS_CONFLICT = 85
+
 
 class MongoManager:
     """
@@ -23,22 +30,32 @@ class MongoManager:
         :type mongo_dep: MongoDBDependency
         """
         self._mongo_dep = mongo_dep
+        self._session_policy = MongoSessionPolicyEnum(get_settings().DB_SESSION_POLICY)
 
     @asynccontextmanager
-    async def _get_session(self, session: AsyncIOMotorClientSession | None = None) -> AsyncGenerator:
+    async def _get_session(
+        self, session: AsyncIOMotorClientSession | None = None, explicit: bool = False
+    ) -> AsyncGenerator:
         """
         Asynchronous context manager for managing MongoDB sessions.
 
-        :param session: Existing MongoDB session to use. If None, a new session will be created.
+        With the `multi_step` session policy a new explicit session is only started for operations marked as
+        `explicit`; single commands yield None and run in the driver's implicit session.
+
+        :param session: Existing MongoDB session to use. If None, a new session may be created.
         :type session: AsyncIOMotorClientSession | None
-        :returns: An asynchronous generator that yields the session.
+        :param explicit: Whether the operation is made of several commands that must share a session.
+        :type explicit: bool
+        :returns: An asynchronous generator that yields the session or None.
         :rtype: AsyncGenerator
         """
         if session:
             yield session
-        else:
+        elif explicit or self._session_policy == MongoSessionPolicyEnum.ALWAYS:
             async with self._mongo_dep.session() as new_session:
                 yield new_session
+        else:
+            yield None
 
     async def _get_collection(self, collection: DBCollectionEnum | AsyncIOMotorCollection):
         """
@@ -62,6 +79,40 @@ class MongoManager:
                 session=session,
             )
 
+    async def create_archive_indexes(self, expire_after: int) -> None:
+        """
+        Creates the indexes of the webhook archive, updating the expiration time if it has changed.
+
+        :param expire_after: Time in seconds after which archived webhooks are removed.
+        :type expire_after: int
+        """
+        async with self._get_session() as session:
+            collection = await self._get_collection(collection=DBCollectionEnum.WEBHOOK_ARCHIVE)
+            await collection.create_index([("instance_id", 1), ("received_at", 1)], session=session)
+
+            try:
+                await collection.create_index("received_at", expireAfterSeconds=expire_after, session=session)
+            except OperationFailure as e:
+                if e.code != INDEX_OPTIONS_CONFLICT:
+                    raise
+                await collection.database.command(
+                    "collMod",
+                    collection.name,
+                    index={"keyPattern": {"received_at": 1}, "expireAfterSeconds": expire_after},
+                    session=session,
+                )
+
+    async def create_rollup_indexes(self) -> None:
+        """
+        Creates the indexes of the event rollups: one document per instance and bucket, removed when it expires.
+        """
+        async with self._get_session() as session:
+            collection = await self._get_collection(collection=DBCollectionEnum.EVENT_ROLLUPS)
+            await collection.create_index(
+                [("instance_id", 1), ("granularity", 1), ("bucket", 1)], unique=True, session=session
+            )
+            await collection.create_index("expires_at", expireAfterSeconds=0, session=session)
+
     async def create_user(self, collection: DBCollectionEnum, insert_data, return_schema):
         """
         Creates a new user in the specified database collection.
@@ -75,7 +126,7 @@ class MongoManager:
         :returns: The newly created user document from the database.
         :rtype: Any
         """
-        async with self._get_session() as session:
+        async with self._get_session(explicit=True) as session:
             collection = await self._get_collection(collection=collection)
 
             if existing_user := await self.find_one(
@@ -103,6 +154,7 @@ class MongoManager:
         value: str | bool | int | ObjectId,
         field: str = "_id",
         session: AsyncIOMotorClientSession | None = None,
+        projection: dict | None = None,
     ):
         """
         Finds a single document in the specified collection based on the given value and field.
@@ -118,13 +170,15 @@ class MongoManager:
         :type field: str
         :param session: Optional MongoDB client session to use during the operation.
         :type session: AsyncIOMotorClientSession | None
+        :param projection: Optional projection limiting the fields returned by the server.
+        :type projection: dict | None
         :returns: The document as a Pydantic model instance, or None if no document is found.
         :rtype: schema.model_validate return type or None
         """
         async with self._get_session(session=session) as session:
             collection = await self._get_collection(collection=collection)
 
-            document = await collection.find_one({field: value}, session=session)
+            document = await collection.find_one({field: value}, projection, session=session)
 
             if not document:
                 return None
@@ -161,6 +215,7 @@ class MongoManager:
         schema,
         session: AsyncIOMotorClientSession | None = None,
         filter_query: dict | None = None,
+        projection: dict | None = None,
     ) -> list:
         """
         Asynchronously finds documents in a MongoDB collection using the provided schema.
@@ -176,17 +231,46 @@ class MongoManager:
         :param filter_query: A dictionary containing the query criteria for filtering documents.
             Defaults to an empty dictionary if not provided.
         :type filter_query: dict | None
+        :param projection: Optional projection limiting the fields returned by the server.
+        :type projection: dict | None
         :return: A list of parsed and validated documents.
         :rtype: list
         """
         async with self._get_session(session=session) as session:
             collection = await self._get_collection(collection=collection)
 
-            documents = collection.find(filter_query, session=session)
+            documents = collection.find(filter_query, projection, session=session)
             results = [schema(**doc) async for doc in documents]
 
             return results
 
+    async def find_stream(
+        self,
+        collection: DBCollectionEnum | AsyncIOMotorCollection,
+        schema,
+        filter_query: dict,
+        sort: list[tuple[str, int]],
+    ) -> AsyncGenerator:
+        """
+        Yields the documents matching the filter one by one instead of loading them into a list.
+
+        :param collection: The collection to search within.
+        :type collection: DBCollectionEnum | AsyncIOMotorCollection
+        :param schema: An object used to parse and validate document structures.
+        :type schema: Any (typically a Pydantic model)
+        :param filter_query: A dictionary containing the query criteria for filtering documents.
+        :type filter_query: dict
+        :param sort: Fields and directions to sort the documents by.
+        :type sort: list[tuple[str, int]]
+        :return: An asynchronous generator of parsed and validated documents.
+        :rtype: AsyncGenerator
+        """
+        async with self._get_session() as session:
+            collection = await self._get_collection(collection=collection)
+
+            async for doc in collection.find(filter_query, sort=sort, session=session):
+                yield schema(**doc)
+
     async def insert_one(
         self,
         collection: DBCollectionEnum | AsyncIOMotorCollection,
@@ -241,6 +325,59 @@ class MongoManager:
 
             return await collection.insert_many(documents, session=session)
 
+    async def insert_documents(
+        self,
+        collection: DBCollectionEnum | AsyncIOMotorCollection,
+        documents: list[dict],
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> InsertManyResult:
+        """
+        Inserts prepared documents as they are, keeping BSON types such as dates and binary data.
+
+        The documents are inserted unordered, so a failed document does not stop the rest of the batch.
+
+        :param collection: The MongoDB collection to insert data into.
+        :type collection: DBCollectionEnum | AsyncIOMotorCollection
+        :param documents: The documents to insert.
+        :type documents: list[dict]
+        :param session: An optional asynchronous client session for transaction support.
+        :type session: AsyncIOMotorClientSession | None
+        :returns: A result object containing the inserted IDs.
+        :rtype: InsertManyResult
+        """
+        async with self._get_session(session=session) as session:
+            collection = await self._get_collection(collection=collection)
+
+            return await collection.insert_many(documents, ordered=False, session=session)
+
+    async def increment_many(
+        self,
+        collection: DBCollectionEnum | AsyncIOMotorCollection,
+        updates: list[tuple[dict, dict, dict]],
+    ) -> None:
+        """
+        Increments counters of many documents in one unordered bulk write, creating missing documents.
+
+        :param collection: The collection to update.
+        :type collection: DBCollectionEnum | AsyncIOMotorCollection
+        :param updates: Filter, increments and the fields set on insert of every document.
+        :type updates: list[tuple[dict, dict, dict]]
+        """
+        if not updates:
+            return
+
+        async with self._get_session() as session:
+            collection = await self._get_collection(collection=collection)
+
+            await collection.bulk_write(
+                [
+                    UpdateOne(filter_query, {"$inc": increments, "$setOnInsert": on_insert}, upsert=True)
+                    for filter_query, increments, on_insert in updates
+                ],
+                ordered=False,
+                session=session,
+            )
+
     async def update_one(
         self,
         collection: DBCollectionEnum | AsyncIOMotorCollection,
@@ -345,6 +482,9 @@ class MongoManager:
         async with self._get_session(session=session) as session:
             collection = await self._get_collection(collection=collection)
             cursor = collection.aggregate(pipeline=pipeline, session=session)
+            # the native PyMongo client returns a coroutine resolving to the cursor, Motor returns the cursor itself
+            if inspect.isawaitable(cursor):
+                cursor = await cursor
             result = await cursor.to_list(length=1)
 
             if not result:
@@ -0,0 +1,94 @@
+from threading import Lock
+
+from pymongo import monitoring
+
+from src.entities.named_tuples.mongo_tuples import PoolStatsTuple
+
+
+class MongoPoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Collects connection pool and checkout statistics from PyMongo's CMAP events.
+
+    The listener is shared by every pool of the client. Callbacks may be invoked from driver worker threads,
+    so all counters are updated under a lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty pool counters.
+        """
+        self._lock = Lock()
+        self._connections_open = 0
+        self._connections_in_use = 0
+        self._connections_created = 0
+        self._connections_closed = 0
+        self._checkouts = 0
+        self._checkout_failures = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+        self._pool_clears = 0
+
+    def get_stats(self) -> PoolStatsTuple:
+        """
+        Returns a snapshot of the collected statistics.
+
+        :returns: Current pool and checkout statistics.
+        :rtype: PoolStatsTuple
+        """
+        with self._lock:
+            return PoolStatsTuple(
+                connections_open=self._connections_open,
+                connections_in_use=self._connections_in_use,
+                connections_created=self._connections_created,
+                connections_closed=self._connections_closed,
+                checkouts=self._checkouts,
+                checkout_failures=self._checkout_failures,
+                checkout_wait_avg_ms=(self._checkout_wait_total / self._checkouts * 1000) if self._checkouts else 0.0,
+                checkout_wait_max_ms=self._checkout_wait_max * 1000,
+                pool_clears=self._pool_clears,
+            )
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pool_clears += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._connections_created += 1
+            self._connections_open += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._connections_closed += 1
+            self._connections_open = max(self._connections_open - 1, 0)
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._checkout_failures += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        duration = event.duration or 0.0
+        with self._lock:
+            self._checkouts += 1
+            self._connections_in_use += 1
+            self._checkout_wait_total += duration
+            self._checkout_wait_max = max(self._checkout_wait_max, duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._connections_in_use = max(self._connections_in_use - 1, 0)
@@ -1,6 +1,9 @@
 from aiogram import Router
 
 from src.logic.bot_logic.handlers.admins_handlers.admins_handlers import admin_router
+from src.logic.bot_logic.handlers.admins_handlers.dead_letters_handlers import (
+    dead_letters_router,
+)
 
 main_admin_router = Router()
-main_admin_router.include_routers(admin_router)
+main_admin_router.include_routers(admin_router, dead_letters_router)
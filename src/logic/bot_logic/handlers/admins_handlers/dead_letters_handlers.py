@@ -0,0 +1,123 @@
+from html import escape
+
+from aiogram import Router
+from aiogram.types import CallbackQuery
+
+from src.core.settings import get_settings
+from src.entities.callback_classes.admin_callbacks import (
+    DeadLettersMenuData,
+    DeadLettersReplayData,
+)
+from src.entities.schemas.user_data.user_schemas import UserSchema
+from src.logic.bot_logic.keyboards.keyboard_generator import KeyboardGenerator
+from src.logic.services.notification_queue_service import NotificationQueueService
+from src.utils.send_message_utils import send_message
+from src.utils.text_utils import localize_text_to_message
+
+dead_letters_router = Router()
+
+
+@dead_letters_router.callback_query(DeadLettersMenuData.filter())
+async def dead_letters_menu_handler(
+    callback: CallbackQuery, user: UserSchema, keyboard_generator: KeyboardGenerator
+) -> None:
+    """
+    Shows the most recent notifications that could not be delivered after all retries and the load of the delivery
+    lanes and priority classes, so that hot chats and slow priorities can be spotted.
+
+    :param callback: Callback query received from the user.
+    :type callback: CallbackQuery
+    :param user: User schema containing user information.
+    :type user: UserSchema
+    :param keyboard_generator: Generator responsible for creating keyboards.
+    :type keyboard_generator: KeyboardGenerator
+    """
+    dead_letters, count = await NotificationQueueService().get_dead_letters(count=get_settings().DEAD_LETTERS_PER_PAGE)
+
+    entries = "".join(
+        localize_text_to_message(
+            text_in_yaml="dead_letter_entry",
+            lang=user.language_code,
+            failed_at=dead_letter.failed_at,
+            chat_id=str(dead_letter.chat_id),
+            attempts=str(dead_letter.attempts),
+            error=escape(dead_letter.error[: get_settings().TRUNCATED_STRING_LENGTH]),
+        )
+        for dead_letter in dead_letters
+    )
+    lanes = "".join(
+        localize_text_to_message(
+            text_in_yaml="delivery_lane_entry",
+            lang=user.language_code,
+            lane=str(lane.lane),
+            depth=str(lane.depth),
+            processed=str(lane.processed),
+            avg_latency=f"{lane.avg_latency_ms:.0f}",
+            max_latency=f"{lane.max_latency_ms:.0f}",
+        )
+        for lane in NotificationQueueService().get_lane_stats()
+        if lane.depth or lane.processed
+    )
+    priorities = "".join(
+        localize_text_to_message(
+            text_in_yaml="delivery_priority_entry",
+            lang=user.language_code,
+            priority=priority.value,
+            depth=str(stats.depth),
+            processed=str(stats.processed),
+            avg_latency=f"{stats.avg_latency_ms:.0f}",
+            max_latency=f"{stats.max_latency_ms:.0f}",
+        )
+        for priority, stats in NotificationQueueService().get_priority_stats().items()
+    )
+    text = localize_text_to_message(
+        text_in_yaml="message_to_dead_letters_menu",
+        lang=user.language_code,
+        count=str(count),
+        entries=entries,
+        lanes=lanes,
+        priorities=priorities,
+    )
+    keyboard = await keyboard_generator.generate_static_keyboard(
+        kb_key="dead_letters_menu_keyboard", lang=user.language_code
+    )
+
+    await send_message(
+        chat_id=callback.message.chat.id,
+        message_id=callback.message.message_id,
+        text=text,
+        reply_markup=keyboard,
+        try_to_edit=True,
+    )
+
+
+@dead_letters_router.callback_query(DeadLettersReplayData.filter())
+async def replay_dead_letters_handler(
+    callback: CallbackQuery, user: UserSchema, keyboard_generator: KeyboardGenerator
+) -> None:
+    """
+    Returns all undelivered notifications to the queue with a fresh retry budget.
+
+    :param callback: Callback query received from the user.
+    :type callback: CallbackQuery
+    :param user: User schema containing user information.
+    :type user: UserSchema
+    :param keyboard_generator: Generator responsible for creating keyboards.
+    :type keyboard_generator: KeyboardGenerator
+    """
+    count = await NotificationQueueService().replay_dead_letters()
+
+    text = localize_text_to_message(
+        text_in_yaml="message_to_dead_letters_replayed", lang=user.language_code, count=str(count)
+    )
+    keyboard = await keyboard_generator.generate_static_keyboard(
+        kb_key="dead_letters_replayed_keyboard", lang=user.language_code
+    )
+
+    await send_message(
+        chat_id=callback.message.chat.id,
+        message_id=callback.message.message_id,
+        text=text,
+        reply_markup=keyboard,
+        try_to_edit=True,
+    )
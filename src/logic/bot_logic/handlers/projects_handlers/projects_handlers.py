@@ -1,9 +1,13 @@
+from collections import defaultdict
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
 from aiogram import Router
 from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
-from src.core.settings import get_logger
+from src.core.settings import get_logger, get_settings
 from src.entities.callback_classes.checkbox_callbacks import CheckboxData
 from src.entities.callback_classes.project_callbacks import (
     AddProject,
@@ -22,6 +26,8 @@ from src.entities.callback_classes.project_callbacks import (
     EditProjectInstance,
     InstanceTargetPath,
     ProjectEditName,
+    ProjectHistory,
+    ProjectHistoryMonth,
     ProjectID,
     ProjectInstanceID,
     ProjectMenuData,
@@ -39,6 +45,8 @@ from src.entities.states.project_states import (
     ProjectNameState,
 )
 from src.logic.bot_logic.keyboards.keyboard_generator import KeyboardGenerator
+from src.logic.services.event_filter import EventFilter
+from src.logic.services.event_stats import EventStats
 from src.logic.services.project_service import ProjectService
 from src.utils.send_message_utils import send_message, try_delete
 from src.utils.text_utils import localize_text_to_message
@@ -185,6 +193,72 @@ async def select_project_handler(
     )
 
 
+@projects_router.callback_query(ProjectHistory.filter())
+@projects_router.callback_query(ProjectHistoryMonth.filter())
+async def project_history_handler(
+    callback: CallbackQuery,
+    callback_data: ProjectHistory,
+    keyboard_generator: KeyboardGenerator,
+    user: UserSchema,
+) -> None:
+    """
+    Handles the project history callback query, showing the events received by the instances per day.
+
+    :param callback: The callback query that triggered the handler.
+    :type callback: CallbackQuery
+    :param callback_data: The callback data that triggered the handler.
+    :type callback_data: ProjectHistory
+    :param keyboard_generator: A generator for creating keyboards.
+    :type keyboard_generator: KeyboardGenerator
+    :param user: The user that triggered the handler.
+    :type user: UserSchema
+    """
+    lang = user.language_code
+    project = await ProjectService().get_project(project_id=callback_data.id)
+    instance_names = {instance.instance_id: instance.instance_name for instance in project.instances}
+
+    rollups = await EventStats().get_daily_history(instance_ids=list(instance_names), days=callback_data.days)
+
+    time_zone = ZoneInfo(get_settings().TIME_ZONE)
+    days: defaultdict[str, dict[str, int]] = defaultdict(dict)
+    # Mongo returns naive datetimes in UTC
+    for rollup in sorted(rollups, key=lambda item: item.bucket, reverse=True):
+        day = rollup.bucket.replace(tzinfo=rollup.bucket.tzinfo or UTC).astimezone(time_zone).strftime("%d.%m.%Y")
+        days[day][instance_names.get(rollup.instance_id, rollup.instance_id)] = rollup.total
+
+    text = localize_text_to_message(
+        text_in_yaml="message_to_project_history",
+        lang=lang,
+        project_name=project.name,
+        days=str(callback_data.days),
+        total=str(sum(sum(totals.values()) for totals in days.values())),
+        history="".join(
+            localize_text_to_message(
+                text_in_yaml="project_history_day_entry",
+                lang=lang,
+                day=day,
+                total=str(sum(totals.values())),
+                instances=", ".join(f"{name}: {total}" for name, total in totals.items()),
+            )
+            for day, totals in days.items()
+        )
+        or localize_text_to_message(text_in_yaml="project_history_empty", lang=lang),
+    )
+    keyboard = await keyboard_generator.generate_static_keyboard(
+        kb_key="project_history_keyboard",
+        lang=lang,
+        id=callback_data.id,
+    )
+
+    await send_message(
+        chat_id=callback.message.chat.id,
+        message_id=callback.message.message_id,
+        text=text,
+        reply_markup=keyboard,
+        try_to_edit=True,
+    )
+
+
 @projects_router.callback_query(ProjectEditName.filter())
 async def edit_project_name_menu_handler(
     callback: CallbackQuery,
@@ -532,6 +606,58 @@ async def confirm_add_instance_action(
     await state.clear()
 
 
+async def get_instance_stats_text(instance_id: str, lang: str) -> str:
+    """
+    Renders the event statistics of an instance and the number of events dropped by each of its filter rules.
+
+    :param instance_id: Unique identifier of the instance.
+    :type instance_id: str
+    :param lang: The language code of the text.
+    :type lang: str
+    :return: The statistics, or an empty string if they are not available.
+    :rtype: str
+    """
+    try:
+        stats = await EventStats().get_stats(instance_id=instance_id)
+    except Exception:
+        logger.exception("Failed to read the statistics of instance %s", instance_id)
+        return ""
+
+    if stats.last_seen is None:
+        text = localize_text_to_message(text_in_yaml="instance_stats_empty", lang=lang)
+    else:
+        settings = get_settings()
+        last_seen = datetime.fromtimestamp(stats.last_seen, tz=ZoneInfo(settings.TIME_ZONE))
+        text = localize_text_to_message(
+            text_in_yaml="instance_stats",
+            lang=lang,
+            total=str(sum(stats.events.values())),
+            last_seen=last_seen.strftime(settings.TIMESTAMP_FORMAT),
+            events="".join(
+                localize_text_to_message(
+                    text_in_yaml="instance_stats_event_entry",
+                    lang=lang,
+                    event=event.replace(":", " · "),
+                    count=str(count),
+                )
+                for event, count in stats.events.items()
+            ),
+            skipped=str(stats.skipped),
+            failed=str(stats.failed),
+        )
+
+    # the filter drops are counted in memory since the rules were last changed, so they cover this process only
+    drops = EventFilter().get_drop_counts(instance_id=instance_id)
+    if any(drops):
+        text += localize_text_to_message(
+            text_in_yaml="instance_stats_filter_drops",
+            lang=lang,
+            drops=" · ".join(f"#{index}: {count}" for index, count in enumerate(drops, start=1)),
+        )
+
+    return text
+
+
 @projects_router.callback_query(ProjectInstanceID.filter())
 async def edit_selected_instance_handler(
     callback: CallbackQuery,
@@ -562,6 +688,7 @@ async def edit_selected_instance_handler(
         project_name=project.name,
         instance_name=instance.instance_name,
         instance_url=instance.webhook_url,
+        stats=await get_instance_stats_text(instance_id=instance_id, lang=user.language_code),
     )
     keyboard = await keyboard_generator.generate_static_keyboard(
         kb_key="edit_instance_keyboard",
@@ -788,6 +915,11 @@ async def edit_project_following_action_checkbox_handler(
         project_name=project.name,
         instance_name=instance.instance_name,
         instance_url=instance.webhook_url,
+        stats=(
+            await get_instance_stats_text(instance_id=instance_id, lang=user.language_code)
+            if message_key == "message_to_selected_instance_in_project"
+            else ""
+        ),
     )
 
     await send_message(
@@ -0,0 +1,151 @@
+import asyncio
+import time
+from html import escape
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.entities.enums.circuit_state_enum import CircuitStateEnum
+from src.entities.named_tuples.queue_tuples import ChatCircuitTuple
+from src.entities.schemas.project_data.project_schemas import InstanceModel
+from src.logic.services.project_service import ProjectService
+from src.utils.send_message_utils import send_message
+from src.utils.text_utils import get_service_text
+
+logger = get_logger(name=__name__)
+
+
+class ChatCircuitBreaker(Singleton):
+    """
+    Per-chat circuit breaker that stops delivering notifications to chats the bot can no longer write to.
+
+    After `CHAT_BREAKER_THRESHOLD` permanent failures in a row the circuit opens: the instance is marked as disabled,
+    admins are notified, and notifications for the chat are skipped before they are rendered. Every
+    `CHAT_BREAKER_PROBE_INTERVAL` seconds one notification is let through as a probe; when it is delivered the circuit
+    closes and the instance is enabled again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the circuits.
+
+        :ivar self._circuits: Failure count and opening time of the chats with recent failures.
+        :type self._circuits: dict[int, ChatCircuitTuple]
+        """
+        if getattr(self, "_circuits", None) is not None:
+            return
+
+        self._circuits: dict[int, ChatCircuitTuple] = {}
+
+    def state(self, chat_id: int) -> CircuitStateEnum:
+        """
+        Returns the state of the circuit of a chat.
+
+        :param chat_id: Unique identifier of the chat.
+        :type chat_id: int
+        :return: The state of the circuit.
+        :rtype: CircuitStateEnum
+        """
+        circuit = self._circuits.get(chat_id)
+
+        if circuit is None or circuit.opened_at is None:
+            return CircuitStateEnum.CLOSED
+        if time.monotonic() - circuit.opened_at >= get_settings().CHAT_BREAKER_PROBE_INTERVAL:
+            return CircuitStateEnum.HALF_OPEN
+        return CircuitStateEnum.OPEN
+
+    def allow(self, instance: InstanceModel) -> bool:
+        """
+        Checks whether a notification for the chat of an instance should be delivered.
+
+        :param instance: The instance receiving the notification.
+        :type instance: InstanceModel
+        :return: True if the circuit is closed or the notification is the probe, False otherwise.
+        :rtype: bool
+        """
+        # the circuits are kept in memory, so a disabled instance starts half-open after a restart
+        if instance.disabled and instance.chat_id not in self._circuits:
+            self._circuits[instance.chat_id] = ChatCircuitTuple(
+                failures=get_settings().CHAT_BREAKER_THRESHOLD,
+                opened_at=time.monotonic() - get_settings().CHAT_BREAKER_PROBE_INTERVAL,
+            )
+
+        match self.state(chat_id=instance.chat_id):
+            case CircuitStateEnum.CLOSED:
+                return True
+            case CircuitStateEnum.HALF_OPEN:
+                # restarting the interval lets a single probe through until its result is known
+                self._circuits[instance.chat_id] = self._circuits[instance.chat_id]._replace(opened_at=time.monotonic())
+                logger.info("Probing unavailable chat %s", instance.chat_id)
+                return True
+            case _:
+                return False
+
+    async def record_success(self, instance: InstanceModel) -> None:
+        """
+        Closes the circuit of the chat and enables the instance if it was disabled.
+
+        :param instance: The instance whose notification has been delivered.
+        :type instance: InstanceModel
+        """
+        self._circuits.pop(instance.chat_id, None)
+
+        if instance.disabled:
+            logger.info("Chat %s is available again, enabling instance %s", instance.chat_id, instance.instance_id)
+            await ProjectService().update_instance(
+                instance_id=instance.instance_id, update_field="disabled", update_value=False
+            )
+            await self._notify_admins(
+                text=get_service_text(
+                    text_in_yaml="chat_enabled_notification",
+                    instance_name=instance.instance_name,
+                    chat_id=instance.chat_id,
+                )
+            )
+
+    async def record_failure(self, instance: InstanceModel, error: str) -> None:
+        """
+        Counts a permanent failure and opens the circuit once the threshold is reached.
+
+        :param instance: The instance whose notification could not be delivered.
+        :type instance: InstanceModel
+        :param error: Description of the failure.
+        :type error: str
+        """
+        settings = get_settings()
+        circuit = self._circuits.get(instance.chat_id, ChatCircuitTuple(failures=0))
+        failures = circuit.failures + 1
+
+        if failures < settings.CHAT_BREAKER_THRESHOLD:
+            self._circuits[instance.chat_id] = ChatCircuitTuple(failures=failures)
+            return
+
+        self._circuits[instance.chat_id] = ChatCircuitTuple(failures=failures, opened_at=time.monotonic())
+
+        if instance.disabled or circuit.opened_at is not None:
+            return
+
+        logger.warning(
+            "Chat %s is unavailable, disabling instance %s: %s", instance.chat_id, instance.instance_id, error
+        )
+        await ProjectService().update_instance(
+            instance_id=instance.instance_id, update_field="disabled", update_value=True
+        )
+        await self._notify_admins(
+            text=get_service_text(
+                text_in_yaml="chat_disabled_notification",
+                instance_name=instance.instance_name,
+                chat_id=instance.chat_id,
+                error=escape(error),
+                interval=round(settings.CHAT_BREAKER_PROBE_INTERVAL / 60),
+            )
+        )
+
+    @staticmethod
+    async def _notify_admins(text: str) -> None:
+        """
+        Sends a service notification to all admins.
+
+        :param text: Text of the notification.
+        :type text: str
+        """
+        await asyncio.gather(*(send_message(chat_id=admin_id, text=text) for admin_id in get_settings().ADMIN_IDS))
@@ -0,0 +1,377 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from operator import attrgetter
+from typing import Any
+
+from src.core.Base.exceptions import DeliveryDeferredError
+from src.core.settings import get_logger
+from src.entities.named_tuples.queue_tuples import LaneItemTuple, LaneStatsTuple
+
+logger = get_logger(name=__name__)
+
+LATENCY_WINDOW = 100
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Maps a key to a bucket with the jump consistent hash by Lamping and Veach.
+
+    When the number of buckets changes, only about 1/n of the keys move to another bucket.
+
+    :param key: The key to map, e.g. a chat id.
+    :type key: int
+    :param buckets: Number of buckets.
+    :type buckets: int
+    :return: The bucket of the key in the range [0, buckets).
+    :rtype: int
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, candidate = -1, 0
+
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+
+    return bucket
+
+
+class DeliveryLanes:
+    """
+    Delivers items in parallel lanes, keeping the submission order of the items of each chat.
+
+    Every chat is pinned to one lane by a consistent hash of its id, and each lane handles its chats one at a time, so
+    notifications of a chat never overtake each other while different chats are delivered concurrently.
+
+    Items are submitted with a priority level, 0 being the most urgent. The level only decides which chat a lane serves
+    next: the chat with the most urgent waiting item, or, to prevent starvation, the chat with an item that has waited
+    for `max_wait` seconds regardless of its level. The items of that chat are still delivered oldest first, so a more
+    urgent item never overtakes an older one of the same chat.
+
+    The handler receives the items of one chat at a time. With `merge` enabled, all items of the chat that are waiting
+    in the lane are passed together, so a backlog of a slow chat can be delivered at once; otherwise, and whenever the
+    chat has no backlog, the handler receives a single item.
+
+    A handler that cannot deliver to a chat for a while, e.g. under Telegram flood control, raises
+    `DeliveryDeferredError` with the undelivered items. They are put back into the lane and the chat is skipped until
+    the delay has passed, while the lane keeps delivering to its other chats.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        size: int,
+        handler: Callable[[list[Any]], Awaitable[None]],
+        merge: bool = False,
+        levels: int = 1,
+        max_wait: float = 30,
+    ) -> None:
+        """
+        Initializes the lanes.
+
+        :param count: Number of lanes.
+        :type count: int
+        :param size: Maximum number of waiting items per lane; submitting to a full lane waits.
+        :type size: int
+        :param handler: Coroutine function delivering the items of a chat.
+        :type handler: Callable[[list[Any]], Awaitable[None]]
+        :param merge: Whether the waiting items of a chat are passed to the handler together.
+        :type merge: bool
+        :param levels: Number of priority levels.
+        :type levels: int
+        :param max_wait: Time in seconds after which an item is served first regardless of its level.
+        :type max_wait: float
+        """
+        self._handler = handler
+        self._size = size
+        self._merge = merge
+        self._max_wait = max_wait
+        self._queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=size) for _ in range(count)]
+        self._pending: list[list[deque[LaneItemTuple]]] = [[deque() for _ in range(levels)] for _ in range(count)]
+        self._processed = [0] * count
+        self._latencies: list[deque[float]] = [deque(maxlen=LATENCY_WINDOW) for _ in range(count)]
+        self._level_processed = [0] * levels
+        self._level_latencies: list[deque[float]] = [deque(maxlen=LATENCY_WINDOW) for _ in range(levels)]
+        self._deferred: list[dict[int, float]] = [{} for _ in range(count)]
+        self._tasks: list[asyncio.Task] = []
+
+    def lane_of(self, chat_id: int) -> int:
+        """
+        Returns the lane of a chat.
+
+        :param chat_id: Unique identifier of the chat.
+        :type chat_id: int
+        :return: The lane index.
+        :rtype: int
+        """
+        return jump_hash(key=chat_id, buckets=len(self._queues))
+
+    def start(self) -> None:
+        """
+        Starts a worker for every lane.
+        """
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run(lane=lane), name=f"delivery-lane:{lane}")
+                for lane in range(len(self._queues))
+            ]
+
+    async def stop(self) -> None:
+        """
+        Stops the workers; items that are still waiting are dropped.
+        """
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        for queue, levels, deferred in zip(self._queues, self._pending, self._deferred):
+            deferred.clear()
+            for pending in levels:
+                pending.clear()
+            while not queue.empty():
+                queue.get_nowait()
+
+    async def submit(self, chat_id: int, item: Any, level: int = 0) -> None:
+        """
+        Appends an item to the lane of its chat, waiting while the lane is full.
+
+        :param chat_id: Unique identifier of the chat the item is delivered to.
+        :type chat_id: int
+        :param item: The item passed to the handler.
+        :type item: Any
+        :param level: Priority level of the item, 0 being the most urgent.
+        :type level: int
+        """
+        await self._queues[self.lane_of(chat_id=chat_id)].put(
+            LaneItemTuple(submitted=time.perf_counter(), chat_id=chat_id, level=level, item=item)
+        )
+
+    def stats(self) -> list[LaneStatsTuple]:
+        """
+        Returns the depth and the latency from submission to delivery of every lane.
+
+        :return: Statistics of the lanes, the latency covering the most recent deliveries.
+        :rtype: list[LaneStatsTuple]
+        """
+        return [
+            self._build_stats(
+                lane=lane,
+                depth=queue.qsize() + sum(map(len, levels)),
+                processed=self._processed[lane],
+                latencies=self._latencies[lane],
+            )
+            for lane, (queue, levels) in enumerate(zip(self._queues, self._pending))
+        ]
+
+    def level_stats(self) -> list[LaneStatsTuple]:
+        """
+        Returns the depth and the latency from submission to delivery of every priority level across all lanes.
+
+        Items that have not been sorted into the levels of their lane yet are not counted in the depth.
+
+        :return: Statistics of the priority levels, with the level in the `lane` field.
+        :rtype: list[LaneStatsTuple]
+        """
+        return [
+            self._build_stats(
+                lane=level,
+                depth=sum(len(levels[level]) for levels in self._pending),
+                processed=processed,
+                latencies=latencies,
+            )
+            for level, (processed, latencies) in enumerate(zip(self._level_processed, self._level_latencies))
+        ]
+
+    @staticmethod
+    def _build_stats(lane: int, depth: int, processed: int, latencies: deque[float]) -> LaneStatsTuple:
+        """
+        Builds the statistics of a lane or a priority level.
+
+        :param lane: The lane index or priority level.
+        :type lane: int
+        :param depth: Number of waiting items.
+        :type depth: int
+        :param processed: Number of handled items.
+        :type processed: int
+        :param latencies: Latencies of the most recent deliveries in milliseconds.
+        :type latencies: deque[float]
+        :return: The statistics.
+        :rtype: LaneStatsTuple
+        """
+        return LaneStatsTuple(
+            lane=lane,
+            depth=depth,
+            processed=processed,
+            avg_latency_ms=sum(latencies) / len(latencies) if latencies else 0.0,
+            max_latency_ms=max(latencies, default=0.0),
+        )
+
+    def _resume_in(self, lane: int) -> float | None:
+        """
+        Forgets the chats of a lane whose delay has passed and returns the time until the next one resumes.
+
+        :param lane: The lane index.
+        :type lane: int
+        :return: Seconds until the next deferred chat resumes, or None if no chat is deferred.
+        :rtype: float | None
+        """
+        deferred = self._deferred[lane]
+        now = time.perf_counter()
+
+        for chat_id in [chat_id for chat_id, due in deferred.items() if due <= now]:
+            del deferred[chat_id]
+
+        return min(deferred.values()) - now if deferred else None
+
+    def _pick(self, lane: int) -> LaneItemTuple | None:
+        """
+        Takes the next item of a lane: the oldest item of the chat with the oldest overdue item, or else of the chat
+        with the oldest item of the most urgent level. Items of deferred chats are skipped.
+
+        :param lane: The lane index.
+        :type lane: int
+        :return: The item to deliver, or None if all waiting items belong to deferred chats.
+        :rtype: LaneItemTuple | None
+        """
+        self._resume_in(lane=lane)
+        deferred = self._deferred[lane]
+        deadline = time.perf_counter() - self._max_wait
+
+        # every level is ordered by submission, so its first ready item is its oldest one
+        heads = [
+            head
+            for pending in self._pending[lane]
+            if (head := next((entry for entry in pending if entry.chat_id not in deferred), None)) is not None
+        ]
+        if not heads:
+            return None
+
+        overdue = [entry for entry in heads if entry.submitted <= deadline]
+        chat_id = (min(overdue, key=attrgetter("submitted")) if overdue else heads[0]).chat_id
+
+        # the priority only chooses the chat, which is then served from its oldest item in any level
+        first = min(
+            (
+                head
+                for pending in self._pending[lane]
+                if (head := next((entry for entry in pending if entry.chat_id == chat_id), None)) is not None
+            ),
+            key=attrgetter("submitted"),
+        )
+        self._pending[lane][first.level].remove(first)
+
+        return first
+
+    def _fill(self, lane: int) -> None:
+        """
+        Moves the submitted items of a lane into its levels while fewer than `size` items are waiting there.
+
+        :param lane: The lane index.
+        :type lane: int
+        """
+        queue, levels = self._queues[lane], self._pending[lane]
+        waiting = sum(map(len, levels))
+
+        while waiting < self._size and not queue.empty():
+            entry = queue.get_nowait()
+            levels[entry.level].append(entry)
+            waiting += 1
+
+    async def _next_batch(self, lane: int) -> list[LaneItemTuple]:
+        """
+        Takes the next item of a lane and, with merging enabled, the other waiting items of its chat.
+
+        Waits for a new item, or for a deferred chat to resume, while no waiting item can be delivered.
+
+        :param lane: The lane index.
+        :type lane: int
+        :return: The items of one chat in submission order.
+        :rtype: list[LaneItemTuple]
+        """
+        queue, levels = self._queues[lane], self._pending[lane]
+        self._fill(lane=lane)
+
+        while (first := self._pick(lane=lane)) is None:
+            try:
+                entry = await asyncio.wait_for(queue.get(), timeout=self._resume_in(lane=lane))
+            except TimeoutError:
+                continue
+
+            levels[entry.level].append(entry)
+            self._fill(lane=lane)
+
+        if not self._merge:
+            return [first]
+
+        # the rest of the chat's items is taken out of every level, the items of other chats keep their order
+        batch = [first]
+        for pending in levels:
+            if any(entry.chat_id == first.chat_id for entry in pending):
+                batch.extend(entry for entry in pending if entry.chat_id == first.chat_id)
+                remaining = [entry for entry in pending if entry.chat_id != first.chat_id]
+                pending.clear()
+                pending.extend(remaining)
+
+        return sorted(batch, key=attrgetter("submitted"))
+
+    async def _run(self, lane: int) -> None:
+        """
+        Delivers the items of a lane chat by chat.
+
+        :param lane: The lane index.
+        :type lane: int
+        """
+        while True:
+            batch = await self._next_batch(lane=lane)
+
+            try:
+                await self._handler([entry.item for entry in batch])
+            except DeliveryDeferredError as e:
+                batch = self._defer(lane=lane, batch=batch, items=e.items, delay=e.delay)
+            except Exception:
+                logger.exception("Delivery lane %s failed to handle %s items", lane, len(batch))
+            finally:
+                delivered = time.perf_counter()
+                self._processed[lane] += len(batch)
+                for entry in batch:
+                    latency = (delivered - entry.submitted) * 1000
+                    self._latencies[lane].append(latency)
+                    self._level_processed[entry.level] += 1
+                    self._level_latencies[entry.level].append(latency)
+
+    def _defer(self, lane: int, batch: list[LaneItemTuple], items: list[Any], delay: float) -> list[LaneItemTuple]:
+        """
+        Puts the undelivered items of a batch back into their levels and skips their chat for a while.
+
+        :param lane: The lane index.
+        :type lane: int
+        :param batch: The items of one chat passed to the handler.
+        :type batch: list[LaneItemTuple]
+        :param items: The items the handler has not delivered.
+        :type items: list[Any]
+        :param delay: Time in seconds the chat is skipped.
+        :type delay: float
+        :return: The delivered items of the batch.
+        :rtype: list[LaneItemTuple]
+        """
+        undelivered = {id(item) for item in items}
+        levels = self._pending[lane]
+
+        for entry in batch:
+            if id(entry.item) in undelivered:
+                levels[entry.level].append(entry)
+
+        # the items put back must stay ahead of the newer items of their chat
+        for pending in levels:
+            ordered = sorted(pending, key=attrgetter("submitted"))
+            pending.clear()
+            pending.extend(ordered)
+
+        self._deferred[lane][batch[0].chat_id] = time.perf_counter() + delay
+        logger.info("Delivery to chat %s deferred for %s s", batch[0].chat_id, delay)
+
+        return [entry for entry in batch if id(entry.item) not in undelivered]
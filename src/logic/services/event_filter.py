@@ -0,0 +1,189 @@
+from collections import Counter
+from collections.abc import Callable
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger
+from src.entities.enums.event_enums import EventTypeEnum
+from src.entities.named_tuples.filter_tuples import CompiledFiltersTuple
+from src.entities.schemas.project_data.project_schemas import (
+    FilterRuleModel,
+    InstanceModel,
+)
+from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+
+logger = get_logger(name=__name__)
+
+Predicate = Callable[[WebhookPayload], bool]
+
+
+def get_changed_fields(payload: WebhookPayload) -> set[str]:
+    """
+    Returns the fields changed by an event.
+
+    :param payload: Payload from the webhook.
+    :type payload: WebhookPayload
+    :return: Names of the fields in the diff of the change, empty for events without a diff.
+    :rtype: set[str]
+    """
+    diff = payload.change.diff if payload.change else None
+    if diff is None:
+        return set()
+
+    return {field for field in diff.model_fields_set if getattr(diff, field) is not None}
+
+
+def get_tag_names(payload: WebhookPayload) -> set[str]:
+    """
+    Returns the lowercase tags of the changed object.
+
+    :param payload: Payload from the webhook.
+    :type payload: WebhookPayload
+    :return: Names of the tags, Taiga sends them either as names or as pairs of name and colour.
+    :rtype: set[str]
+    """
+    return {str(tag[0] if isinstance(tag, list) else tag).lower() for tag in getattr(payload.data, "tags", None) or []}
+
+
+def get_assignee(payload: WebhookPayload) -> str | None:
+    """
+    Returns the username of the user assigned to the changed object.
+
+    :param payload: Payload from the webhook.
+    :type payload: WebhookPayload
+    :return: The username, or None if the object is not assigned or cannot be assigned.
+    :rtype: str | None
+    """
+    assigned_to = getattr(payload.data, "assigned_to", None)
+    return assigned_to.username if assigned_to is not None else None
+
+
+def compile_rule(rule: FilterRuleModel) -> Predicate:
+    """
+    Compiles a filter rule into a predicate that checks only the conditions set in the rule.
+
+    :param rule: The filter rule.
+    :type rule: FilterRuleModel
+    :return: A function returning True for the events matching the rule.
+    :rtype: Predicate
+    """
+    checks: list[Predicate] = []
+
+    if rule.type is not None:
+        checks.append(lambda payload, event_type=rule.type: payload.type == event_type)
+    if rule.action is not None:
+        checks.append(lambda payload, action=rule.action: payload.action == action)
+    if rule.changes:
+        changes = frozenset(field.value for field in rule.changes)
+        if rule.changes_only:
+            checks.append(lambda payload: (changed := get_changed_fields(payload=payload)) and changed <= changes)
+        else:
+            checks.append(lambda payload: not changes.isdisjoint(get_changed_fields(payload=payload)))
+    if rule.tags:
+        tags = frozenset(tag.lower() for tag in rule.tags)
+        checks.append(lambda payload: not tags.isdisjoint(get_tag_names(payload=payload)))
+    if rule.assignees:
+        assignees = frozenset(rule.assignees)
+        checks.append(lambda payload: get_assignee(payload=payload) in assignees)
+    if rule.authors:
+        authors = frozenset(rule.authors)
+        checks.append(lambda payload: payload.by.username in authors)
+
+    if not checks:
+        return lambda payload: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda payload: all(check(payload) for check in checks)
+
+
+class EventFilter(Singleton):
+    """
+    Drops events by the filter rules of their instance before the notifications are rendered.
+
+    The rules of an instance are compiled into predicates once and recompiled only when the rules change, and the
+    number of events dropped by every rule is counted in memory.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the compiled rules and the drop counters.
+
+        :ivar self._compiled: Rules and predicates compiled for every instance.
+        :type self._compiled: dict[str, CompiledFiltersTuple]
+        :ivar self._drops: Number of dropped events by instance and index of the rule.
+        :type self._drops: Counter[tuple[str, int]]
+        """
+        if getattr(self, "_compiled", None) is not None:
+            return
+
+        self._compiled: dict[str, CompiledFiltersTuple] = {}
+        self._drops: Counter[tuple[str, int]] = Counter()
+
+    def allow(self, payload: WebhookPayload, instance: InstanceModel) -> bool:
+        """
+        Checks whether an event should be delivered to an instance.
+
+        Test events are always delivered, so that the connection to Taiga can be checked whatever the rules are.
+
+        :param payload: Payload from the webhook.
+        :type payload: WebhookPayload
+        :param instance: The instance receiving the event.
+        :type instance: InstanceModel
+        :return: False if the first matching rule drops the event, True otherwise.
+        :rtype: bool
+        """
+        if not instance.filter_rules or payload.type == EventTypeEnum.TEST:
+            return True
+
+        compiled = self._get_compiled(instance=instance)
+
+        for index, predicate in enumerate(compiled.predicates):
+            if not predicate(payload):
+                continue
+            if compiled.rules[index].drop:
+                self._drops[instance.instance_id, index] += 1
+                logger.debug("Event %s %s dropped by rule %s", payload.type, payload.action, index)
+                return False
+            return True
+
+        return True
+
+    def get_drop_counts(self, instance_id: str) -> list[int]:
+        """
+        Returns the number of events dropped by every rule of an instance since the rules were compiled.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :return: The counts in the order of the rules, empty if the rules have not been compiled yet.
+        :rtype: list[int]
+        """
+        compiled = self._compiled.get(instance_id)
+        if compiled is None:
+            return []
+
+        return [self._drops[instance_id, index] for index in range(len(compiled.rules))]
+
+    def _get_compiled(self, instance: InstanceModel) -> CompiledFiltersTuple:
+        """
+        Returns the compiled rules of an instance, compiling them if they have changed.
+
+        The instance is read from the database for every webhook, so the rules themselves identify the version of the
+        configuration; the counters are reset with a new version because the indices of the rules may change.
+
+        :param instance: The instance receiving the event.
+        :type instance: InstanceModel
+        :return: The rules and their predicates.
+        :rtype: CompiledFiltersTuple
+        """
+        compiled = self._compiled.get(instance.instance_id)
+        if compiled is not None and compiled.rules == instance.filter_rules:
+            return compiled
+
+        compiled = CompiledFiltersTuple(
+            rules=instance.filter_rules, predicates=tuple(compile_rule(rule=rule) for rule in instance.filter_rules)
+        )
+        self._compiled[instance.instance_id] = compiled
+        for key in [key for key in self._drops if key[0] == instance.instance_id]:
+            del self._drops[key]
+
+        logger.info("Compiled %s filter rules of instance %s", len(compiled.rules), instance.instance_id)
+        return compiled
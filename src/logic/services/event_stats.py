@@ -0,0 +1,341 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from pymongo.errors import BulkWriteError
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.entities.enums.collection_enum import DBCollectionEnum
+from src.entities.enums.rollup_granularity_enum import RollupGranularityEnum
+from src.entities.named_tuples.stats_tuples import InstanceStatsTuple
+from src.entities.schemas.stats_data.stats_schemas import EventRollupModel
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+from src.infrastructure.broker.redis_manager import RedisManager
+from src.infrastructure.database.mongo_dependency import MongoDBDependency
+from src.infrastructure.database.mongo_manager import MongoManager
+
+logger = get_logger(name=__name__)
+
+EVENT_FIELD_PREFIX = "event:"
+SKIPPED_FIELD = "skipped"
+FAILED_FIELD = "failed"
+
+
+def get_bucket_start(moment: datetime, granularity: RollupGranularityEnum) -> datetime:
+    """
+    Returns the start of the hour or of the day in the configured time zone that contains a moment.
+
+    :param moment: The moment, aware of its time zone.
+    :type moment: datetime
+    :param granularity: Size of the bucket.
+    :type granularity: RollupGranularityEnum
+    :return: The start of the bucket in UTC.
+    :rtype: datetime
+    """
+    local = moment.astimezone(ZoneInfo(get_settings().TIME_ZONE))
+    local = local.replace(minute=0, second=0, microsecond=0)
+
+    if granularity == RollupGranularityEnum.DAY:
+        local = datetime.combine(local.date(), datetime.min.time(), tzinfo=local.tzinfo)
+
+    return local.astimezone(UTC)
+
+
+class EventStats(Singleton):
+    """
+    Per-instance counters of received events by type and action, skipped events and delivery failures.
+
+    The counters are collected in memory and added to Redis hashes every `EVENT_STATS_FLUSH_INTERVAL` seconds in one
+    pipeline, so counting costs no round trip per event and the counters of all workers are summed up. The time of
+    the last event of every instance is kept in a sorted set, where the latest time reported by any worker wins.
+
+    The same counters are rolled up into hourly and daily bucket documents in Mongo with `$inc` upserts in one bulk
+    write per flush, so the history of an instance is read from a few pre-aggregated documents.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the pending counters.
+
+        :ivar self._pending: Counters not yet written to Redis, by instance.
+        :type self._pending: defaultdict[str, Counter[str]]
+        :ivar self._last_seen: Unix time of the last event not yet written to Redis, by instance.
+        :type self._last_seen: dict[str, float]
+        :ivar self._hourly: Counters not yet written to the rollups, by instance and start of the hour.
+        :type self._hourly: defaultdict[tuple[str, datetime], Counter[str]]
+        :ivar self._failed_rollups: Counters of the rollup upserts that failed in a partially applied bulk write, by
+            granularity, instance and start of the bucket.
+        :type self._failed_rollups: defaultdict[tuple[RollupGranularityEnum, str, datetime], Counter[str]]
+        :ivar self._task: Background loop writing the counters.
+        :type self._task: asyncio.Task | None
+        """
+        if getattr(self, "_pending", None) is not None:
+            return
+
+        self._redis_manager = RedisManager(redis_dep=RedisSessionDependency())
+        self._mongo_manager = MongoManager(MongoDBDependency())
+        self._prefix = get_settings().EVENT_STATS_KEY_PREFIX
+        self._pending: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._last_seen: dict[str, float] = {}
+        self._hourly: defaultdict[tuple[str, datetime], Counter[str]] = defaultdict(Counter)
+        self._failed_rollups: defaultdict[tuple[RollupGranularityEnum, str, datetime], Counter[str]] = defaultdict(
+            Counter
+        )
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """
+        Creates the indexes of the rollups and starts writing the counters periodically.
+        """
+        if self._task is None:
+            await self._mongo_manager.create_rollup_indexes()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the background loop and writes the remaining counters.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        await self.flush()
+
+    def record_event(self, instance_id: str, event_type: str, action: str) -> None:
+        """
+        Counts an event received by an instance.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :param event_type: Type of the event.
+        :type event_type: str
+        :param action: Action of the event.
+        :type action: str
+        """
+        self._count(instance_id=instance_id, field=f"{EVENT_FIELD_PREFIX}{event_type}:{action}")
+        self._last_seen[instance_id] = time.time()
+
+    def record_skipped(self, instance_id: str) -> None:
+        """
+        Counts an event that is not delivered because the instance does not follow it or a filter rule drops it.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        """
+        self._count(instance_id=instance_id, field=SKIPPED_FIELD)
+
+    def record_failures(self, instance_id: str, count: int = 1) -> None:
+        """
+        Counts notifications that could not be delivered.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :param count: Number of the notifications.
+        :type count: int
+        """
+        self._count(instance_id=instance_id, field=FAILED_FIELD, amount=count)
+
+    async def flush(self) -> None:
+        """
+        Adds the pending counters to Redis and to the rollups; they are kept for the next attempt if the write fails.
+        """
+        await self._flush_counters()
+        await self._flush_rollups()
+
+    async def get_daily_history(self, instance_ids: list[str], days: int) -> list[EventRollupModel]:
+        """
+        Returns the daily rollups of instances for the last days in one indexed query.
+
+        :param instance_ids: Unique identifiers of the instances.
+        :type instance_ids: list[str]
+        :param days: Number of days including today.
+        :type days: int
+        :return: The rollups of the days with events.
+        :rtype: list[EventRollupModel]
+        """
+        today = get_bucket_start(moment=datetime.now(UTC), granularity=RollupGranularityEnum.DAY)
+
+        return await self._mongo_manager.find(
+            collection=DBCollectionEnum.EVENT_ROLLUPS,
+            schema=EventRollupModel,
+            filter_query={
+                "instance_id": {"$in": instance_ids},
+                "granularity": RollupGranularityEnum.DAY.value,
+                "bucket": {"$gte": today - timedelta(days=days - 1)},
+            },
+            projection={"_id": 0, "expires_at": 0},
+        )
+
+    def _count(self, instance_id: str, field: str, amount: int = 1) -> None:
+        """
+        Adds to a counter of an instance and to its rollup for the current hour.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :param field: Name of the counter.
+        :type field: str
+        :param amount: Amount to add.
+        :type amount: int
+        """
+        self._pending[instance_id][field] += amount
+
+        hour = get_bucket_start(moment=datetime.now(UTC), granularity=RollupGranularityEnum.HOUR)
+        self._hourly[instance_id, hour][field] += amount
+
+    async def _flush_counters(self) -> None:
+        """
+        Adds the pending counters to Redis.
+        """
+        if not self._pending and not self._last_seen:
+            return
+
+        pending, self._pending = self._pending, defaultdict(Counter)
+        last_seen, self._last_seen = self._last_seen, {}
+
+        try:
+            await self._redis_manager.increment_hashes(
+                counters={self._key(instance_id=instance_id): counters for instance_id, counters in pending.items()}
+            )
+            if last_seen:
+                await self._redis_manager.set_max_scores(key=self._last_seen_key, scores=last_seen)
+        except Exception:
+            logger.exception("Failed to write the event statistics")
+
+            for instance_id, counters in pending.items():
+                self._pending[instance_id].update(counters)
+            for instance_id, seen in last_seen.items():
+                self._last_seen[instance_id] = max(seen, self._last_seen.get(instance_id, 0))
+
+    async def _flush_rollups(self) -> None:
+        """
+        Adds the pending counters to the hourly and daily rollups.
+
+        The upserts are written in one unordered bulk write, so after a partial failure only the failed upserts are
+        kept for the next attempt; adding the others again would count them twice.
+        """
+        if not self._hourly and not self._failed_rollups:
+            return
+
+        hourly, self._hourly = self._hourly, defaultdict(Counter)
+        buckets, self._failed_rollups = self._failed_rollups, defaultdict(Counter)
+        settings = get_settings()
+        keep_days = {
+            RollupGranularityEnum.HOUR: settings.EVENT_ROLLUPS_HOURLY_DAYS,
+            RollupGranularityEnum.DAY: settings.EVENT_ROLLUPS_DAILY_DAYS,
+        }
+        retried = [(key, Counter(counters)) for key, counters in buckets.items()]
+
+        for (instance_id, hour), counters in hourly.items():
+            buckets[RollupGranularityEnum.HOUR, instance_id, hour].update(counters)
+            day = get_bucket_start(moment=hour, granularity=RollupGranularityEnum.DAY)
+            buckets[RollupGranularityEnum.DAY, instance_id, day].update(counters)
+
+        keys = list(buckets)
+        updates = [
+            self._build_rollup_update(
+                instance_id=instance_id,
+                granularity=granularity,
+                bucket=bucket,
+                counters=buckets[granularity, instance_id, bucket],
+                keep_days=keep_days[granularity],
+            )
+            for granularity, instance_id, bucket in keys
+        ]
+
+        try:
+            await self._mongo_manager.increment_many(collection=DBCollectionEnum.EVENT_ROLLUPS, updates=updates)
+        except BulkWriteError as e:
+            failed = [keys[error["index"]] for error in e.details.get("writeErrors", [])]
+            logger.exception("Failed to write %s of %s event rollups", len(failed), len(keys))
+
+            for key in failed:
+                self._failed_rollups[key].update(buckets[key])
+        except Exception:
+            logger.exception("Failed to write the event rollups")
+
+            for key, counters in hourly.items():
+                self._hourly[key].update(counters)
+            for key, counters in retried:
+                self._failed_rollups[key].update(counters)
+
+    @staticmethod
+    def _build_rollup_update(
+        instance_id: str, granularity: RollupGranularityEnum, bucket: datetime, counters: Counter[str], keep_days: int
+    ) -> tuple[dict, dict, dict]:
+        """
+        Builds the upsert of a rollup document.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :param granularity: Size of the bucket.
+        :type granularity: RollupGranularityEnum
+        :param bucket: Start of the bucket in UTC.
+        :type bucket: datetime
+        :param counters: Counters to add.
+        :type counters: Counter[str]
+        :param keep_days: Days the document is kept after the start of the bucket.
+        :type keep_days: int
+        :return: The filter, the increments and the fields set on insert.
+        :rtype: tuple[dict, dict, dict]
+        """
+        increments = {f"counts.{field}": count for field, count in counters.items()}
+        increments["total"] = sum(count for field, count in counters.items() if field.startswith(EVENT_FIELD_PREFIX))
+
+        return (
+            {"instance_id": instance_id, "granularity": granularity.value, "bucket": bucket},
+            increments,
+            {"expires_at": bucket + timedelta(days=keep_days)},
+        )
+
+    async def get_stats(self, instance_id: str) -> InstanceStatsTuple:
+        """
+        Returns the counters of an instance, including the ones this worker has not written yet.
+
+        :param instance_id: Unique identifier of the instance.
+        :type instance_id: str
+        :return: Events by "type:action", skipped events, failed deliveries and the Unix time of the last event.
+        :rtype: InstanceStatsTuple
+        """
+        counters = Counter(
+            {
+                field: int(value)
+                for field, value in (await self._redis_manager.get_hash(key=self._key(instance_id=instance_id))).items()
+            }
+        )
+        counters.update(self._pending.get(instance_id, Counter()))
+
+        last_seen = await self._redis_manager.get_score(key=self._last_seen_key, member=instance_id)
+        if instance_id in self._last_seen:
+            last_seen = max(last_seen or 0, self._last_seen[instance_id])
+
+        return InstanceStatsTuple(
+            events={
+                field.removeprefix(EVENT_FIELD_PREFIX): count
+                for field, count in sorted(counters.items())
+                if field.startswith(EVENT_FIELD_PREFIX)
+            },
+            skipped=counters[SKIPPED_FIELD],
+            failed=counters[FAILED_FIELD],
+            last_seen=last_seen,
+        )
+
+    @property
+    def _last_seen_key(self) -> str:
+        return f"{self._prefix}:last_seen"
+
+    def _key(self, instance_id: str) -> str:
+        return f"{self._prefix}:{instance_id}"
+
+    async def _run(self) -> None:
+        """
+        Writes the counters every `EVENT_STATS_FLUSH_INTERVAL` seconds.
+        """
+        while True:
+            await asyncio.sleep(get_settings().EVENT_STATS_FLUSH_INTERVAL)
+            await self.flush()
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import Configuration, get_logger, get_settings
+from src.core.startup import StartupOrchestrator
+from src.entities.named_tuples.health_tuples import ProbeTuple
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+from src.infrastructure.database.mongo_dependency import MongoDBDependency
+from src.logic.services.notification_queue_service import NotificationQueueService
+
+logger = get_logger(name=__name__)
+
+
+class HealthService(Singleton):
+    """
+    Liveness and readiness of the process for the orchestrator.
+
+    Readiness probes Mongo, Redis, the Bot API and the notification queue. Results are cached for `HEALTH_PROBE_TTL`
+    seconds, or `HEALTH_BOT_PROBE_TTL` for the Bot API, and concurrent health checks share one probe in flight, so
+    frequent checks from several sources add no real load. The event loop lag is measured by a background loop, so a
+    process whose loop is blocked reports it on the next check instead of timing the check itself.
+
+    The process is ready when the startup has finished, Mongo and Redis respond and the event loop lag is below
+    `HEALTH_MAX_LOOP_LAG`; the Bot API, the queue depths and the Mongo connection pool statistics are reported without
+    affecting readiness, since every worker would be taken out of service by a Telegram outage.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the probe cache.
+
+        :ivar self._probes: Time and result of the last probe, by name.
+        :type self._probes: dict[str, tuple[float, ProbeTuple]]
+        :ivar self._in_flight: Probes being run, by name.
+        :type self._in_flight: dict[str, asyncio.Task]
+        :ivar self._loop_lag: Last measured event loop lag in seconds.
+        :type self._loop_lag: float
+        :ivar self._task: Background loop measuring the event loop lag.
+        :type self._task: asyncio.Task | None
+        """
+        if getattr(self, "_probes", None) is not None:
+            return
+
+        self._probes: dict[str, tuple[float, ProbeTuple]] = {}
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._loop_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """
+        Starts measuring the event loop lag.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._measure_loop_lag())
+
+    async def stop(self) -> None:
+        """
+        Stops measuring the event loop lag and cancels the probes in flight.
+        """
+        tasks = [*self._in_flight.values(), *([self._task] if self._task is not None else [])]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._in_flight.clear()
+
+    @property
+    def loop_lag(self) -> float:
+        """
+        Returns the last measured event loop lag.
+
+        :return: The lag in seconds.
+        :rtype: float
+        """
+        return self._loop_lag
+
+    async def get_readiness(self) -> dict[str, Any]:
+        """
+        Probes the dependencies of the process and reports whether it may accept traffic.
+
+        :return: The readiness, the probe results, the queue depths, the Mongo pool statistics and the event loop lag.
+        :rtype: dict[str, Any]
+        """
+        settings = get_settings()
+        mongo, redis, bot_api, queue = await asyncio.gather(
+            self._probe(name="mongo", func=self._ping_mongo, ttl=settings.HEALTH_PROBE_TTL),
+            self._probe(name="redis", func=self._ping_redis, ttl=settings.HEALTH_PROBE_TTL),
+            self._probe(name="bot_api", func=self._get_me, ttl=settings.HEALTH_BOT_PROBE_TTL),
+            self._probe(name="queue", func=self._get_queue_depths, ttl=settings.HEALTH_PROBE_TTL),
+        )
+        started = StartupOrchestrator().is_ready
+
+        return {
+            "ready": started and mongo.ok and redis.ok and self._loop_lag <= settings.HEALTH_MAX_LOOP_LAG,
+            "startup": started,
+            "loop_lag_ms": round(self._loop_lag * 1000, 1),
+            "checks": {
+                name: {"ok": probe.ok, "latency_ms": probe.latency_ms, "error": probe.error}
+                for name, probe in (("mongo", mongo), ("redis", redis), ("bot_api", bot_api))
+            },
+            "queue": queue.details if queue.ok else {"error": queue.error},
+            "mongo_pool": self._get_pool_stats(),
+        }
+
+    async def _probe(self, name: str, func: Callable[[], Awaitable[Any]], ttl: float) -> ProbeTuple:
+        """
+        Returns the cached result of a probe, running it if the result is older than `ttl`.
+
+        :param name: Name of the probe.
+        :type name: str
+        :param func: Coroutine function performing the check; its result is kept as the details of the probe.
+        :type func: Callable[[], Awaitable[Any]]
+        :param ttl: Seconds the result is cached.
+        :type ttl: float
+        :return: The result of the probe.
+        :rtype: ProbeTuple
+        """
+        cached = self._probes.get(name)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        if name not in self._in_flight:
+            self._in_flight[name] = asyncio.create_task(self._run_probe(name=name, func=func))
+
+        # shielded, so a health check that times out does not cancel the probe shared with other checks
+        return await asyncio.shield(self._in_flight[name])
+
+    async def _run_probe(self, name: str, func: Callable[[], Awaitable[Any]]) -> ProbeTuple:
+        """
+        Runs a probe with `HEALTH_PROBE_TIMEOUT` and caches its result.
+
+        :param name: Name of the probe.
+        :type name: str
+        :param func: Coroutine function performing the check.
+        :type func: Callable[[], Awaitable[Any]]
+        :return: The result of the probe.
+        :rtype: ProbeTuple
+        """
+        started = time.perf_counter()
+
+        try:
+            details = await asyncio.wait_for(func(), timeout=get_settings().HEALTH_PROBE_TIMEOUT)
+            probe = ProbeTuple(ok=True, latency_ms=self._elapsed_ms(started=started), details=details)
+        except Exception as e:
+            logger.warning("Health probe %s failed: %r", name, e)
+            probe = ProbeTuple(ok=False, latency_ms=self._elapsed_ms(started=started), error=repr(e))
+        finally:
+            self._in_flight.pop(name, None)
+
+        self._probes[name] = (time.monotonic(), probe)
+        return probe
+
+    @staticmethod
+    def _elapsed_ms(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    @staticmethod
+    async def _ping_mongo() -> None:
+        await MongoDBDependency().ping()
+
+    @staticmethod
+    def _get_pool_stats() -> dict[str, int | float]:
+        # a snapshot of the counters of the pool listener of this process, so it is not cached like the probes
+        return MongoDBDependency().get_pool_stats()._asdict()
+
+    @staticmethod
+    async def _ping_redis() -> None:
+        await RedisSessionDependency().ping()
+
+    @staticmethod
+    async def _get_me() -> str | None:
+        return (await Configuration.bot.get_me()).username
+
+    @staticmethod
+    async def _get_queue_depths() -> dict[str, int]:
+        """
+        Returns the entries waiting in the delivery lanes of this process and, with the queue enabled, in Redis.
+
+        :return: The numbers of entries by queue.
+        :rtype: dict[str, int]
+        """
+        queue = NotificationQueueService()
+        depths = {"lanes": sum(lane.depth for lane in queue.get_lane_stats())}
+
+        if get_settings().NOTIFICATIONS_QUEUE_ENABLED:
+            depths.update(await queue.get_queue_depths())
+
+        return depths
+
+    async def _measure_loop_lag(self) -> None:
+        """
+        Measures how late the event loop wakes up after sleeping `HEALTH_LOOP_LAG_INTERVAL` seconds.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            interval = get_settings().HEALTH_LOOP_LAG_INTERVAL
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self._loop_lag = max(0.0, loop.time() - expected)
@@ -0,0 +1,525 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from datetime import UTC, datetime
+from itertools import chain, groupby
+from operator import attrgetter
+
+from pydantic import ValidationError
+
+from src.core.Base.exceptions import DeliveryDeferredError, NotificationDeliveryError
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.entities.enums.notification_priority_enum import NotificationPriorityEnum
+from src.entities.named_tuples.queue_tuples import (
+    DeadLetterTuple,
+    LaneStatsTuple,
+    NotificationEntryTuple,
+)
+from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+from src.infrastructure.broker.stream_manager import RedisStreamManager
+from src.logic.services.delivery_lanes import DeliveryLanes
+from src.logic.services.project_service import ProjectService
+from src.logic.services.webhook_service import WebhookService
+from src.utils.priority_utils import PRIORITY_ORDER
+
+logger = get_logger(name=__name__)
+
+
+class NotificationQueueService(Singleton):
+    """
+    Durable queue of webhook notifications on a Redis Stream.
+
+    Webhooks are appended to the stream and consumed by a consumer group, with one consumer per process. An entry is
+    acknowledged only after the notification has been sent. Failed entries are retried with exponential backoff
+    through a sorted set and moved to a dead-letter stream after `NOTIFICATIONS_MAX_ATTEMPTS`. Entries left pending
+    by a dead consumer are reclaimed after `NOTIFICATIONS_CLAIM_IDLE_MS`.
+
+    Entries are delivered in `NOTIFICATIONS_LANES` parallel lanes sharded by chat, so the notifications of a chat are
+    sent in the order they were read while different chats do not wait for each other. When a chat falls behind, e.g.
+    under Telegram flood control, its waiting notifications are merged into messages of up to 4096 characters.
+    A chat under flood control is deferred in its lane for the time Telegram asks, up to
+    `NOTIFICATIONS_FLOOD_RETRIES` times, before its notifications are retried with backoff. When a merged batch
+    fails halfway, the notifications already sent are acknowledged and only the rest is retried.
+    Within a lane, notifications of higher priority are sent first, but none waits longer than
+    `NOTIFICATIONS_PRIORITY_MAX_WAIT` seconds behind more urgent ones.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the queue names and the consumer identity.
+
+        :ivar self._consumer: Name of this process in the consumer group.
+        :type self._consumer: str
+        :ivar self._tasks: Background loops of the consumer.
+        :type self._tasks: list[asyncio.Task]
+        :ivar self._lanes: Lanes delivering the entries read by the consumer.
+        :type self._lanes: DeliveryLanes | None
+        :ivar self._in_flight: Identifiers of the entries submitted to the lanes and not yet processed.
+        :type self._in_flight: set[str]
+        :ivar self._flood_deferrals: Number of times entries waiting in a lane were deferred by flood control.
+        :type self._flood_deferrals: dict[str, int]
+        """
+        if getattr(self, "_tasks", None) is not None:
+            return
+
+        settings = get_settings()
+        self._stream_manager = RedisStreamManager(redis_dep=RedisSessionDependency())
+        self.stream = settings.NOTIFICATIONS_STREAM
+        self.retry_schedule = f"{self.stream}:retry"
+        self.dead_letter_stream = f"{self.stream}:dead"
+        self._group = settings.NOTIFICATIONS_GROUP
+        self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: list[asyncio.Task] = []
+        self._lanes: DeliveryLanes | None = None
+        self._in_flight: set[str] = set()
+        self._flood_deferrals: dict[str, int] = {}
+
+    async def publish(
+        self,
+        instance_id: str,
+        chat_id: int,
+        payload: str | bytes,
+        priority: NotificationPriorityEnum = NotificationPriorityEnum.NORMAL,
+    ) -> str:
+        """
+        Appends a webhook notification to the stream.
+
+        :param instance_id: Identifier of the instance that received the webhook.
+        :type instance_id: str
+        :param chat_id: Chat the notification is sent to.
+        :type chat_id: int
+        :param payload: Raw JSON body of the webhook.
+        :type payload: str | bytes
+        :param priority: Delivery priority of the notification.
+        :type priority: NotificationPriorityEnum
+        :return: The identifier of the stream entry.
+        :rtype: str
+        """
+        payload = payload.decode() if isinstance(payload, bytes) else payload
+
+        return await self._stream_manager.add(
+            stream=self.stream,
+            fields={
+                "instance_id": instance_id,
+                "chat_id": chat_id,
+                "payload": payload,
+                "attempts": 0,
+                "priority": priority.value,
+            },
+        )
+
+    async def start(self) -> None:
+        """
+        Creates the consumer group and starts consuming, reclaiming and retrying entries.
+        """
+        settings = get_settings()
+
+        if not settings.NOTIFICATIONS_QUEUE_ENABLED or self._tasks:
+            return
+
+        await self._stream_manager.ensure_group(stream=self.stream, group=self._group)
+        self._lanes = DeliveryLanes(
+            count=settings.NOTIFICATIONS_LANES,
+            size=settings.NOTIFICATIONS_BATCH_SIZE,
+            handler=self._process_chat,
+            merge=settings.NOTIFICATIONS_MERGE_BACKLOG,
+            levels=len(PRIORITY_ORDER),
+            max_wait=settings.NOTIFICATIONS_PRIORITY_MAX_WAIT,
+        )
+        self._lanes.start()
+        self._tasks = [
+            asyncio.create_task(self._consume()),
+            asyncio.create_task(self._reclaim()),
+            asyncio.create_task(self._promote_retries()),
+        ]
+
+    async def stop(self) -> None:
+        """
+        Stops the background loops; unacknowledged entries stay pending and are reclaimed later.
+        """
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._lanes is not None:
+            await self._lanes.stop()
+            self._lanes = None
+        self._in_flight.clear()
+        self._flood_deferrals.clear()
+
+    def get_lane_stats(self) -> list[LaneStatsTuple]:
+        """
+        Returns the depth and delivery latency of every lane of this process.
+
+        :return: Statistics of the lanes, or an empty list if the consumer is not running.
+        :rtype: list[LaneStatsTuple]
+        """
+        return self._lanes.stats() if self._lanes is not None else []
+
+    def get_priority_stats(self) -> dict[NotificationPriorityEnum, LaneStatsTuple]:
+        """
+        Returns the depth and delivery latency of every priority class in this process.
+
+        :return: Statistics of the priority classes, or an empty dict if the consumer is not running.
+        :rtype: dict[NotificationPriorityEnum, LaneStatsTuple]
+        """
+        if self._lanes is None:
+            return {}
+
+        return dict(zip(PRIORITY_ORDER, self._lanes.level_stats()))
+
+    async def get_queue_depths(self) -> dict[str, int]:
+        """
+        Returns the number of entries waiting in the stream, in the retry schedule and in the dead-letter stream.
+
+        :return: The numbers of entries by queue.
+        :rtype: dict[str, int]
+        """
+        stream, retry, dead = await asyncio.gather(
+            self._stream_manager.length(stream=self.stream),
+            self._stream_manager.count_scheduled(schedule=self.retry_schedule),
+            self._stream_manager.length(stream=self.dead_letter_stream),
+        )
+
+        return {"stream": stream, "retry": retry, "dead": dead}
+
+    async def get_dead_letters(self, count: int) -> tuple[list[DeadLetterTuple], int]:
+        """
+        Returns the most recent dead letters and their total number.
+
+        :param count: Maximum number of dead letters to return.
+        :type count: int
+        :return: The dead letters, newest first, and the total number of dead letters.
+        :rtype: tuple[list[DeadLetterTuple], int]
+        """
+        entries = await self._stream_manager.latest(stream=self.dead_letter_stream, count=count)
+        total = await self._stream_manager.length(stream=self.dead_letter_stream)
+
+        dead_letters = [
+            DeadLetterTuple(
+                entry_id=entry_id,
+                instance_id=fields.get("instance_id", ""),
+                chat_id=int(fields.get("chat_id", 0)),
+                attempts=int(fields.get("attempts", 0)),
+                error=fields.get("error", ""),
+                failed_at=fields.get("failed_at", ""),
+            )
+            for entry_id, fields in entries
+        ]
+
+        return dead_letters, total
+
+    async def replay_dead_letters(self) -> int:
+        """
+        Moves all dead letters back to the stream with a fresh retry budget.
+
+        :return: The number of replayed notifications.
+        :rtype: int
+        """
+        replayed = 0
+        batch_size = get_settings().NOTIFICATIONS_BATCH_SIZE
+
+        while moved := await self._stream_manager.move(
+            source=self.dead_letter_stream,
+            target=self.stream,
+            count=batch_size,
+            fields_update={"attempts": 0, "error": "", "failed_at": ""},
+        ):
+            replayed += moved
+
+        logger.info("Replayed %s dead letters", replayed)
+        return replayed
+
+    async def _consume(self) -> None:
+        """
+        Reads new entries for this consumer and submits them to the lanes in stream order.
+        """
+        settings = get_settings()
+
+        while True:
+            try:
+                entries = await self._stream_manager.read_group(
+                    stream=self.stream,
+                    group=self._group,
+                    consumer=self._consumer,
+                    count=settings.NOTIFICATIONS_BATCH_SIZE,
+                    block_ms=settings.NOTIFICATIONS_BLOCK_MS,
+                )
+            except Exception:
+                logger.exception("Failed to read notifications")
+                await asyncio.sleep(1)
+                continue
+
+            await self._submit(entries=entries)
+
+    async def _reclaim(self) -> None:
+        """
+        Periodically takes over entries left unacknowledged by dead consumers.
+        """
+        settings = get_settings()
+
+        while True:
+            await asyncio.sleep(settings.NOTIFICATIONS_CLAIM_IDLE_MS / 1000)
+
+            try:
+                entries = await self._stream_manager.claim_idle(
+                    stream=self.stream,
+                    group=self._group,
+                    consumer=self._consumer,
+                    min_idle_ms=settings.NOTIFICATIONS_CLAIM_IDLE_MS,
+                    count=settings.NOTIFICATIONS_BATCH_SIZE,
+                )
+            except Exception:
+                logger.exception("Failed to reclaim notifications")
+                continue
+
+            if entries:
+                logger.warning("Reclaimed %s pending notifications", len(entries))
+
+            await self._submit(entries=entries)
+
+    async def _promote_retries(self) -> None:
+        """
+        Periodically moves retries whose backoff has expired back to the stream.
+        """
+        while True:
+            await asyncio.sleep(1)
+
+            try:
+                await self._stream_manager.promote_due(
+                    schedule=self.retry_schedule,
+                    stream=self.stream,
+                    now=time.time(),
+                    count=get_settings().NOTIFICATIONS_BATCH_SIZE,
+                )
+            except Exception:
+                logger.exception("Failed to promote notification retries")
+
+    async def _submit(self, entries: list[tuple[str, dict[str, str]]]) -> None:
+        """
+        Submits entries to the lanes of their chats, skipping the ones that are already waiting in a lane.
+
+        :param entries: The entries as pairs of identifier and fields.
+        :type entries: list[tuple[str, dict[str, str]]]
+        """
+        for entry_id, fields in entries:
+            # an entry waiting in a busy lane may exceed the idle time and be reclaimed by this consumer
+            if entry_id in self._in_flight:
+                continue
+
+            entry = self._to_entry(entry_id=entry_id, fields=fields)
+            self._in_flight.add(entry_id)
+            await self._lanes.submit(chat_id=entry.chat_id, item=entry, level=PRIORITY_ORDER.index(entry.priority))
+
+    async def _process_chat(self, entries: list[NotificationEntryTuple]) -> None:
+        """
+        Processes the entries of one chat taken from a lane.
+
+        A chat backlog is delivered in merged messages; only consecutive entries of the same instance are merged,
+        since the instance defines the language and the thread of the messages.
+
+        :param entries: The entries of the chat in stream order.
+        :type entries: list[NotificationEntryTuple]
+        :raises DeliveryDeferredError: If the chat is under flood control, with the entries that were not delivered.
+        """
+        if len(entries) > 1:
+            logger.info("Merging a backlog of %s notifications for chat %s", len(entries), entries[0].chat_id)
+
+        runs = [list(run) for _, run in groupby(entries, key=attrgetter("instance_id"))]
+
+        for index, run in enumerate(runs):
+            try:
+                await self._process(entries=run)
+            except DeliveryDeferredError as e:
+                # the later notifications of the chat wait behind the deferred ones
+                e.items.extend(chain.from_iterable(runs[index + 1 :]))
+                raise
+
+    async def _process(self, entries: list[NotificationEntryTuple]) -> None:
+        """
+        Delivers entries of one instance and acknowledges them, or schedules retries or dead letters on failure.
+
+        :param entries: The stream entries.
+        :type entries: list[NotificationEntryTuple]
+        :raises DeliveryDeferredError: If the chat is under flood control, with the entries that were not delivered.
+        """
+        valid_entries, payloads, deferred = [], [], []
+
+        try:
+            for entry in entries:
+                try:
+                    payloads.append(WebhookPayload.model_validate_json(entry.payload))
+                    valid_entries.append(entry)
+                except ValidationError as e:
+                    # a malformed payload never succeeds, so it is not retried
+                    await self._dead_letter(entry=entry, error=str(e))
+
+            if not valid_entries:
+                return
+
+            try:
+                await self.deliver(instance_id=valid_entries[0].instance_id, payloads=payloads)
+            except NotificationDeliveryError as e:
+                sent, failed = valid_entries[: e.delivered], valid_entries[e.delivered :]
+
+                # the notifications already sent are acknowledged, so a retry does not send them twice
+                if sent:
+                    await self._stream_manager.ack(
+                        stream=self.stream, group=self._group, entry_ids=[entry.entry_id for entry in sent]
+                    )
+
+                if e.retry_after is not None and self._defer(entries=failed):
+                    deferred = failed
+                    raise DeliveryDeferredError(message=e.message, items=failed, delay=e.retry_after) from e
+
+                for entry in failed:
+                    await self._retry(entry=entry, error=e.message)
+            except Exception as e:
+                for entry in valid_entries:
+                    await self._retry(entry=entry, error=repr(e))
+            else:
+                await self._stream_manager.ack(
+                    stream=self.stream, group=self._group, entry_ids=[entry.entry_id for entry in valid_entries]
+                )
+        finally:
+            done = [entry.entry_id for entry in entries if entry not in deferred]
+            self._in_flight.difference_update(done)
+            for entry_id in done:
+                self._flood_deferrals.pop(entry_id, None)
+
+    def _defer(self, entries: list[NotificationEntryTuple]) -> bool:
+        """
+        Counts a flood control deferral of entries unless they have been deferred `NOTIFICATIONS_FLOOD_RETRIES` times.
+
+        :param entries: The entries held back by flood control.
+        :type entries: list[NotificationEntryTuple]
+        :return: True if the entries may wait in their lane, False if they must be retried with backoff.
+        :rtype: bool
+        """
+        deferrals = max(self._flood_deferrals.get(entry.entry_id, 0) for entry in entries)
+
+        if deferrals >= get_settings().NOTIFICATIONS_FLOOD_RETRIES:
+            return False
+
+        for entry in entries:
+            self._flood_deferrals[entry.entry_id] = deferrals + 1
+
+        return True
+
+    @staticmethod
+    async def deliver(instance_id: str, payloads: list[WebhookPayload]) -> None:
+        """
+        Renders and sends the notifications of an instance, merged into as few messages as possible.
+
+        :param instance_id: Identifier of the instance that received the webhooks.
+        :type instance_id: str
+        :param payloads: The webhooks in stream order.
+        :type payloads: list[WebhookPayload]
+        :raises NotificationDeliveryError: If a message could not be sent, with the number of payloads done before.
+        """
+        project = await ProjectService().get_instance(instance_id=instance_id)
+        kept = [index for index, wh_data in enumerate(payloads) if project and wh_data.type in project.instances[0].fat]
+
+        if not kept:
+            logger.info("Dropped notifications of a removed or changed instance %s", instance_id)
+            return
+
+        try:
+            await WebhookService.process_wh_batch(wh_data_list=[payloads[index] for index in kept], project=project)
+        except NotificationDeliveryError as e:
+            # dropped notifications before the first unsent one are acknowledged with the sent ones
+            e.delivered = kept[e.delivered] if e.delivered < len(kept) else len(payloads)
+            raise
+
+    async def _retry(self, entry: NotificationEntryTuple, error: str) -> None:
+        """
+        Schedules the entry for a retry with exponential backoff or moves it to the dead letters.
+
+        :param entry: The failed stream entry.
+        :type entry: NotificationEntryTuple
+        :param error: Description of the failure.
+        :type error: str
+        """
+        settings = get_settings()
+        attempts = entry.attempts + 1
+
+        if attempts >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+            await self._dead_letter(entry=entry._replace(attempts=attempts), error=error)
+            return
+
+        delay = min(settings.NOTIFICATIONS_BACKOFF_BASE * 2 ** (attempts - 1), settings.NOTIFICATIONS_BACKOFF_MAX)
+        logger.warning(
+            "Notification %s failed (attempt %s), retrying in %s s: %s", entry.entry_id, attempts, delay, error
+        )
+
+        member = json.dumps(
+            {
+                "instance_id": entry.instance_id,
+                "chat_id": str(entry.chat_id),
+                "payload": entry.payload,
+                "attempts": str(attempts),
+                "priority": entry.priority.value,
+            }
+        )
+        await self._stream_manager.ack_and_schedule(
+            stream=self.stream,
+            group=self._group,
+            entry_id=entry.entry_id,
+            schedule=self.retry_schedule,
+            member=member,
+            due=time.time() + delay,
+        )
+
+    async def _dead_letter(self, entry: NotificationEntryTuple, error: str) -> None:
+        """
+        Moves the entry to the dead-letter stream.
+
+        :param entry: The failed stream entry.
+        :type entry: NotificationEntryTuple
+        :param error: Description of the failure.
+        :type error: str
+        """
+        logger.error("Notification %s moved to dead letters: %s", entry.entry_id, error)
+
+        await self._stream_manager.ack_and_add(
+            stream=self.stream,
+            group=self._group,
+            entry_id=entry.entry_id,
+            target=self.dead_letter_stream,
+            fields={
+                "instance_id": entry.instance_id,
+                "chat_id": entry.chat_id,
+                "payload": entry.payload,
+                "attempts": entry.attempts,
+                "priority": entry.priority.value,
+                "error": error[:1000],
+                "failed_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            },
+        )
+
+    @staticmethod
+    def _to_entry(entry_id: str, fields: dict[str, str]) -> NotificationEntryTuple:
+        """
+        Converts raw stream fields into an entry.
+
+        :param entry_id: Identifier of the stream entry.
+        :type entry_id: str
+        :param fields: Raw fields of the entry.
+        :type fields: dict[str, str]
+        :return: The parsed entry.
+        :rtype: NotificationEntryTuple
+        """
+        return NotificationEntryTuple(
+            entry_id=entry_id,
+            instance_id=fields.get("instance_id", ""),
+            chat_id=int(fields.get("chat_id", 0)),
+            payload=fields.get("payload", ""),
+            attempts=int(fields.get("attempts", 0)),
+            priority=NotificationPriorityEnum(fields.get("priority", NotificationPriorityEnum.NORMAL)),
+        )
@@ -8,8 +8,10 @@ from src.entities.named_tuples.mongo_tuples import AggregateTuple
 from src.entities.schemas.project_data.project_schemas import (
     InstanceCreateModel,
     InstanceModel,
+    InstanceSummaryModel,
     ProjectCreateSchema,
     ProjectSchema,
+    ProjectSummarySchema,
 )
 from src.infrastructure.database.mongo_dependency import MongoDBDependency
 from src.infrastructure.database.mongo_manager import MongoManager
@@ -35,6 +37,14 @@ class ProjectService:
         await self.mongo_manager.create_indexes()
 
     async def get_projects(self, page: int) -> AggregateTuple:
+        """
+        Retrieves a page of projects projected to the fields required by the projects keyboard.
+
+        :param page: Page number to retrieve.
+        :type page: int
+        :return: Paginated project summaries and the total number of projects.
+        :rtype: AggregateTuple
+        """
         offset = page * self.limit
 
         pipeline = [
@@ -43,6 +53,7 @@ class ProjectService:
                     "items": [
                         {"$skip": offset},
                         {"$limit": self.limit},
+                        {"$project": {"_id": 1, "name": 1}},
                     ],
                     "total": [{"$count": "count"}],
                 }
@@ -50,7 +61,7 @@ class ProjectService:
         ]
 
         return await self.mongo_manager.aggregate(
-            pipeline=pipeline, collection=self.collection, schema=ProjectSchema, item_key="items"
+            pipeline=pipeline, collection=self.collection, schema=ProjectSummarySchema, item_key="items"
         )
 
     async def get_project(self, project_id: str) -> ProjectSchema | None:
@@ -106,20 +117,39 @@ class ProjectService:
         return str(instance.instance_id)
 
     async def get_paginated_instances(self, project_id, page: int) -> AggregateTuple:
+        """
+        Retrieves a page of project instances projected to the fields required by the instances keyboard.
+
+        :param project_id: Identifier of the project that owns the instances.
+        :type project_id: str
+        :param page: Page number to retrieve.
+        :type page: int
+        :return: Paginated instance summaries and the total number of instances in the project.
+        :rtype: AggregateTuple
+        """
         offset = page * self.limit
 
         pipeline = [
             {"$match": {"_id": ObjectId(project_id)}},  # Убедитесь, что передаете правильный ObjectId
             {
                 "$project": {
-                    "instances": {"$slice": ["$instances", offset, self.limit]},
+                    "instances": {
+                        "$map": {
+                            "input": {"$slice": ["$instances", offset, self.limit]},
+                            "as": "instance",
+                            "in": {
+                                "instance_id": "$$instance.instance_id",
+                                "instance_name": "$$instance.instance_name",
+                            },
+                        }
+                    },
                     "total": {"$size": "$instances"},
                 }
             },
         ]
 
         return await self.mongo_manager.aggregate(
-            pipeline=pipeline, collection=self.collection, schema=InstanceModel, item_key="instances"
+            pipeline=pipeline, collection=self.collection, schema=InstanceSummaryModel, item_key="instances"
         )
 
     async def get_instance(self, instance_id: str) -> ProjectSchema | None:
@@ -148,7 +178,7 @@ class ProjectService:
             item_key="items",
         )
 
-        return document_list[0]
+        return document_list[0] if document_list else None
 
     async def delete_project(self, project_id: str) -> None:
         return await self.mongo_manager.delete_one_by_id(
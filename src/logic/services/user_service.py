@@ -52,6 +52,14 @@ class UserService:
         )
 
     async def get_admins(self, page: int) -> AggregateTuple:
+        """
+        Retrieves a page of administrators projected to the fields required by the admins keyboard.
+
+        :param page: Page number to retrieve.
+        :type page: int
+        :return: Paginated administrator summaries and the total number of administrators.
+        :rtype: AggregateTuple
+        """
         limit = get_settings().ITEMS_PER_PAGE
         offset = page * limit
 
@@ -62,6 +70,7 @@ class UserService:
                     "items": [
                         {"$skip": offset},
                         {"$limit": limit},
+                        {"$project": {"_id": 1, "first_name": 1, "last_name": 1, "is_admin": 1}},
                     ],
                     "total": [{"$count": "count"}],
                 }
@@ -0,0 +1,170 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.entities.enums.archive_codec_enum import ArchiveCodecEnum
+from src.entities.enums.collection_enum import DBCollectionEnum
+from src.entities.schemas.archive_data.archive_schemas import ArchivedWebhookModel
+from src.infrastructure.database.mongo_dependency import MongoDBDependency
+from src.infrastructure.database.mongo_manager import MongoManager
+from src.utils.compression_utils import compress_bodies
+
+logger = get_logger(name=__name__)
+
+
+class WebhookArchive(Singleton):
+    """
+    Archive of raw webhook bodies in a Mongo collection with a TTL index, used to replay real traffic.
+
+    Webhooks are buffered in memory and written in batches of `WEBHOOK_ARCHIVE_BATCH_SIZE`, or every
+    `WEBHOOK_ARCHIVE_FLUSH_INTERVAL` seconds, compressed in a worker thread, so the archive adds neither a database
+    round trip nor compression to the handling of a webhook. The archive is best effort: a failed batch is logged and
+    dropped, and webhooks are not archived while `WEBHOOK_ARCHIVE_MAX_BUFFER` of them are waiting.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the buffer.
+
+        :ivar self._buffer: Instance, time and raw body of the webhooks waiting to be written.
+        :type self._buffer: list[tuple[str, datetime, bytes]]
+        :ivar self._task: Background loop writing the batches.
+        :type self._task: asyncio.Task | None
+        :ivar self._full: Event set when a batch is ready to be written.
+        :type self._full: asyncio.Event
+        """
+        if getattr(self, "_buffer", None) is not None:
+            return
+
+        self._mongo_manager = MongoManager(MongoDBDependency())
+        self._buffer: list[tuple[str, datetime, bytes]] = []
+        self._task: asyncio.Task | None = None
+        self._full = asyncio.Event()
+        self._skipped = 0
+
+    async def start(self) -> None:
+        """
+        Creates the indexes of the archive and starts writing batches.
+        """
+        settings = get_settings()
+
+        if not settings.WEBHOOK_ARCHIVE_ENABLED or self._task is not None:
+            return
+
+        await self._mongo_manager.create_archive_indexes(expire_after=settings.WEBHOOK_ARCHIVE_TTL_DAYS * 86400)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the background loop and writes the remaining webhooks.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        await self.flush()
+
+    def add(self, instance_id: str, body: bytes) -> None:
+        """
+        Buffers a webhook for the archive.
+
+        :param instance_id: Unique identifier of the instance that received the webhook.
+        :type instance_id: str
+        :param body: The raw request body.
+        :type body: bytes
+        """
+        if self._task is None:
+            return
+
+        settings = get_settings()
+
+        if len(self._buffer) >= settings.WEBHOOK_ARCHIVE_MAX_BUFFER:
+            self._skipped += 1
+            return
+
+        self._buffer.append((instance_id, datetime.now(UTC), body))
+
+        if len(self._buffer) >= settings.WEBHOOK_ARCHIVE_BATCH_SIZE:
+            self._full.set()
+
+    async def flush(self) -> int:
+        """
+        Compresses and writes the buffered webhooks.
+
+        :return: The number of written webhooks.
+        :rtype: int
+        """
+        batch, self._buffer = self._buffer, []
+        self._full.clear()
+
+        if self._skipped:
+            logger.warning("%s webhooks were not archived, the archive buffer was full", self._skipped)
+            self._skipped = 0
+
+        if not batch:
+            return 0
+
+        settings = get_settings()
+        codec = ArchiveCodecEnum(settings.WEBHOOK_ARCHIVE_CODEC)
+
+        try:
+            bodies = await asyncio.to_thread(
+                compress_bodies, [body for _, _, body in batch], codec, settings.WEBHOOK_ARCHIVE_LEVEL
+            )
+            await self._mongo_manager.insert_documents(
+                collection=DBCollectionEnum.WEBHOOK_ARCHIVE,
+                documents=[
+                    ArchivedWebhookModel(
+                        instance_id=instance_id, received_at=received_at, codec=codec, body=body
+                    ).model_dump()
+                    for (instance_id, received_at, _), body in zip(batch, bodies)
+                ],
+            )
+        except Exception:
+            logger.exception("Failed to archive %s webhooks", len(batch))
+            return 0
+
+        return len(batch)
+
+    def iterate(
+        self, since: datetime, until: datetime, instance_id: str | None = None
+    ) -> AsyncGenerator[ArchivedWebhookModel, None]:
+        """
+        Yields the archived webhooks of a period in the order they were received.
+
+        :param since: Start of the period.
+        :type since: datetime
+        :param until: End of the period.
+        :type until: datetime
+        :param instance_id: Unique identifier of the instance, all instances if not set.
+        :type instance_id: str | None
+        :return: An asynchronous generator of the archived webhooks.
+        :rtype: AsyncGenerator[ArchivedWebhookModel, None]
+        """
+        filter_query: dict = {"received_at": {"$gte": since, "$lt": until}}
+        if instance_id is not None:
+            filter_query["instance_id"] = instance_id
+
+        return self._mongo_manager.find_stream(
+            collection=DBCollectionEnum.WEBHOOK_ARCHIVE,
+            schema=ArchivedWebhookModel,
+            filter_query=filter_query,
+            sort=[("received_at", 1)],
+        )
+
+    async def _run(self) -> None:
+        """
+        Writes a batch when it is full or when the flush interval has passed.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=get_settings().WEBHOOK_ARCHIVE_FLUSH_INTERVAL)
+            except TimeoutError:
+                pass
+
+            await self.flush()
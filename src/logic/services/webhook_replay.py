@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import datetime
+
+from pydantic import ValidationError
+
+from src.core.settings import get_logger
+from src.entities.named_tuples.archive_tuples import ReplayStatsTuple
+from src.entities.schemas.project_data.project_schemas import ProjectSchema
+from src.logic.services.event_filter import EventFilter
+from src.logic.services.project_service import ProjectService
+from src.logic.services.webhook_archive import WebhookArchive
+from src.logic.services.webhook_service import WebhookService
+from src.logic.web_app_logic.webhook_parser import (
+    is_subscribed,
+    parse_webhook,
+    peek_webhook_event,
+    shrink_webhook,
+)
+from src.utils.compression_utils import decompress_body
+from src.utils.msg_formatter_utils import get_message
+
+logger = get_logger(name=__name__)
+
+
+async def replay_webhooks(
+    since: datetime,
+    until: datetime,
+    instance_id: str | None = None,
+    speed: float | None = None,
+    dry_run: bool = True,
+) -> ReplayStatsTuple:
+    """
+    Re-drives archived webhooks through the webhook pipeline with the current configuration of the instances.
+
+    Every webhook passes the same checks as in the webhook route: the followed event types, the size of the fields,
+    the validation and the filter rules. A dry run renders the notifications and discards them, otherwise they are
+    sent by `WebhookService` to the chats of the instances.
+
+    :param since: Start of the period.
+    :type since: datetime
+    :param until: End of the period.
+    :type until: datetime
+    :param instance_id: Unique identifier of the instance, all instances if not set.
+    :type instance_id: str | None
+    :param speed: How many times faster than received the webhooks are replayed, as fast as possible if not set.
+    :type speed: float | None
+    :param dry_run: Whether the notifications are only rendered instead of being sent.
+    :type dry_run: bool
+    :return: The number of replayed, skipped and failed webhooks and the duration of the replay.
+    :rtype: ReplayStatsTuple
+    """
+    projects: dict[str, ProjectSchema | None] = {}
+    replayed = skipped = failed = 0
+    started = time.perf_counter()
+    first_received_at: datetime | None = None
+
+    async for archived in WebhookArchive().iterate(since=since, until=until, instance_id=instance_id):
+        if speed:
+            first_received_at = first_received_at or archived.received_at
+            delay = (archived.received_at - first_received_at).total_seconds() / speed
+            await asyncio.sleep(max(0.0, started + delay - time.perf_counter()))
+
+        if archived.instance_id not in projects:
+            projects[archived.instance_id] = await ProjectService().get_instance(instance_id=archived.instance_id)
+
+        if (project := projects[archived.instance_id]) is None:
+            skipped += 1
+            continue
+
+        instance = project.instances[0]
+
+        try:
+            body = decompress_body(body=archived.body, codec=archived.codec)
+            if not is_subscribed(header=peek_webhook_event(body=body), instance=instance):
+                skipped += 1
+                continue
+
+            wh_data = parse_webhook(body=shrink_webhook(body=body))
+            if not EventFilter().allow(payload=wh_data, instance=instance):
+                skipped += 1
+                continue
+
+            if dry_run:
+                get_message(payload=wh_data, lang=instance.language)
+            else:
+                await WebhookService.process_wh_data(wh_data=wh_data, project=project)
+        except ValidationError:
+            logger.warning("Archived webhook of instance %s is not valid", archived.instance_id)
+            failed += 1
+            continue
+        except Exception:
+            logger.exception("Failed to replay a webhook of instance %s", archived.instance_id)
+            failed += 1
+            continue
+
+        replayed += 1
+
+    return ReplayStatsTuple(replayed=replayed, skipped=skipped, failed=failed, elapsed=time.perf_counter() - started)
@@ -1,7 +1,25 @@
-from src.entities.schemas.project_data.project_schemas import ProjectSchema
+import asyncio
+
+from aiogram.exceptions import TelegramRetryAfter
+
+from src.core.Base.exceptions import ChatUnavailableError, NotificationDeliveryError
+from src.core.settings import get_logger
+from src.entities.schemas.project_data.project_schemas import (
+    InstanceModel,
+    ProjectSchema,
+)
+from src.entities.schemas.webhook_data.diff_webhook_schemas import DiffBaseAttachment
 from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+from src.logic.services.chat_circuit_breaker import ChatCircuitBreaker
+from src.logic.services.event_stats import EventStats
+from src.utils.attachment_utils import send_attachments
 from src.utils.msg_formatter_utils import get_message
-from src.utils.send_message_utils import send_message
+from src.utils.send_message_utils import send_notification
+from src.utils.text_utils import pack_texts
+
+logger = get_logger(name=__name__)
+
+MESSAGE_MAX_LENGTH = 4096
 
 
 class WebhookService:
@@ -10,13 +28,87 @@ class WebhookService:
         wh_data: WebhookPayload,
         project: ProjectSchema,
     ) -> ProjectSchema | None:
+        await WebhookService.process_wh_batch(wh_data_list=[wh_data], project=project)
+
+    @staticmethod
+    async def process_wh_batch(wh_data_list: list[WebhookPayload], project: ProjectSchema) -> None:
+        """
+        Renders webhooks of one instance and sends them merged into as few messages as possible.
+
+        Every webhook is rendered by `get_message` as its own block, and consecutive blocks are joined while the
+        message stays within the Telegram length limit.
+
+        The attachments of the sent webhooks are uploaded concurrently once their texts have been sent, so a text
+        that is sent again after a failure never uploads them twice. Attachments are best effort: their failures are
+        logged and do not fail the notifications.
+
+        :param wh_data_list: Webhooks in the order they must be delivered.
+        :type wh_data_list: list[WebhookPayload]
+        :param project: Project with the instance receiving the webhooks.
+        :type project: ProjectSchema
+        :raises NotificationDeliveryError: If a message could not be sent, with the number of webhooks sent before.
+        """
         instance = project.instances[0]
-        text, attachments = get_message(payload=wh_data, lang=instance.language)
-
-        await send_message(
-            chat_id=instance.chat_id,
-            text=text,
-            message_thread_id=instance.thread_id,
-            link_preview_options=None,
-            disable_web_page_preview=True,
+        breaker = ChatCircuitBreaker()
+
+        # notifications for an unavailable chat are dropped before they are rendered
+        if not breaker.allow(instance=instance):
+            logger.debug("Skipped %s notifications for unavailable chat %s", len(wh_data_list), instance.chat_id)
+            EventStats().record_failures(instance_id=instance.instance_id, count=len(wh_data_list))
+            return
+
+        rendered = [get_message(payload=wh_data, lang=instance.language) for wh_data in wh_data_list]
+        delivered, error = 0, None
+
+        try:
+            for message in pack_texts(texts=[text for text, _ in rendered], limit=MESSAGE_MAX_LENGTH):
+                await send_notification(
+                    chat_id=instance.chat_id,
+                    text=message.text,
+                    message_thread_id=instance.thread_id,
+                    link_preview_options=None,
+                    disable_web_page_preview=True,
+                )
+                delivered += message.count
+        except ChatUnavailableError as e:
+            EventStats().record_failures(instance_id=instance.instance_id, count=len(wh_data_list) - delivered)
+            await breaker.record_failure(instance=instance, error=e.message)
+            return
+        except Exception as e:
+            error = e
+        else:
+            await breaker.record_success(instance=instance)
+
+        await asyncio.gather(
+            *(
+                WebhookService._send_attachments(instance=instance, attachments=attachments)
+                for _, attachments in rendered[:delivered]
+            )
         )
+
+        if error is None:
+            return
+
+        retry_after = error.retry_after if isinstance(error, TelegramRetryAfter) else None
+        # notifications held back by flood control are delivered later, so they are not counted as failed
+        if retry_after is None:
+            EventStats().record_failures(instance_id=instance.instance_id, count=len(wh_data_list) - delivered)
+
+        raise NotificationDeliveryError(message=repr(error), delivered=delivered, retry_after=retry_after) from error
+
+    @staticmethod
+    async def _send_attachments(instance: InstanceModel, attachments: list[DiffBaseAttachment]) -> None:
+        """
+        Sends the attachments of a webhook, logging a failure instead of raising it.
+
+        :param instance: The instance receiving the webhook.
+        :type instance: InstanceModel
+        :param attachments: New attachments of the webhook.
+        :type attachments: list[DiffBaseAttachment]
+        """
+        try:
+            await send_attachments(
+                chat_id=instance.chat_id, attachments=attachments, message_thread_id=instance.thread_id
+            )
+        except Exception:
+            logger.exception("Failed to send attachments to chat %s", instance.chat_id)
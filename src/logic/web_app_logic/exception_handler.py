@@ -8,7 +8,7 @@ from src.utils.text_utils import get_service_text
 logger = get_logger(name=__name__)
 
 
-async def handling_exceptions(app: FastAPI) -> FastAPI:
+def handling_exceptions(app: FastAPI) -> FastAPI:
     @app.exception_handler(MessageFormatterError)
     async def handle_exception(request: Request, exc: MessageFormatterError):
         logger.critical("Error: %s", exc.message, exc_info=True)
@@ -0,0 +1,91 @@
+from redis.exceptions import RedisError
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import get_logger, get_settings
+from src.infrastructure.broker.redis_dependency import RedisSessionDependency
+from src.infrastructure.broker.redis_manager import RedisManager
+
+logger = get_logger(name=__name__)
+
+
+class UpdateDeduplicator(Singleton):
+    """
+    Drops Telegram updates that have already been received.
+
+    Telegram redelivers an update when the webhook answers too slowly. Recently seen `update_id` values are kept in a
+    sliding in-memory window; with `UPDATES_DEDUP_REDIS` enabled they are also claimed in Redis, so a redelivery that
+    lands on another worker or replica is dropped as well.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the in-memory window.
+
+        :ivar self._seen: Recently seen update ids in arrival order.
+        :type self._seen: dict[int, None]
+        """
+        if getattr(self, "_seen", None) is not None:
+            return
+
+        settings = get_settings()
+        self._seen: dict[int, None] = {}
+        self._window_size = settings.UPDATES_DEDUP_WINDOW
+        self._redis_manager = RedisManager(redis_dep=RedisSessionDependency()) if settings.UPDATES_DEDUP_REDIS else None
+        self._key_prefix = settings.UPDATES_DEDUP_KEY_PREFIX
+        self._ttl = settings.UPDATES_DEDUP_TTL
+
+    async def is_duplicate(self, update_id: int) -> bool:
+        """
+        Checks whether the update has already been received and remembers it otherwise.
+
+        Redis errors are logged and the update is processed, since losing the guard is preferable to losing updates.
+
+        :param update_id: The identifier of the incoming update.
+        :type update_id: int
+        :return: True if the update is a redelivery, False otherwise.
+        :rtype: bool
+        """
+        if update_id in self._seen:
+            return True
+
+        self._remember(update_id=update_id)
+
+        if self._redis_manager is None:
+            return False
+
+        try:
+            return not await self._redis_manager.set_if_absent(
+                key=f"{self._key_prefix}:{update_id}", value="1", ttl=self._ttl
+            )
+        except RedisError:
+            logger.exception("Failed to check update %s in Redis", update_id)
+            return False
+
+    async def forget(self, update_id: int) -> None:
+        """
+        Removes the update from the guard so that a redelivery of a failed update is processed again.
+
+        :param update_id: The identifier of the failed update.
+        :type update_id: int
+        """
+        self._seen.pop(update_id, None)
+
+        if self._redis_manager is None:
+            return
+
+        try:
+            await self._redis_manager.delete_data(key=f"{self._key_prefix}:{update_id}")
+        except RedisError:
+            logger.exception("Failed to release update %s in Redis", update_id)
+
+    def _remember(self, update_id: int) -> None:
+        """
+        Adds the update id to the window and evicts the oldest ones beyond its size.
+
+        :param update_id: The identifier of the incoming update.
+        :type update_id: int
+        """
+        self._seen[update_id] = None
+
+        while len(self._seen) > self._window_size:
+            del self._seen[next(iter(self._seen))]
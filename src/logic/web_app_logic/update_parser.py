@@ -0,0 +1,48 @@
+from functools import cache
+
+from aiogram.types import Update
+from aiogram.types.update import UpdateTypeLookupError
+
+from src.core.settings import Configuration, get_logger
+
+logger = get_logger(name=__name__)
+
+
+@cache
+def get_allowed_update_types() -> frozenset[str]:
+    """
+    Returns the update types handled by the registered routers.
+
+    Resolved once, on the first update, when all routers have already been registered at startup.
+
+    :return: The set of allowed update types.
+    :rtype: frozenset[str]
+    """
+    return frozenset(Configuration.dispatcher.resolve_used_update_types())
+
+
+def parse_update(body: bytes) -> Update | None:
+    """
+    Validates a raw webhook body into an Update bound to the bot.
+
+    The body is validated once, directly from JSON and in the bot context, so the dispatcher does not have to
+    rebuild the update to mount the bot. Updates of types without handlers are rejected.
+
+    :param body: The raw request body sent by Telegram.
+    :type body: bytes
+    :return: The parsed update, or None if its type is not handled.
+    :rtype: Update | None
+    :raises ValidationError: If the body is not a valid update.
+    """
+    update = Update.model_validate_json(body, context={"bot": Configuration.bot})
+
+    try:
+        event_type = update.event_type
+    except UpdateTypeLookupError:
+        event_type = None
+
+    if event_type not in get_allowed_update_types():
+        logger.debug("Skipped update %s of unhandled type %s", update.update_id, event_type)
+        return None
+
+    return update
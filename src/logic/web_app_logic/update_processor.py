@@ -0,0 +1,176 @@
+import asyncio
+from functools import partial
+from typing import Any
+
+from aiogram.methods import TelegramMethod
+from aiogram.types import InputFile, Update
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import Configuration, get_logger, get_settings
+from src.logic.web_app_logic.update_deduplicator import UpdateDeduplicator
+
+logger = get_logger(name=__name__)
+
+
+class UpdateProcessor(Singleton):
+    """
+    Feeds Telegram updates to the dispatcher in a bounded pool of background tasks.
+
+    The webhook is acknowledged as soon as the update is scheduled, or after `UPDATES_REPLY_TIMEOUT` seconds at most.
+    If the handler finishes within that time and returns a Bot API method, the method is sent back inline in the
+    webhook response instead of a separate request; otherwise it is executed from the background task.
+
+    A failed update is removed from the `UpdateDeduplicator`, so that a redelivery by Telegram is processed again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the task pool.
+
+        :ivar self._semaphore: Limits the number of updates processed concurrently.
+        :type self._semaphore: asyncio.Semaphore
+        :ivar self._tasks: Updates currently being processed.
+        :type self._tasks: set[asyncio.Task]
+        """
+        if getattr(self, "_tasks", None) is not None:
+            return
+
+        self._semaphore = asyncio.Semaphore(get_settings().UPDATES_MAX_CONCURRENCY)
+        self._reply_timeout = get_settings().UPDATES_REPLY_TIMEOUT
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of updates currently being processed.
+
+        :return: The number of running update tasks.
+        :rtype: int
+        """
+        return len(self._tasks)
+
+    async def process(self, update: Update) -> dict[str, str] | None:
+        """
+        Schedules an update and waits for the handler result for at most the reply timeout.
+
+        Waits for a free slot when the pool is full, which slows down acknowledgements instead of growing the
+        backlog without limit.
+
+        :param update: The incoming update.
+        :type update: Update
+        :return: The form fields of the Bot API method to send inline in the webhook response, or None.
+        :rtype: dict[str, str] | None
+        """
+        await self._semaphore.acquire()
+
+        task = asyncio.create_task(self._feed_update(update=update))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        if self._reply_timeout > 0:
+            await asyncio.wait({task}, timeout=self._reply_timeout)
+
+        if task.done() and not task.cancelled() and task.exception() is None:
+            if isinstance(result := task.result(), TelegramMethod):
+                if (reply := build_webhook_reply(method=result)) is not None:
+                    return reply
+
+                self._call_in_background(result)
+        else:
+            task.add_done_callback(partial(self._on_background_done, update_id=update.update_id))
+
+        return None
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Waits for the updates that are still being processed.
+
+        :param timeout: Maximum time to wait in seconds; the remaining tasks are cancelled afterwards.
+        :type timeout: float | None
+        """
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            logger.warning("Cancelled %s unprocessed updates on shutdown", len(pending))
+
+    async def _feed_update(self, update: Update) -> Any:
+        """
+        Feeds the update to the dispatcher and releases the pool slot afterwards.
+
+        :param update: The incoming update.
+        :type update: Update
+        :return: The result returned by the handler.
+        :rtype: Any
+        """
+        try:
+            return await Configuration.dispatcher.feed_update(Configuration.bot, update)
+        finally:
+            self._semaphore.release()
+
+    def _on_background_done(self, task: asyncio.Task, update_id: int) -> None:
+        """
+        Logs failures of background updates and executes the method returned by the handler.
+
+        :param task: The finished update task.
+        :type task: asyncio.Task
+        :param update_id: The identifier of the update, released from the deduplication guard if it failed.
+        :type update_id: int
+        """
+        if task.cancelled():
+            return
+
+        if (exception := task.exception()) is not None:
+            logger.error("Failed to process update %s", update_id, exc_info=exception)
+            self._track(asyncio.create_task(UpdateDeduplicator().forget(update_id=update_id)))
+            return
+
+        if isinstance(result := task.result(), TelegramMethod):
+            self._call_in_background(result)
+
+    def _call_in_background(self, method: TelegramMethod) -> None:
+        """
+        Executes a Bot API method that cannot be returned inline.
+
+        :param method: The method returned by the handler.
+        :type method: TelegramMethod
+        """
+        self._track(
+            asyncio.create_task(Configuration.dispatcher.silent_call_request(bot=Configuration.bot, result=method))
+        )
+
+    def _track(self, task: asyncio.Task) -> None:
+        """
+        Keeps a follow-up task of an update until it finishes, so that it is awaited on shutdown.
+
+        :param task: The follow-up task.
+        :type task: asyncio.Task
+        """
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def build_webhook_reply(method: TelegramMethod) -> dict[str, str] | None:
+    """
+    Serialises a Bot API method into the form fields of a webhook response.
+
+    :param method: The method to send inline.
+    :type method: TelegramMethod
+    :return: The form fields including the method name, or None if the method uploads files, which cannot be sent
+        through the webhook response.
+    :rtype: dict[str, str] | None
+    """
+    bot = Configuration.bot
+    fields = {"method": method.__api_method__}
+    files: dict[str, InputFile] = {}
+
+    for key, value in method.model_dump(warnings=False).items():
+        value = bot.session.prepare_value(value, bot=bot, files=files)
+        if value:
+            fields[key] = value
+
+    return None if files else fields
@@ -0,0 +1,133 @@
+import json
+from typing import Any
+
+from fastapi import HTTPException, Request
+from pydantic import TypeAdapter
+from starlette import status
+
+from src.core.settings import get_settings
+from src.entities.schemas.project_data.project_schemas import InstanceModel
+from src.entities.schemas.webhook_data.webhook_payload_schemas import (
+    WebhookEventHeader,
+    WebhookPayload,
+)
+
+# a TypedDict adapter reads the two keys straight from the JSON and skips the rest without building objects for it
+_header_adapter = TypeAdapter(WebhookEventHeader)
+
+
+async def read_webhook_body(request: Request, max_size: int) -> bytes:
+    """
+    Reads the request body chunk by chunk and stops as soon as it exceeds the size limit.
+
+    :param request: The incoming request.
+    :type request: Request
+    :param max_size: Maximum size of the body in bytes.
+    :type max_size: int
+    :return: The raw body.
+    :rtype: bytes
+    :raises HTTPException: If the announced or the actual size of the body exceeds the limit.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Webhook is too large")
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Webhook is too large")
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def _truncate_strings(value: Any, max_length: int) -> Any:
+    """
+    Cuts all strings in a decoded JSON document to the maximum length.
+
+    :param value: The document or its part.
+    :type value: Any
+    :param max_length: Maximum length of a string.
+    :type max_length: int
+    :return: The document with the long strings cut.
+    :rtype: Any
+    """
+    if isinstance(value, str):
+        return value[:max_length]
+    if isinstance(value, dict):
+        return {key: _truncate_strings(value=item, max_length=max_length) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_truncate_strings(value=item, max_length=max_length) for item in value]
+    return value
+
+
+def shrink_webhook(body: bytes) -> bytes:
+    """
+    Cuts the strings of a webhook that are longer than `WEBHOOK_MAX_FIELD_LENGTH`.
+
+    Notifications show only `TRUNCATED_STRING_LENGTH` characters of descriptions, wiki content and comments, so the
+    rest of a huge field is dropped before it is validated, cleaned of tags or queued.
+
+    :param body: The raw request body sent by Taiga.
+    :type body: bytes
+    :return: The body with the long strings cut, or the original body if nothing has to be cut.
+    :rtype: bytes
+    """
+    max_length = get_settings().WEBHOOK_MAX_FIELD_LENGTH
+
+    # a string cannot be longer than the body it is encoded in, so small bodies are not decoded
+    if len(body) <= max_length:
+        return body
+
+    try:
+        document = json.loads(body)
+    except ValueError:
+        # the validation reports the malformed body
+        return body
+
+    # non-ASCII text is kept as UTF-8, an escaped Cyrillic character takes six bytes instead of two
+    return json.dumps(
+        _truncate_strings(value=document, max_length=max_length), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def peek_webhook_event(body: bytes) -> WebhookEventHeader:
+    """
+    Reads the type and the action of a webhook from the raw body without validating the payload.
+
+    :param body: The raw request body sent by Taiga.
+    :type body: bytes
+    :return: The type and the action of the event.
+    :rtype: WebhookEventHeader
+    :raises ValidationError: If the body is not a JSON object with a string type and action.
+    """
+    return _header_adapter.validate_json(body)
+
+
+def is_subscribed(header: WebhookEventHeader, instance: InstanceModel) -> bool:
+    """
+    Checks whether the instance follows the event type of a webhook.
+
+    :param header: The type and the action of the event.
+    :type header: WebhookEventHeader
+    :param instance: The instance that received the webhook.
+    :type instance: InstanceModel
+    :return: True if the event type is in the followed action types of the instance, False otherwise.
+    :rtype: bool
+    """
+    return header["type"] in instance.fat
+
+
+def parse_webhook(body: bytes) -> WebhookPayload:
+    """
+    Validates a raw webhook body into the payload model.
+
+    :param body: The raw request body sent by Taiga.
+    :type body: bytes
+    :return: The validated payload.
+    :rtype: WebhookPayload
+    :raises ValidationError: If the body is not a valid webhook.
+    """
+    return WebhookPayload.model_validate_json(body)
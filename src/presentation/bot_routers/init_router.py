@@ -1,8 +1,18 @@
 from src.core.settings import Configuration
+from src.infrastructure.broker.fsm_storage import get_fsm_storage
 from src.logic.bot_logic.handlers import handlers_router
 from src.logic.bot_logic.middlewares.dependency_middleware import DependencyMiddleware
 
 
+async def register_bot_storage() -> None:
+    """
+    Registers the FSM storage and the events isolation with the application dispatcher.
+    """
+    storage, events_isolation = get_fsm_storage()
+    Configuration.dispatcher.fsm.storage = storage
+    Configuration.dispatcher.fsm.events_isolation = events_isolation
+
+
 async def register_bot_routers() -> None:
     """
     Registers bot routers with the application dispatcher.
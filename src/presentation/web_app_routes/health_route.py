@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+from starlette import status
+from starlette.responses import JSONResponse
+
+from src.logic.services.health_service import HealthService
+
+health_router = APIRouter()
+
+
+@health_router.get("/healthz", status_code=status.HTTP_200_OK)
+async def healthz() -> dict[str, str]:
+    """
+    Reports that the process is alive, i.e. that its event loop serves requests.
+
+    :return: The status of the process.
+    :rtype: dict[str, str]
+    """
+    return {"status": "ok"}
+
+
+@health_router.get("/readyz", status_code=status.HTTP_200_OK)
+async def readyz() -> JSONResponse:
+    """
+    Reports whether the process may accept traffic, with the latency of its dependencies, the queue depths, the Mongo
+    connection pool statistics and the event loop lag.
+
+    :return: The readiness report, with status 503 if the process is not ready.
+    :rtype: JSONResponse
+    """
+    readiness = await HealthService().get_readiness()
+
+    return JSONResponse(
+        content=readiness,
+        status_code=status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
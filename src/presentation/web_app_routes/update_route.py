@@ -1,23 +1,60 @@
-from aiogram.types import Update
-from fastapi import APIRouter
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import ValidationError
 from starlette import status
 from starlette.responses import Response
 
 from src.core.settings import Configuration
+from src.logic.web_app_logic.update_deduplicator import UpdateDeduplicator
+from src.logic.web_app_logic.update_parser import parse_update
+from src.logic.web_app_logic.update_processor import UpdateProcessor
 
 update_router = APIRouter()
 
 
 @update_router.post(Configuration.settings.UPDATES_PATH, status_code=status.HTTP_200_OK)
-async def webhook(update: Update) -> Response:
+async def webhook(request: Request) -> Response:
     """
     Handles webhook requests from Telegram.
 
-    :param update: The incoming Update object containing information about the event.
-    :type update: Update
+    The raw body is validated once into an Update bound to the bot; updates of unhandled types and redeliveries of
+    already received updates are acknowledged without being dispatched.
+
+    With `UPDATES_BACKGROUND` enabled the update is processed in the background and the request is acknowledged
+    immediately; a Bot API method returned by the handler in time is sent back in the response body.
+
+    :param request: The incoming request with the Telegram update in its body.
+    :type request: Request
     :return: A response indicating successful processing of the update.
     :rtype: Response
+    :raises HTTPException: If the body is not a valid update.
     """
-    await Configuration.dispatcher.feed_update(Configuration.bot, update)
+    try:
+        update = parse_update(body=await request.body())
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors(include_url=False, include_context=False)
+        ) from e
+
+    if update is None or await UpdateDeduplicator().is_duplicate(update_id=update.update_id):
+        return Response(status_code=status.HTTP_200_OK)
+
+    if not Configuration.settings.UPDATES_BACKGROUND:
+        try:
+            await Configuration.dispatcher.feed_update(Configuration.bot, update)
+        except Exception:
+            # Telegram redelivers the update after an error response
+            await UpdateDeduplicator().forget(update_id=update.update_id)
+            raise
+
+        return Response(status_code=status.HTTP_200_OK)
+
+    if (reply := await UpdateProcessor().process(update=update)) is None:
+        return Response(status_code=status.HTTP_200_OK)
 
-    return Response(status_code=status.HTTP_200_OK)
+    return Response(
+        content=urlencode(reply),
+        media_type="application/x-www-form-urlencoded",
+        status_code=status.HTTP_200_OK,
+    )
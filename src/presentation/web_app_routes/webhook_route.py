@@ -1,31 +1,92 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.params import Depends
+from pydantic import ValidationError
 from starlette import status
 
+from src.core.settings import get_logger, get_settings
 from src.entities.schemas.project_data.project_schemas import ProjectSchema
-from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+from src.logic.services.event_filter import EventFilter
+from src.logic.services.event_stats import EventStats
+from src.logic.services.notification_queue_service import NotificationQueueService
+from src.logic.services.webhook_archive import WebhookArchive
 from src.logic.services.webhook_service import WebhookService
 from src.logic.web_app_logic.route_dependency.route_path_validator import (
     validate_instance,
 )
+from src.logic.web_app_logic.webhook_parser import (
+    is_subscribed,
+    parse_webhook,
+    peek_webhook_event,
+    read_webhook_body,
+    shrink_webhook,
+)
+from src.utils.priority_utils import get_notification_priority
 
 webhook_router = APIRouter()
+logger = get_logger(name=__name__)
 
 
 @webhook_router.post("/{instance}", status_code=status.HTTP_204_NO_CONTENT)
-async def webhook(wh_data: WebhookPayload, instance: ProjectSchema = Depends(validate_instance)) -> None:
+async def webhook(request: Request, instance: ProjectSchema = Depends(validate_instance)) -> None:
     """
     Handles incoming webhooks based on the specified event type.
 
-    :param wh_data: Data payload received via the webhook.
-    :type wh_data: WebhookPayload
+    The instance is resolved from the path and the event type is read from the raw body first, so webhooks for unknown
+    instances and unfollowed event types are rejected before the payload is validated. The body is read up to
+    `WEBHOOK_MAX_BODY_SIZE_MB`, and strings longer than `WEBHOOK_MAX_FIELD_LENGTH` are cut before the validation.
+    Events dropped by the filter rules of the instance are accepted without being queued or rendered. With
+    `WEBHOOK_ARCHIVE_ENABLED` the raw body is archived for replays.
+
+    With `NOTIFICATIONS_QUEUE_ENABLED` the webhook is appended to the notification queue and sent by a consumer;
+    if the queue is unavailable, the notification is sent directly.
+
+    :param request: The incoming request with the webhook payload in its body.
+    :type request: Request
     :param instance: Project for which the webhook is being processed.
     :type instance: ProjectSchema
     :returns: A success response indicating that the webhook has been received and processed.
     :rtype: None
+    :raises HTTPException: If the body is too large, the event type is not followed by the instance or the body is
+        not a valid webhook.
     """
-    if wh_data.type in instance.instances[0].fat:
-        await WebhookService.process_wh_data(wh_data=wh_data, project=instance)
+    settings = get_settings()
+    project_instance = instance.instances[0]
+    instance_id = project_instance.instance_id
+    body = await read_webhook_body(request=request, max_size=settings.WEBHOOK_MAX_BODY_SIZE_MB * 1024 * 1024)
+    WebhookArchive().add(instance_id=instance_id, body=body)
+    stats = EventStats()
+
+    try:
+        header = peek_webhook_event(body=body)
+        stats.record_event(instance_id=instance_id, event_type=header["type"], action=header["action"])
+        if not is_subscribed(header=header, instance=project_instance):
+            stats.record_skipped(instance_id=instance_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Event type {header['type']} is not followed"
+            )
+
+        body = shrink_webhook(body=body)
+        wh_data = parse_webhook(body=body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors(include_url=False, include_context=False)
+        ) from e
+
+    # the webhook is accepted, but the filter rules of the instance decide whether it is rendered
+    if not EventFilter().allow(payload=wh_data, instance=project_instance):
+        stats.record_skipped(instance_id=instance_id)
         return
 
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Instance {instance} not found")
+    if settings.NOTIFICATIONS_QUEUE_ENABLED:
+        try:
+            await NotificationQueueService().publish(
+                instance_id=instance_id,
+                chat_id=project_instance.chat_id or 0,
+                payload=body,
+                priority=get_notification_priority(payload=wh_data, instance=project_instance),
+            )
+            return
+        except Exception:
+            logger.exception("Failed to queue the webhook, sending it directly")
+
+    await WebhookService.process_wh_data(wh_data=wh_data, project=instance)
@@ -1,10 +1,59 @@
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+
 from src.core.app import run_app
 from src.core.settings import get_logger
 
-logger = get_logger(name=__name__)
-
 
 def run():
+    # the logger is created on start, so that importing the runner does not set up logging and its directories
+    logger = get_logger(name=__name__)
+
     logger.info("Starting...")
     run_app()
     logger.info("Stopping...")
+
+
+def _parse_speed(value: str) -> float | None:
+    return None if value == "max" else float(value)
+
+
+async def _replay(args: argparse.Namespace) -> None:
+    from src.core.settings import Configuration, init_configuration, load_strings
+    from src.infrastructure.database.mongo_dependency import MongoDBDependency
+    from src.logic.services.webhook_replay import replay_webhooks
+
+    init_configuration()
+    load_strings()
+    logger = get_logger(name=__name__)
+
+    try:
+        stats = await replay_webhooks(
+            since=args.since, until=args.until, instance_id=args.instance, speed=args.speed, dry_run=not args.send
+        )
+        logger.info(
+            "Replayed %s webhooks in %.1f s, %s skipped, %s failed",
+            stats.replayed,
+            stats.elapsed,
+            stats.skipped,
+            stats.failed,
+        )
+    finally:
+        await MongoDBDependency().close()
+        await Configuration.bot.session.close()
+
+
+def replay():
+    """
+    Replays archived webhooks, by default the last day of all instances as fast as possible and without sending.
+    """
+    now = datetime.now(UTC)
+    parser = argparse.ArgumentParser(description="Replay archived Taiga webhooks")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=now - timedelta(days=1))
+    parser.add_argument("--until", type=datetime.fromisoformat, default=now)
+    parser.add_argument("--instance", help="replay the webhooks of one instance only")
+    parser.add_argument("--speed", type=_parse_speed, default=None, help="1, 10 or another factor, or max")
+    parser.add_argument("--send", action="store_true", help="send the notifications instead of rendering them")
+
+    asyncio.run(_replay(args=parser.parse_args()))
@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+from aiogram import Bot
+from aiogram.types import InputMediaDocument, URLInputFile
+from aiohttp import ClientError, ClientTimeout
+
+from src.core.Base.exceptions import AttachmentTooLargeError
+from src.core.settings import Configuration, get_logger, get_settings
+from src.entities.schemas.webhook_data.diff_webhook_schemas import DiffBaseAttachment
+from src.utils.send_message_utils import send_document, send_media_group
+
+logger = get_logger(name=__name__)
+
+MEDIA_GROUP_MAX_SIZE = 10
+
+
+class CappedURLInputFile(URLInputFile):
+    """
+    File streamed from a URL into the Telegram upload chunk by chunk, aborted once it exceeds the size limit.
+
+    The limit protects against files whose size was unknown beforehand or differs from the announced one.
+    """
+
+    def __init__(self, url: str, max_size: int, **kwargs) -> None:
+        """
+        Initializes the streamed file.
+
+        :param url: URL of the file.
+        :type url: str
+        :param max_size: Maximum number of bytes to stream.
+        :type max_size: int
+        :param kwargs: Additional parameters of URLInputFile.
+        :type kwargs: dict
+        """
+        super().__init__(url=url, **kwargs)
+        self.max_size = max_size
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        """
+        Streams the file and stops with an error once the size limit has been exceeded.
+
+        :param bot: The bot uploading the file.
+        :type bot: Bot
+        :raises AttachmentTooLargeError: If the file is larger than the limit.
+        """
+        streamed = 0
+
+        async for chunk in super().read(bot):
+            streamed += len(chunk)
+            if streamed > self.max_size:
+                raise AttachmentTooLargeError(message=f"Attachment {self.filename} exceeds {self.max_size} bytes")
+            yield chunk
+
+
+async def get_attachment_size(url: str) -> int | None:
+    """
+    Requests the size of an attachment without downloading it.
+
+    :param url: URL of the attachment.
+    :type url: str
+    :return: The size in bytes, or None if the server does not report it.
+    :rtype: int | None
+    :raises ClientError: If the attachment is not available.
+    """
+    session = await Configuration.bot.session.create_session()
+
+    async with session.head(
+        url,
+        allow_redirects=True,
+        raise_for_status=True,
+        timeout=ClientTimeout(total=get_settings().ATTACHMENT_TIMEOUT),
+    ) as response:
+        return response.content_length
+
+
+async def prepare_attachments(attachments: list[DiffBaseAttachment]) -> list[CappedURLInputFile]:
+    """
+    Selects the attachments that fit into the size limits and wraps them into streamed files.
+
+    Attachments above `ATTACHMENT_MAX_SIZE_MB`, unavailable ones, and the ones that would exceed
+    `ATTACHMENTS_MAX_TOTAL_SIZE_MB` for the notification are skipped.
+
+    :param attachments: New attachments of the event.
+    :type attachments: list[DiffBaseAttachment]
+    :return: Files to upload, in the original order.
+    :rtype: list[CappedURLInputFile]
+    """
+    settings = get_settings()
+    max_size = settings.ATTACHMENT_MAX_SIZE_MB * 1024 * 1024
+    max_total_size = settings.ATTACHMENTS_MAX_TOTAL_SIZE_MB * 1024 * 1024
+    attachments = [attachment for attachment in attachments if attachment.url]
+
+    sizes = await asyncio.gather(
+        *(get_attachment_size(url=attachment.url) for attachment in attachments), return_exceptions=True
+    )
+
+    files = []
+    total_size = 0
+    for attachment, size in zip(attachments, sizes):
+        if isinstance(size, (ClientError, asyncio.TimeoutError)):
+            logger.warning("Attachment %s is not available: %s", attachment.url, size)
+            continue
+        if isinstance(size, BaseException):
+            raise size
+
+        # a file of unknown size reserves the whole per-file limit
+        expected_size = size if size is not None else max_size
+        if expected_size > max_size or total_size + expected_size > max_total_size:
+            logger.info("Attachment %s of %s bytes exceeds the size limits", attachment.filename, size)
+            continue
+
+        total_size += expected_size
+        files.append(
+            CappedURLInputFile(
+                url=attachment.url,
+                max_size=max_size,
+                filename=attachment.filename,
+                chunk_size=settings.ATTACHMENT_CHUNK_SIZE,
+                timeout=settings.ATTACHMENT_TIMEOUT,
+            )
+        )
+
+    return files
+
+
+async def send_attachments(chat_id: int, attachments: list[DiffBaseAttachment], **kwargs) -> None:
+    """
+    Sends new attachments as a document or as albums of up to ten documents.
+
+    Files are streamed from Taiga into the upload, so they are never fully loaded into memory.
+
+    :param chat_id: Unique identifier for the target chat.
+    :type chat_id: int
+    :param attachments: New attachments of the event.
+    :type attachments: list[DiffBaseAttachment]
+    :param kwargs: Additional parameters of the send methods, e.g. `message_thread_id`.
+    :type kwargs: dict
+    """
+    if not get_settings().ATTACHMENTS_ENABLED or not attachments:
+        return
+
+    files = await prepare_attachments(attachments=attachments)
+
+    for start in range(0, len(files), MEDIA_GROUP_MAX_SIZE):
+        group = files[start : start + MEDIA_GROUP_MAX_SIZE]
+
+        try:
+            if len(group) == 1:
+                await send_document(chat_id=chat_id, document=group[0], **kwargs)
+            else:
+                await send_media_group(
+                    chat_id=chat_id, media=[InputMediaDocument(media=file) for file in group], **kwargs
+                )
+        except (AttachmentTooLargeError, ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Failed to send attachments to %s: %s", chat_id, e)
@@ -0,0 +1,42 @@
+import zlib
+
+import zstandard
+
+from src.entities.enums.archive_codec_enum import ArchiveCodecEnum
+
+
+def compress_bodies(bodies: list[bytes], codec: ArchiveCodecEnum, level: int) -> list[bytes]:
+    """
+    Compresses a batch of bodies with one compressor.
+
+    :param bodies: The bodies to compress.
+    :type bodies: list[bytes]
+    :param codec: The compression codec.
+    :type codec: ArchiveCodecEnum
+    :param level: The compression level.
+    :type level: int
+    :return: The compressed bodies in the original order.
+    :rtype: list[bytes]
+    """
+    if codec == ArchiveCodecEnum.ZSTD:
+        compressor = zstandard.ZstdCompressor(level=level)
+        return [compressor.compress(body) for body in bodies]
+
+    return [zlib.compress(body, level) for body in bodies]
+
+
+def decompress_body(body: bytes, codec: ArchiveCodecEnum) -> bytes:
+    """
+    Decompresses an archived body.
+
+    :param body: The compressed body.
+    :type body: bytes
+    :param codec: The codec the body was compressed with.
+    :type codec: ArchiveCodecEnum
+    :return: The original body.
+    :rtype: bytes
+    """
+    if codec == ArchiveCodecEnum.ZSTD:
+        return zstandard.ZstdDecompressor().decompress(body)
+
+    return zlib.decompress(body)
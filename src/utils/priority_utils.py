@@ -0,0 +1,69 @@
+from functools import cache
+
+from src.core.settings import get_settings
+from src.entities.enums.notification_priority_enum import NotificationPriorityEnum
+from src.entities.schemas.project_data.project_schemas import (
+    InstanceModel,
+    PriorityRuleModel,
+)
+from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+
+PRIORITY_ORDER = (NotificationPriorityEnum.HIGH, NotificationPriorityEnum.NORMAL, NotificationPriorityEnum.LOW)
+
+
+@cache
+def get_default_priority_rules() -> tuple[PriorityRuleModel, ...]:
+    """
+    Returns the priority rules used by instances without their own rules.
+
+    :return: The rules from `NOTIFICATIONS_PRIORITY_RULES`.
+    :rtype: tuple[PriorityRuleModel, ...]
+    """
+    return tuple(PriorityRuleModel.model_validate(rule) for rule in get_settings().NOTIFICATIONS_PRIORITY_RULES)
+
+
+def is_rule_matched(rule: PriorityRuleModel, payload: WebhookPayload) -> bool:
+    """
+    Checks whether an event matches a priority rule.
+
+    :param rule: The priority rule.
+    :type rule: PriorityRuleModel
+    :param payload: Payload from the webhook.
+    :type payload: WebhookPayload
+    :return: True if the event matches all conditions of the rule, False otherwise.
+    :rtype: bool
+    """
+    if rule.type is not None and payload.type != rule.type:
+        return False
+    if rule.action is not None and payload.action != rule.action:
+        return False
+    if rule.field is None:
+        return True
+
+    if rule.values:
+        value = getattr(payload.data, rule.field, None)
+        # objects like severity or status are compared by name
+        return str(getattr(value, "name", value)) in rule.values
+
+    diff = payload.change.diff if payload.change else None
+    return getattr(diff, rule.field, None) is not None
+
+
+def get_notification_priority(payload: WebhookPayload, instance: InstanceModel) -> NotificationPriorityEnum:
+    """
+    Returns the delivery priority of an event for an instance.
+
+    :param payload: Payload from the webhook.
+    :type payload: WebhookPayload
+    :param instance: The instance receiving the event.
+    :type instance: InstanceModel
+    :return: The priority of the first matching rule, or normal priority if no rule matches.
+    :rtype: NotificationPriorityEnum
+    """
+    rules = instance.priority_rules or get_default_priority_rules()
+
+    for rule in rules:
+        if is_rule_matched(rule=rule, payload=payload):
+            return rule.priority
+
+    return NotificationPriorityEnum.NORMAL
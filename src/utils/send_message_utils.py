@@ -1,7 +1,16 @@
-from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
-from aiogram.types import InlineKeyboardMarkup, InputFile, Message, ReplyKeyboardMarkup
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+)
+from aiogram.types import (
+    InlineKeyboardMarkup,
+    InputFile,
+    InputMediaDocument,
+    Message,
+    ReplyKeyboardMarkup,
+)
 
-from src.core.Base.exceptions import BotBlocked
+from src.core.Base.exceptions import BotBlocked, ChatUnavailableError
 from src.core.settings import Configuration, get_logger
 
 logger = get_logger(name=__name__)
@@ -85,6 +94,34 @@ async def send_message(
         logger.warning(f"The bot is blocked by user: {chat_id}.")
 
 
+async def send_notification(chat_id: int, text: str, **kwargs) -> Message:
+    """
+    Sends a webhook notification, reporting chats the bot can no longer write to instead of only logging them.
+
+    Flood control is not waited out here, so that the caller can delay only the limited chat.
+
+    :param chat_id: Unique identifier for the target chat.
+    :type chat_id: int
+    :param text: Text of the notification.
+    :type text: str
+    :param kwargs: Additional parameters of the sendMessage method, e.g. `message_thread_id`.
+    :type kwargs: dict
+    :returns: The sent message.
+    :rtype: Message
+    :raises ChatUnavailableError: If the bot was blocked or removed from the chat, or the chat does not exist.
+    :raises TelegramRetryAfter: If the chat is under flood control.
+    :raises TelegramBadRequest: If the request fails for another reason.
+    """
+    try:
+        return await Configuration.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+    except TelegramForbiddenError as e:
+        raise ChatUnavailableError(message=e.message)
+    except TelegramBadRequest as e:
+        if "chat not found" in e.message.lower():
+            raise ChatUnavailableError(message=e.message)
+        raise
+
+
 async def send_photo(
     chat_id: int,
     photo: InputFile | str,
@@ -124,3 +161,41 @@ async def send_photo(
         )
     except TelegramForbiddenError:
         logger.warning(f"The bot is blocked by user: {chat_id}.")
+
+
+async def send_document(chat_id: int, document: InputFile | str, **kwargs) -> Message | None:
+    """
+    Sends a document to a specified chat.
+
+    :param chat_id: Unique identifier for the target chat.
+    :type chat_id: int
+    :param document: A file object or a string with the URL of the document to send.
+    :type document: InputFile | str
+    :param kwargs: Additional parameters of the sendDocument method.
+    :type kwargs: dict
+    :returns: The sent message object if successful, otherwise None.
+    :rtype: Message | None
+    """
+    try:
+        return await Configuration.bot.send_document(chat_id=chat_id, document=document, **kwargs)
+    except TelegramForbiddenError:
+        logger.warning(f"The bot is blocked by user: {chat_id}.")
+
+
+async def send_media_group(chat_id: int, media: list[InputMediaDocument], **kwargs) -> list[Message] | None:
+    """
+    Sends a group of documents to a specified chat as an album.
+
+    :param chat_id: Unique identifier for the target chat.
+    :type chat_id: int
+    :param media: From 2 to 10 documents to send.
+    :type media: list[InputMediaDocument]
+    :param kwargs: Additional parameters of the sendMediaGroup method.
+    :type kwargs: dict
+    :returns: The sent messages if successful, otherwise None.
+    :rtype: list[Message] | None
+    """
+    try:
+        return await Configuration.bot.send_media_group(chat_id=chat_id, media=media, **kwargs)
+    except TelegramForbiddenError:
+        logger.warning(f"The bot is blocked by user: {chat_id}.")
@@ -1,7 +1,7 @@
 from aiogram import types
 from aiogram.fsm.context import FSMContext
 
-from src.core.settings import get_logger
+from src.core.settings import get_logger, get_settings
 
 logger = get_logger(name=__name__)
 
@@ -10,6 +10,11 @@ async def get_info_for_state(callback: types.CallbackQuery, state: FSMContext) -
     """
     Retrieves the previous callback data from an FSMContext and updates it with the current callback data.
 
+    The history is a bounded LRU of `CALLBACK_HISTORY_SIZE` transitions: every touched callback is moved to the end and
+    the least recently used ones are evicted. A callback missing from the history, e.g. an evicted one, falls back to
+    the current callback as its previous screen, or to `menu` when there is no current callback yet. The state data is
+    read and written once per callback.
+
     :param callback: The CallbackQuery object containing the current callback information.
     :type callback: CallbackQuery
 
@@ -26,21 +31,18 @@ async def get_info_for_state(callback: types.CallbackQuery, state: FSMContext) -
     current_callback = data.get("current_callback")
 
     if current_callback is None:
-        callback_history[callback.data] = default_previous
         previous_callback = default_previous
     else:
-        if callback.data not in callback_history:
-            callback_history[callback.data] = current_callback
+        previous_callback = callback_history.pop(callback.data, current_callback)
 
-        previous_callback = callback_history[callback.data]
+    callback_history[callback.data] = previous_callback
 
-    data["current_callback"] = callback.data
+    for evicted in list(callback_history)[: -get_settings().CALLBACK_HISTORY_SIZE]:
+        del callback_history[evicted]
 
-    data["callback_history"] = callback_history
+    data.update(current_callback=callback.data, callback_history=callback_history)
     await state.set_data(data)
 
-    logger.info(f"callback.data={callback.data}")
-    logger.info(f"previous_callback={previous_callback}")
-    logger.info(f"callback_history={callback_history}")
+    logger.debug("callback.data=%s previous_callback=%s", callback.data, previous_callback)
 
     return previous_callback
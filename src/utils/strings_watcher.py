@@ -0,0 +1,108 @@
+import asyncio
+import os
+from pathlib import Path
+
+from src.core.Base.singleton import Singleton
+from src.core.settings import Configuration, build_strings, get_logger, get_settings
+from src.utils.yaml_utils import validate_strings
+
+logger = get_logger(name=__name__)
+
+
+class StringsWatcher(Singleton):
+    """
+    Reloads the strings in the background when the YAML files change.
+
+    The YAML tree is polled for modification times every `STRINGS_RELOAD_INTERVAL` seconds. Changed strings are built
+    and validated in a worker thread and swapped in with a single assignment, so handlers always read a complete
+    catalog and never wait for YAML parsing. Invalid strings are logged and the current ones are kept.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the watcher state.
+
+        :ivar self._snapshot: Modification time and size of every YAML file at the last check.
+        :type self._snapshot: dict[str, tuple[int, int]]
+        :ivar self._task: The polling task.
+        :type self._task: asyncio.Task | None
+        """
+        if getattr(self, "_snapshot", None) is not None:
+            return
+
+        self._path = get_settings().YAML_FILE_PATH
+        self._interval = get_settings().STRINGS_RELOAD_INTERVAL
+        self._snapshot: dict[str, tuple[int, int]] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """
+        Starts polling the YAML files if hot reload is enabled.
+        """
+        if not self._interval or self._task is not None:
+            return
+
+        self._snapshot = await asyncio.to_thread(self._scan)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops polling the YAML files.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def reload(self) -> bool:
+        """
+        Builds, validates and swaps in the strings.
+
+        :return: True if the new strings have been swapped in, False if they are invalid.
+        :rtype: bool
+        """
+        try:
+            strings = await asyncio.to_thread(build_strings)
+            validate_strings(strings=strings, reference=Configuration.strings or {})
+        except Exception:
+            logger.exception("Failed to reload strings, keeping the current ones")
+            return False
+
+        Configuration.strings = strings
+        logger.info("Strings have been reloaded")
+        return True
+
+    async def _run(self) -> None:
+        """
+        Checks the YAML files for changes and reloads the strings when they have changed.
+        """
+        while True:
+            await asyncio.sleep(self._interval)
+
+            snapshot = await asyncio.to_thread(self._scan)
+            if snapshot != self._snapshot:
+                self._snapshot = snapshot
+                await self.reload()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """
+        Collects the modification time and size of every YAML file in the strings directory.
+
+        :return: A mapping of file paths to their modification time and size.
+        :rtype: dict[str, tuple[int, int]]
+        """
+        snapshot = {}
+
+        for file_path in Path(self._path).rglob("*.yaml"):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            snapshot[str(file_path)] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
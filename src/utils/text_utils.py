@@ -3,7 +3,7 @@ from typing import Any
 import nh3
 
 from src.core.settings import Configuration, get_settings, get_strings
-from src.entities.named_tuples.utils_tuples import AdminStrTuple
+from src.entities.named_tuples.utils_tuples import AdminStrTuple, PackedTextTuple
 from src.entities.schemas.user_data.user_schemas import UserCreateSchema
 
 
@@ -79,6 +79,30 @@ def get_webhook_notification_text(text_in_yaml: str, lang: str, **kwargs):
     )
 
 
+def pack_texts(texts: list[str], limit: int, separator: str = "\n\n") -> list[PackedTextTuple]:
+    """
+    Joins consecutive texts into as few messages as possible without exceeding the length limit.
+
+    :param texts: Texts in the order they must appear.
+    :type texts: list[str]
+    :param limit: Maximum length of a message; a single longer text is kept as it is.
+    :type limit: int
+    :param separator: String placed between the joined texts.
+    :type separator: str
+    :return: The messages with the number of texts joined into each of them.
+    :rtype: list[PackedTextTuple]
+    """
+    messages: list[PackedTextTuple] = []
+
+    for text in texts:
+        if messages and len(messages[-1].text) + len(separator) + len(text) <= limit:
+            messages[-1] = PackedTextTuple(text=f"{messages[-1].text}{separator}{text}", count=messages[-1].count + 1)
+        else:
+            messages.append(PackedTextTuple(text=text, count=1))
+
+    return messages
+
+
 def get_service_text(text_in_yaml: str, **kwargs) -> str:
     """
     Retrieves and formats a service-specific text based on the provided YAML key.
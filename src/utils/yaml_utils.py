@@ -1,8 +1,17 @@
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
 from pathlib import Path
+from string import Formatter
 
 import yaml
 import yaml_include
 
+CATALOG_PREFIX = "strings-"
+CATALOG_SUFFIX = ".marshal"
+
 
 def process_references(data) -> None:
     """
@@ -49,3 +58,103 @@ def generate_strings_dict(path: str) -> dict[str, dict | list | str]:
             process_references(data)
 
     return strings_dict
+
+
+def get_strings_hash(path: str) -> str:
+    """
+    Computes a content hash of the YAML tree, including the files pulled in by `!include`.
+
+    The Python version is part of the hash, because the marshal format of the catalog depends on it.
+
+    :param path: Path to the directory containing YAML files.
+    :type path: str
+    :returns: A hex digest identifying the current content of the YAML tree.
+    :rtype: str
+    """
+    digest = hashlib.sha256(sys.version.encode())
+
+    for file_path in sorted(Path(path).rglob("*.yaml")):
+        digest.update(file_path.relative_to(path).as_posix().encode())
+        digest.update(file_path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def load_strings_catalog(path: str, cache_dir: str) -> dict[str, dict | list | str]:
+    """
+    Loads the strings from a compiled catalog, compiling it from the YAML files when they have changed.
+
+    The YAML files stay the source of truth: the catalog is keyed by the content hash of the YAML tree, so any change
+    to them produces a new catalog and stale ones are removed. A missing, unreadable or unwritable catalog falls back
+    to parsing the YAML files.
+
+    :param path: Path to the directory containing YAML files.
+    :type path: str
+    :param cache_dir: Directory where compiled catalogs are stored.
+    :type cache_dir: str
+    :returns: The same dictionary as `generate_strings_dict`.
+    :rtype: dict[str, dict | list | str]
+    """
+    cache_path = Path(cache_dir)
+    catalog_path = cache_path / f"{CATALOG_PREFIX}{get_strings_hash(path=path)}{CATALOG_SUFFIX}"
+
+    try:
+        return marshal.loads(catalog_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    strings_dict = generate_strings_dict(path=path)
+
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        data = marshal.dumps(strings_dict)
+
+        with tempfile.NamedTemporaryFile(dir=cache_path, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, catalog_path)
+
+        for stale_path in cache_path.glob(f"{CATALOG_PREFIX}*{CATALOG_SUFFIX}"):
+            if stale_path != catalog_path:
+                stale_path.unlink(missing_ok=True)
+    except (OSError, ValueError):
+        pass
+
+    return strings_dict
+
+
+def validate_strings(strings: dict, reference: dict) -> None:
+    """
+    Validates newly built strings against the currently loaded ones.
+
+    Every key of the reference must still exist, so that no lookup starts failing after a swap, and every text must
+    be a valid format template.
+
+    :param strings: The newly built strings.
+    :type strings: dict
+    :param reference: The currently loaded strings.
+    :type reference: dict
+    :raises ValueError: If a key is missing or a text is not a valid format template.
+    """
+
+    def _validate(value, reference_value, key_path: str) -> None:
+        if isinstance(reference_value, dict):
+            if not isinstance(value, dict):
+                raise ValueError(f"{key_path} must be a mapping")
+
+            if missing := reference_value.keys() - value.keys():
+                raise ValueError(f"{key_path} is missing keys: {', '.join(map(str, missing))}")
+
+        if isinstance(value, dict):
+            for key, nested_value in value.items():
+                nested_reference = reference_value.get(key) if isinstance(reference_value, dict) else None
+                _validate(nested_value, nested_reference, f"{key_path}.{key}")
+        elif isinstance(value, list):
+            for index, nested_value in enumerate(value):
+                _validate(nested_value, None, f"{key_path}[{index}]")
+        elif isinstance(value, str):
+            try:
+                list(Formatter().parse(value))
+            except ValueError as e:
+                raise ValueError(f"{key_path} is not a valid template: {e}") from e
+
+    _validate(strings, reference, "strings")
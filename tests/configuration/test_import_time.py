@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_MS = 1000
+
+
+def _import_in_fresh_interpreter(code: str) -> subprocess.CompletedProcess:
+    """
+    Runs Python code with import timing in a fresh interpreter.
+
+    :param code: The code to run.
+    :type code: str
+    :return: The finished process, with the import times in its stderr.
+    :rtype: subprocess.CompletedProcess
+    """
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+
+
+@pytest.mark.parametrize("module", ["src.core.app", "src.runner"])
+def test_import_time_within_budget(module: str) -> None:
+    """
+    Ensures that importing the application and the runner stays within the import-time budget.
+
+    The cumulative time of the module is taken from `python -X importtime`, measured in a fresh interpreter. aiogram
+    alone takes several seconds to import, so the budget is exceeded as soon as it is imported at module level again.
+
+    :param module: Name of the module to import.
+    :type module: str
+    :raises AssertionError: If the import takes longer than the budget.
+    """
+    result = _import_in_fresh_interpreter(code=f"import {module}")
+
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == module
+    )
+
+    assert cumulative_us / 1000 <= IMPORT_TIME_BUDGET_MS, f"{module} imports in {cumulative_us / 1000:.0f} ms"
+
+
+def test_app_import_does_not_load_bot_modules() -> None:
+    """
+    Ensures that importing the application loads neither aiogram nor the bot handlers, whatever the machine speed.
+
+    :raises AssertionError: If one of them is imported.
+    """
+    result = _import_in_fresh_interpreter(
+        code=(
+            "import sys, src.core.app; "
+            "print(*(name for name in sys.modules if name == 'aiogram' or name.startswith('src.logic')))"
+        )
+    )
+
+    assert result.stdout.split() == []
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from src.core.startup import StartupOrchestrator
+from src.entities.named_tuples.startup_tuples import StartupStepTuple
+
+
+@pytest.fixture
+def orchestrator(monkeypatch) -> StartupOrchestrator:
+    """
+    Provides a fresh StartupOrchestrator instance.
+
+    :return: A StartupOrchestrator detached from the singleton.
+    :rtype: StartupOrchestrator
+    """
+    monkeypatch.setattr(StartupOrchestrator, "_instance", None)
+    return StartupOrchestrator()
+
+
+@pytest.mark.asyncio
+class TestStartupOrchestrator:
+    """
+    Tests for the StartupOrchestrator class.
+    """
+
+    async def test_independent_steps_run_concurrently(self, orchestrator):
+        """
+        Tests that independent steps overlap and dependent steps wait for their dependencies.
+        """
+        events = []
+
+        def make_step(name: str):
+            async def step():
+                events.append(f"{name}:start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:end")
+
+            return step
+
+        await orchestrator.run(
+            steps=[
+                StartupStepTuple(name="a", func=make_step("a")),
+                StartupStepTuple(name="b", func=make_step("b")),
+                StartupStepTuple(name="c", func=make_step("c"), depends_on=("a", "b")),
+            ]
+        )
+
+        assert events[:2] == ["a:start", "b:start"]
+        assert events[-2:] == ["c:start", "c:end"]
+        assert orchestrator.is_ready
+        assert orchestrator.durations.keys() == {"a", "b", "c"}
+
+    async def test_failed_step_keeps_app_not_ready(self, orchestrator):
+        """
+        Tests that a failing step is raised, dependent steps are skipped and the app is not marked as ready.
+        """
+        dependent_ran = False
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def dependent():
+            nonlocal dependent_ran
+            dependent_ran = True
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.run(
+                steps=[
+                    StartupStepTuple(name="fail", func=fail),
+                    StartupStepTuple(name="dependent", func=dependent, depends_on=("fail",)),
+                ]
+            )
+
+        assert not dependent_ran
+        assert not orchestrator.is_ready
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            [StartupStepTuple(name="a", func=asyncio.sleep, depends_on=("missing",))],
+            [
+                StartupStepTuple(name="a", func=asyncio.sleep, depends_on=("b",)),
+                StartupStepTuple(name="b", func=asyncio.sleep, depends_on=("a",)),
+            ],
+        ],
+    )
+    async def test_invalid_graph_is_rejected(self, orchestrator, steps):
+        """
+        Tests that unknown and cyclic dependencies are rejected before any step runs.
+        """
+        with pytest.raises(ValueError):
+            await orchestrator.run(steps=steps)
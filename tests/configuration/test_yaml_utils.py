@@ -1,4 +1,9 @@
 from src.core.settings import get_strings
+from src.utils.yaml_utils import (
+    generate_strings_dict,
+    get_strings_hash,
+    load_strings_catalog,
+)
 
 
 class TestYamlUtils:
@@ -7,3 +12,48 @@ class TestYamlUtils:
         result = get_strings()
 
         assert expected == result.get("yaml_test").get("Example").strip()
+
+
+class TestStringsCatalog:
+    """
+    Tests for the compiled strings catalog.
+    """
+
+    strings_path = "tests/fixtures/strings"
+
+    def test_catalog_matches_yaml(self, tmp_path):
+        """
+        Tests that the catalog is compiled on the first load and returns the same strings afterwards.
+        """
+        expected = generate_strings_dict(path=self.strings_path)
+
+        assert load_strings_catalog(path=self.strings_path, cache_dir=str(tmp_path)) == expected
+        assert len(list(tmp_path.glob("strings-*.marshal"))) == 1
+        assert load_strings_catalog(path=self.strings_path, cache_dir=str(tmp_path)) == expected
+
+    def test_changed_yaml_rebuilds_catalog(self, tmp_path):
+        """
+        Tests that editing a YAML file produces a new catalog and removes the stale one.
+        """
+        strings_path = tmp_path / "strings"
+        strings_path.mkdir()
+        (strings_path / "texts.yaml").write_text("greeting: Hello\n", encoding="utf-8")
+        cache_dir = str(tmp_path / "cache")
+
+        assert load_strings_catalog(path=str(strings_path), cache_dir=cache_dir) == {"texts": {"greeting": "Hello"}}
+
+        (strings_path / "texts.yaml").write_text("greeting: Hi\n", encoding="utf-8")
+
+        assert load_strings_catalog(path=str(strings_path), cache_dir=cache_dir) == {"texts": {"greeting": "Hi"}}
+        assert len(list((tmp_path / "cache").glob("strings-*.marshal"))) == 1
+
+    def test_corrupted_catalog_falls_back_to_yaml(self, tmp_path):
+        """
+        Tests that an unreadable catalog is replaced by parsing the YAML files.
+        """
+        catalog_path = tmp_path / f"strings-{get_strings_hash(path=self.strings_path)}.marshal"
+        catalog_path.write_bytes(b"\x00broken")
+
+        result = load_strings_catalog(path=self.strings_path, cache_dir=str(tmp_path))
+
+        assert result == generate_strings_dict(path=self.strings_path)
@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import LockError
+
+from src.core.settings import get_settings
+from src.infrastructure.broker import leader_election
+from src.infrastructure.broker.leader_election import LeaderElection
+
+
+@pytest.fixture
+def election(monkeypatch) -> LeaderElection:
+    """
+    Provides a fresh LeaderElection instance with a mocked Redis lock.
+
+    :return: A LeaderElection instance detached from the singleton.
+    :rtype: LeaderElection
+    """
+    monkeypatch.setattr(LeaderElection, "_instance", None)
+    lock = MagicMock()
+    lock.acquire = AsyncMock(return_value=True)
+    lock.reacquire = AsyncMock()
+    lock.release = AsyncMock()
+    client = MagicMock()
+    client.lock.return_value = lock
+
+    dependency = MagicMock()
+    dependency.get_client.return_value = client
+    monkeypatch.setattr(leader_election, "RedisSessionDependency", lambda: dependency)
+    monkeypatch.setattr(get_settings(), "WORKERS", 2)
+
+    return LeaderElection()
+
+
+@pytest.mark.asyncio
+class TestLeaderElection:
+    """
+    Tests for the LeaderElection class.
+    """
+
+    async def test_single_worker_is_always_leader(self, election, monkeypatch):
+        """
+        Tests that a single worker becomes the leader without taking the lock.
+        """
+        monkeypatch.setattr(get_settings(), "WORKERS", 1)
+        on_elected = AsyncMock()
+
+        await election.start(on_elected=on_elected)
+
+        assert election.is_leader
+        on_elected.assert_awaited_once()
+        assert election._lock is None
+
+    async def test_leader_runs_callback_once(self, election):
+        """
+        Tests that the worker which acquires the lock runs the leader callback.
+        """
+        on_elected = AsyncMock()
+
+        await election.start(on_elected=on_elected)
+
+        assert election.is_leader
+        on_elected.assert_awaited_once()
+        await election.stop()
+        election._lock.release.assert_awaited_once()
+        assert not election.is_leader
+
+    async def test_follower_skips_callback(self, election):
+        """
+        Tests that a worker failing to acquire the lock does not run the leader callback.
+        """
+        on_elected = AsyncMock()
+        election._ttl = 30
+        client = leader_election.RedisSessionDependency().get_client()
+        client.lock.return_value.acquire = AsyncMock(return_value=False)
+
+        await election.start(on_elected=on_elected)
+
+        assert not election.is_leader
+        on_elected.assert_not_awaited()
+        await election.stop()
+        election._lock.release.assert_not_awaited()
+
+    async def test_takeover_runs_takeover_callback(self, election):
+        """
+        Tests that a leadership taken over after startup runs the takeover callback instead of the startup one.
+        """
+        on_elected, on_takeover = AsyncMock(), AsyncMock()
+        election._ttl = 30
+        lock = leader_election.RedisSessionDependency().get_client().lock.return_value
+        lock.acquire = AsyncMock(return_value=False)
+
+        await election.start(on_elected=on_elected, on_takeover=on_takeover)
+        lock.acquire.return_value = True
+        await election._try_acquire(callback=election._on_takeover)
+
+        assert election.is_leader
+        on_elected.assert_not_awaited()
+        on_takeover.assert_awaited_once()
+        await election.stop()
+
+    async def test_leader_steps_down_when_lock_is_lost(self, election):
+        """
+        Tests that the leader steps down when the lock can no longer be extended.
+        """
+        await election.start(on_elected=AsyncMock())
+        election._lock.reacquire.side_effect = LockError("lost")
+
+        await election._renew()
+
+        assert not election.is_leader
+        await election.stop()
@@ -102,3 +102,19 @@ class TestRedisManager:
         await redis_manager.delete_data(key)
 
         fake_session.delete.assert_awaited_once_with(key)
+
+    async def test_set_if_absent(self, redis_manager: RedisManager, fake_session: AsyncMock) -> None:
+        """
+        Tests that set_if_absent sets the key with NX and a TTL and reports whether it was set.
+
+        :param redis_manager: Instance of RedisManager used for interacting with Redis.
+        :type redis_manager: RedisManager
+        :param fake_session: Mock object representing an asynchronous session interface.
+        :type fake_session: AsyncMock
+        :raises AssertionError: If the key is not set atomically or the result is not reported.
+        """
+        fake_session.set.return_value = None
+
+        assert await redis_manager.set_if_absent("test_key", "1", ttl=60) is False
+
+        fake_session.set.assert_awaited_once_with("test_key", "1", nx=True, ex=60)
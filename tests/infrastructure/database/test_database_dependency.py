@@ -1,9 +1,11 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from motor.motor_asyncio import AsyncIOMotorClientSession
 
+from src.core.settings import get_settings
+from src.entities.enums.mongo_driver_enum import MongoDriverEnum
 from src.infrastructure.database.mongo_dependency import MongoDBDependency
 
 
@@ -80,3 +82,25 @@ class TestMongoDBDependency:
             pass
 
         dummy_session.end_session.assert_awaited_once()
+
+    async def test_native_driver_session(self, monkeypatch: MonkeyPatch, dummy_session: AsyncMock) -> None:
+        """
+        Tests that the native PyMongo driver starts sessions without awaiting the client call.
+
+        :param monkeypatch: A pytest fixture that allows patching objects during testing.
+        :type monkeypatch: MonkeyPatch
+        :param dummy_session: An asynchronous mock object representing a MongoDB session.
+        :type dummy_session: AsyncMock
+        :raises AssertionError: If the session is not started synchronously or not ended on exit.
+        """
+        monkeypatch.setattr(get_settings(), "DB_DRIVER", MongoDriverEnum.PYMONGO.value)
+        monkeypatch.setattr(MongoDBDependency, "_instance", None)
+        mongo_dep = MongoDBDependency()
+        start_session_mock = MagicMock(return_value=dummy_session)
+        monkeypatch.setattr(mongo_dep._client, "start_session", start_session_mock)
+
+        async with mongo_dep.session() as session:
+            assert session is dummy_session
+
+        start_session_mock.assert_called_once()
+        dummy_session.end_session.assert_awaited_once()
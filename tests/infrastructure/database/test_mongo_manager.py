@@ -5,7 +5,11 @@ from bson import ObjectId
 
 from src.entities.enums.collection_enum import DBCollectionEnum
 from src.entities.enums.lang_enum import LanguageEnum
-from src.entities.schemas.project_data.project_schemas import ProjectSchema
+from src.entities.schemas.project_data.project_schemas import (
+    InstanceSummaryModel,
+    ProjectSchema,
+)
+from src.entities.schemas.user_data.user_schemas import UserCreateSchema, UserSchema
 from src.infrastructure.database.mongo_manager import MongoManager
 
 
@@ -89,3 +93,49 @@ class TestMongoManager:
         )
 
         assert result is None
+
+    async def test_find_one_passes_projection(self) -> None:
+        """
+        Tests that the projection is forwarded to the collection query.
+
+        :raises AssertionError: If the projection is not passed to `find_one`.
+        """
+        valid_id = "507f1f77bcf86cd799439011"
+        projection = {"instance_id": 1, "instance_name": 1}
+        fake_collection = self.mongo_dep.get_collection.return_value
+        fake_collection.find_one.return_value = {"instance_id": ObjectId(valid_id), "instance_name": "instance 1"}
+
+        manager = MongoManager(mongo_dep=self.mongo_dep)
+
+        result = await manager.find_one(
+            collection=DBCollectionEnum.PROJECT,
+            schema=InstanceSummaryModel,
+            value=valid_id,
+            field="instance_id",
+            projection=projection,
+        )
+
+        fake_collection.find_one.assert_awaited_once_with({"instance_id": valid_id}, projection, session=None)
+        assert result == InstanceSummaryModel(instance_id=valid_id, instance_name="instance 1")
+
+    async def test_create_user_uses_explicit_session(self) -> None:
+        """
+        Tests that the multistep user creation shares one explicit session between its commands.
+
+        :raises AssertionError: If the explicit session is not started or not passed to the queries.
+        """
+        valid_id = "507f1f77bcf86cd799439011"
+        fake_collection = self.mongo_dep.get_collection.return_value
+        fake_collection.find_one.return_value = {"_id": ObjectId(valid_id), "first_name": "John", "telegram_id": 1}
+
+        manager = MongoManager(mongo_dep=self.mongo_dep)
+
+        result = await manager.create_user(
+            collection=DBCollectionEnum.USERS,
+            insert_data=UserCreateSchema(first_name="John", telegram_id=1),
+            return_schema=UserSchema,
+        )
+
+        self.mongo_dep.session.assert_called_once()
+        assert fake_collection.find_one.await_args.kwargs["session"] == "fake_session"
+        assert result.id == valid_id
@@ -0,0 +1,50 @@
+from pymongo import monitoring
+
+from src.infrastructure.database.mongo_pool_monitor import MongoPoolStatsListener
+
+
+class TestMongoPoolStatsListener:
+    """
+    Tests the collection of connection pool statistics from CMAP events.
+    """
+
+    address = ("localhost", 27017)
+
+    def test_checkout_statistics(self) -> None:
+        """
+        Tests that created, checked out and checked in connections are counted.
+
+        :raises AssertionError: If the counters do not match the emitted events.
+        """
+        listener = MongoPoolStatsListener()
+
+        listener.connection_created(monitoring.ConnectionCreatedEvent(self.address, 1))
+        listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(self.address, 1, 0.002))
+        listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(self.address, 1, 0.004))
+        listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(self.address, 1))
+
+        stats = listener.get_stats()
+
+        assert stats.connections_open == 1
+        assert stats.connections_in_use == 1
+        assert stats.checkouts == 2
+        assert round(stats.checkout_wait_avg_ms, 3) == 3.0
+        assert round(stats.checkout_wait_max_ms, 3) == 4.0
+
+    def test_failures_and_closed_connections(self) -> None:
+        """
+        Tests that checkout failures and closed connections are counted.
+
+        :raises AssertionError: If the counters do not match the emitted events.
+        """
+        listener = MongoPoolStatsListener()
+
+        listener.connection_created(monitoring.ConnectionCreatedEvent(self.address, 1))
+        listener.connection_closed(monitoring.ConnectionClosedEvent(self.address, 1, "idle"))
+        listener.connection_check_out_failed(monitoring.ConnectionCheckOutFailedEvent(self.address, "timeout", 1.0))
+
+        stats = listener.get_stats()
+
+        assert stats.connections_open == 0
+        assert stats.connections_closed == 1
+        assert stats.checkout_failures == 1
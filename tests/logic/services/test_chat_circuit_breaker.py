@@ -0,0 +1,108 @@
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.settings import get_settings
+from src.entities.enums.circuit_state_enum import CircuitStateEnum
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.schemas.project_data.project_schemas import InstanceModel
+from src.logic.services.chat_circuit_breaker import ChatCircuitBreaker
+
+INSTANCE_ID = "67d1a2b3c4d5e6f708192a3b"
+
+
+@pytest.fixture
+def project_service(monkeypatch) -> AsyncMock:
+    """
+    Provides a mocked ProjectService used by the circuit breaker.
+
+    :return: The mocked service instance.
+    :rtype: AsyncMock
+    """
+    service = AsyncMock()
+    monkeypatch.setattr("src.logic.services.chat_circuit_breaker.ProjectService", lambda: service)
+    return service
+
+
+@pytest.fixture
+def breaker(monkeypatch, project_service) -> ChatCircuitBreaker:
+    """
+    Provides a fresh ChatCircuitBreaker that trips after two failures and notifies nobody.
+
+    :return: A ChatCircuitBreaker detached from the singleton.
+    :rtype: ChatCircuitBreaker
+    """
+    monkeypatch.setattr(ChatCircuitBreaker, "_instance", None)
+    monkeypatch.setattr(ChatCircuitBreaker, "_notify_admins", AsyncMock())
+    monkeypatch.setattr("src.logic.services.chat_circuit_breaker.get_service_text", lambda **kwargs: "")
+    monkeypatch.setattr(get_settings(), "CHAT_BREAKER_THRESHOLD", 2)
+    monkeypatch.setattr(get_settings(), "CHAT_BREAKER_PROBE_INTERVAL", 600)
+
+    return ChatCircuitBreaker()
+
+
+def _instance(disabled: bool = False) -> InstanceModel:
+    return InstanceModel(
+        instance_id=INSTANCE_ID,
+        instance_name="instance",
+        project_id="project",
+        chat_id=42,
+        language=LanguageEnum.EN,
+        disabled=disabled,
+    )
+
+
+@pytest.mark.asyncio
+class TestChatCircuitBreaker:
+    """
+    Tests for the ChatCircuitBreaker class.
+    """
+
+    async def test_trips_after_threshold_and_disables_instance(self, breaker, project_service):
+        """
+        Tests that repeated permanent failures open the circuit and disable the instance once.
+        """
+        instance = _instance()
+
+        await breaker.record_failure(instance=instance, error="Forbidden")
+        assert breaker.allow(instance=instance)
+
+        await breaker.record_failure(instance=instance, error="Forbidden")
+        assert breaker.state(chat_id=42) == CircuitStateEnum.OPEN
+        assert not breaker.allow(instance=instance)
+
+        project_service.update_instance.assert_awaited_once_with(
+            instance_id=INSTANCE_ID, update_field="disabled", update_value=True
+        )
+        ChatCircuitBreaker._notify_admins.assert_awaited_once()
+
+    async def test_single_probe_after_interval(self, breaker):
+        """
+        Tests that once the probe interval has passed exactly one notification is let through.
+        """
+        instance = _instance()
+        for _ in range(2):
+            await breaker.record_failure(instance=instance, error="Forbidden")
+
+        breaker._circuits[42] = breaker._circuits[42]._replace(opened_at=time.monotonic() - 600)
+        assert breaker.state(chat_id=42) == CircuitStateEnum.HALF_OPEN
+
+        assert breaker.allow(instance=instance)
+        assert not breaker.allow(instance=instance)
+
+    async def test_disabled_instance_is_probed_and_enabled(self, breaker, project_service):
+        """
+        Tests that an instance disabled before a restart is probed and enabled when the chat is back.
+        """
+        instance = _instance(disabled=True)
+
+        assert breaker.allow(instance=instance)
+        assert not breaker.allow(instance=instance)
+
+        await breaker.record_success(instance=instance)
+
+        assert breaker.state(chat_id=42) == CircuitStateEnum.CLOSED
+        project_service.update_instance.assert_awaited_once_with(
+            instance_id=INSTANCE_ID, update_field="disabled", update_value=False
+        )
@@ -0,0 +1,205 @@
+import asyncio
+
+import pytest
+
+from src.core.Base.exceptions import DeliveryDeferredError
+from src.logic.services.delivery_lanes import DeliveryLanes, jump_hash
+
+
+class TestJumpHash:
+    """
+    Tests for the jump consistent hash.
+    """
+
+    def test_keys_stay_in_range(self):
+        """
+        Tests that every key, including negative chat ids, is mapped to an existing bucket.
+        """
+        assert {jump_hash(key=key, buckets=8) for key in range(-1000, 1000)} == set(range(8))
+
+    def test_growing_moves_few_keys(self):
+        """
+        Tests that adding a bucket moves only the keys that land in the new bucket.
+        """
+        keys = range(-10000, 10000)
+        moved = [key for key in keys if jump_hash(key=key, buckets=8) != jump_hash(key=key, buckets=9)]
+
+        assert all(jump_hash(key=key, buckets=9) == 8 for key in moved)
+        assert len(moved) < len(keys) / 8
+
+
+@pytest.mark.asyncio
+class TestDeliveryLanes:
+    """
+    Tests for the DeliveryLanes class.
+    """
+
+    async def test_chat_order_is_kept_while_chats_run_in_parallel(self):
+        """
+        Tests that items of a chat are handled in order while a slow chat does not block the others.
+        """
+        handled = []
+        release = asyncio.Event()
+
+        async def handler(items):
+            chat_id, index = items[0]
+            if chat_id == 1 and index == 0:
+                await release.wait()
+            handled.extend(items)
+
+        lanes = DeliveryLanes(count=4, size=10, handler=handler)
+        other_chat = next(chat_id for chat_id in range(2, 100) if lanes.lane_of(chat_id) != lanes.lane_of(1))
+        lanes.start()
+
+        for index in range(3):
+            await lanes.submit(chat_id=1, item=(1, index))
+            await lanes.submit(chat_id=other_chat, item=(other_chat, index))
+
+        await asyncio.sleep(0.05)
+        assert handled == [(other_chat, 0), (other_chat, 1), (other_chat, 2)]
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert [item for item in handled if item[0] == 1] == [(1, 0), (1, 1), (1, 2)]
+
+        await lanes.stop()
+
+    async def test_deferred_chat_does_not_block_its_lane(self):
+        """
+        Tests that a deferred chat is skipped for the delay while the other chats of its lane are delivered.
+        """
+        handled = []
+        deferrals = []
+
+        async def handler(items):
+            if items[0][0] == 1 and not deferrals:
+                deferrals.append(items)
+                raise DeliveryDeferredError(message="flood", items=items, delay=0.1)
+            handled.extend(items)
+
+        lanes = DeliveryLanes(count=1, size=10, handler=handler)
+        lanes.start()
+
+        await lanes.submit(chat_id=1, item=(1, 0))
+        await lanes.submit(chat_id=1, item=(1, 1))
+        await lanes.submit(chat_id=2, item=(2, 0))
+
+        await asyncio.sleep(0.05)
+        assert handled == [(2, 0)]
+
+        await asyncio.sleep(0.1)
+        assert handled == [(2, 0), (1, 0), (1, 1)]
+
+        await lanes.stop()
+
+    async def test_stats_report_depth_and_latency(self):
+        """
+        Tests that the statistics show the waiting items and the latency of the handled ones.
+        """
+        release = asyncio.Event()
+
+        async def handler(items):
+            await release.wait()
+
+        lanes = DeliveryLanes(count=2, size=10, handler=handler)
+        lanes.start()
+        lane = lanes.lane_of(chat_id=5)
+
+        for _ in range(3):
+            await lanes.submit(chat_id=5, item=None)
+        await asyncio.sleep(0.01)
+
+        assert lanes.stats()[lane].depth == 2
+
+        release.set()
+        await asyncio.sleep(0.01)
+        stats = lanes.stats()[lane]
+
+        assert stats.depth == 0
+        assert stats.processed == 3
+        assert stats.max_latency_ms >= stats.avg_latency_ms > 0
+
+        await lanes.stop()
+
+    async def test_chat_backlog_is_merged(self):
+        """
+        Tests that the waiting items of a chat are handled together while other chats keep their order.
+        """
+        batches = []
+        release = asyncio.Event()
+
+        async def handler(items):
+            if not batches:
+                await release.wait()
+            batches.append(items)
+
+        lanes = DeliveryLanes(count=1, size=10, handler=handler, merge=True)
+        lanes.start()
+
+        await lanes.submit(chat_id=1, item="a1")
+        await asyncio.sleep(0.01)
+        for item in ("a2", "b1", "a3", "b2"):
+            await lanes.submit(chat_id=1 if item.startswith("a") else 2, item=item)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert batches == [["a1"], ["a2", "a3"], ["b1", "b2"]]
+
+        await lanes.stop()
+
+    async def test_urgent_items_are_served_first_without_starvation(self):
+        """
+        Tests that more urgent items overtake waiting ones, except for items that have waited too long.
+        """
+        handled = []
+        release = asyncio.Event()
+
+        async def handler(items):
+            if not handled:
+                await release.wait()
+            handled.extend(items)
+
+        lanes = DeliveryLanes(count=1, size=10, handler=handler, levels=3, max_wait=0.05)
+        lanes.start()
+
+        await lanes.submit(chat_id=1, item="blocker", level=0)
+        await asyncio.sleep(0.01)
+        await lanes.submit(chat_id=2, item="old wiki", level=2)
+        await asyncio.sleep(0.06)
+        for chat_id, item, level in ((3, "wiki", 2), (4, "task", 1), (5, "critical", 0)):
+            await lanes.submit(chat_id=chat_id, item=item, level=level)
+
+        release.set()
+        await asyncio.sleep(0.02)
+
+        assert handled == ["blocker", "old wiki", "critical", "task", "wiki"]
+        assert [stats.processed for stats in lanes.level_stats()] == [2, 1, 2]
+
+        await lanes.stop()
+
+    async def test_urgent_item_does_not_overtake_its_chat(self):
+        """
+        Tests that without merging the priority chooses the chat, which is then served in submission order.
+        """
+        handled = []
+        release = asyncio.Event()
+
+        async def handler(items):
+            if not handled:
+                await release.wait()
+            handled.extend(items)
+
+        lanes = DeliveryLanes(count=1, size=10, handler=handler, levels=2)
+        lanes.start()
+
+        await lanes.submit(chat_id=1, item="blocker", level=0)
+        await asyncio.sleep(0.01)
+        for chat_id, item, level in ((2, "other", 1), (3, "normal", 1), (3, "urgent", 0)):
+            await lanes.submit(chat_id=chat_id, item=item, level=level)
+
+        release.set()
+        await asyncio.sleep(0.02)
+
+        assert handled == ["blocker", "normal", "urgent", "other"]
+
+        await lanes.stop()
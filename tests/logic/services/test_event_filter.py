@@ -0,0 +1,150 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.entities.enums.event_enums import (
+    EventActionEnum,
+    EventChangeEnum,
+    EventTypeEnum,
+)
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.schemas.project_data.project_schemas import (
+    FilterRuleModel,
+    InstanceModel,
+)
+from src.entities.schemas.webhook_data.webhook_payload_schemas import WebhookPayload
+from src.logic.services.event_filter import EventFilter, compile_rule
+
+INSTANCE_ID = "67d1a2b3c4d5e6f708192a3b"
+TASK_RAW = Path(__file__).parents[2] / "entities" / "fixtures" / "task_raw.json"
+
+
+@pytest.fixture
+def event_filter(monkeypatch) -> EventFilter:
+    """
+    Provides a fresh EventFilter without compiled rules.
+
+    :return: An EventFilter detached from the singleton.
+    :rtype: EventFilter
+    """
+    monkeypatch.setattr(EventFilter, "_instance", None)
+    return EventFilter()
+
+
+def _payload(diff: dict | None = None, tags: list | None = None, assigned: bool = False) -> WebhookPayload:
+    raw = json.loads(TASK_RAW.read_text())
+    raw["change"]["diff"] = diff or {}
+    raw["data"]["tags"] = tags or []
+    raw["data"]["assigned_to"] = raw["by"] if assigned else None
+    return WebhookPayload.model_validate(raw)
+
+
+def _instance(rules: list[FilterRuleModel]) -> InstanceModel:
+    return InstanceModel(
+        instance_id=INSTANCE_ID,
+        instance_name="instance",
+        project_id="project",
+        language=LanguageEnum.EN,
+        filter_rules=rules,
+    )
+
+
+STATUS_DIFF = {"status": {"from": "New", "to": "Done"}}
+TAGS_DIFF = {"tags": {"from": ["a"], "to": ["a", "b"]}}
+
+
+class TestCompileRule:
+    """
+    Tests for the compiled filter rule predicates.
+    """
+
+    def test_empty_rule_matches_everything(self):
+        """
+        Tests that a rule without conditions matches every event.
+        """
+        assert compile_rule(rule=FilterRuleModel())(_payload())
+
+    def test_type_and_action(self):
+        """
+        Tests that the type and the action are compared with the event.
+        """
+        payload = _payload()
+
+        assert compile_rule(rule=FilterRuleModel(type=EventTypeEnum.TASK, action=EventActionEnum.CHANGE))(payload)
+        assert not compile_rule(rule=FilterRuleModel(type=EventTypeEnum.TASK, action=EventActionEnum.CREATE))(payload)
+        assert not compile_rule(rule=FilterRuleModel(type=EventTypeEnum.ISSUE))(payload)
+
+    def test_changes(self):
+        """
+        Tests that a rule with changes matches events changing one of the fields, and only them with changes_only.
+        """
+        any_tags = compile_rule(rule=FilterRuleModel(changes=[EventChangeEnum.TAGS]))
+        only_tags = compile_rule(rule=FilterRuleModel(changes=[EventChangeEnum.TAGS], changes_only=True))
+
+        assert any_tags(_payload(diff={**STATUS_DIFF, **TAGS_DIFF}))
+        assert not any_tags(_payload(diff=STATUS_DIFF))
+        assert only_tags(_payload(diff=TAGS_DIFF))
+        assert not only_tags(_payload(diff={**STATUS_DIFF, **TAGS_DIFF}))
+        assert not only_tags(_payload())
+
+    def test_tags_assignees_and_authors(self):
+        """
+        Tests that tags are compared case-insensitively in both Taiga formats and users by their username.
+        """
+        payload = _payload(tags=[["Urgent", "#fff"], "backend"], assigned=True)
+        username = payload.by.username
+
+        assert compile_rule(rule=FilterRuleModel(tags=["urgent"]))(payload)
+        assert compile_rule(rule=FilterRuleModel(tags=["Backend"]))(payload)
+        assert not compile_rule(rule=FilterRuleModel(tags=["frontend"]))(payload)
+        assert compile_rule(rule=FilterRuleModel(assignees=[username]))(payload)
+        assert not compile_rule(rule=FilterRuleModel(assignees=[username]))(_payload())
+        assert compile_rule(rule=FilterRuleModel(authors=[username]))(payload)
+        assert not compile_rule(rule=FilterRuleModel(authors=["taigram_bot"]))(payload)
+
+
+class TestEventFilter:
+    """
+    Tests for the EventFilter class.
+    """
+
+    def test_first_matching_rule_wins(self, event_filter):
+        """
+        Tests that "only status changes" keeps status changes and drops the rest, counting the drops per rule.
+        """
+        instance = _instance(
+            rules=[FilterRuleModel(drop=False, changes=[EventChangeEnum.STATUS]), FilterRuleModel(drop=True)]
+        )
+
+        assert event_filter.allow(payload=_payload(diff=STATUS_DIFF), instance=instance)
+        assert not event_filter.allow(payload=_payload(diff=TAGS_DIFF), instance=instance)
+        assert not event_filter.allow(payload=_payload(), instance=instance)
+        assert event_filter.get_drop_counts(instance_id=INSTANCE_ID) == [0, 2]
+
+    def test_unmatched_events_are_delivered(self, event_filter):
+        """
+        Tests that events matching no rule are delivered.
+        """
+        instance = _instance(rules=[FilterRuleModel(changes=[EventChangeEnum.TAGS], changes_only=True)])
+
+        assert event_filter.allow(payload=_payload(diff=STATUS_DIFF), instance=instance)
+        assert not event_filter.allow(payload=_payload(diff=TAGS_DIFF), instance=instance)
+
+    def test_rules_are_compiled_once_per_version(self, event_filter):
+        """
+        Tests that unchanged rules reuse the predicates and changed rules are recompiled with fresh counters.
+        """
+        rules = [FilterRuleModel(type=EventTypeEnum.TASK)]
+
+        event_filter.allow(payload=_payload(), instance=_instance(rules=rules))
+        compiled = event_filter._compiled[INSTANCE_ID]
+        event_filter.allow(payload=_payload(), instance=_instance(rules=[rule.model_copy() for rule in rules]))
+
+        assert event_filter._compiled[INSTANCE_ID] is compiled
+        assert event_filter.get_drop_counts(instance_id=INSTANCE_ID) == [2]
+
+        event_filter.allow(payload=_payload(), instance=_instance(rules=[FilterRuleModel(type=EventTypeEnum.ISSUE)]))
+
+        assert event_filter._compiled[INSTANCE_ID] is not compiled
+        assert event_filter.get_drop_counts(instance_id=INSTANCE_ID) == [0]
@@ -0,0 +1,154 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from src.entities.enums.rollup_granularity_enum import RollupGranularityEnum
+from src.logic.services.event_stats import EventStats, get_bucket_start
+
+INSTANCE_ID = "67d1a2b3c4d5e6f708192a3b"
+
+
+@pytest.fixture
+def stats(monkeypatch) -> EventStats:
+    """
+    Provides a fresh EventStats with mocked Redis and Mongo managers.
+
+    :return: An EventStats detached from the singleton.
+    :rtype: EventStats
+    """
+    monkeypatch.setattr(EventStats, "_instance", None)
+    stats = EventStats()
+    stats._redis_manager = AsyncMock()
+    stats._redis_manager.get_hash.return_value = {}
+    stats._redis_manager.get_score.return_value = None
+    stats._mongo_manager = AsyncMock()
+    return stats
+
+
+@pytest.mark.asyncio
+class TestEventStats:
+    """
+    Tests for the EventStats class.
+    """
+
+    async def test_flush_writes_batched_counters(self, stats):
+        """
+        Tests that the counters of many events are written in one batch and then reset.
+        """
+        for _ in range(3):
+            stats.record_event(instance_id=INSTANCE_ID, event_type="task", action="change")
+        stats.record_skipped(instance_id=INSTANCE_ID)
+        stats.record_failures(instance_id=INSTANCE_ID, count=2)
+
+        await stats.flush()
+
+        stats._redis_manager.increment_hashes.assert_awaited_once_with(
+            counters={f"taigram:stats:{INSTANCE_ID}": {"event:task:change": 3, "skipped": 1, "failed": 2}}
+        )
+        assert list(stats._redis_manager.set_max_scores.await_args.kwargs["scores"]) == [INSTANCE_ID]
+        assert not stats._pending
+
+        await stats.flush()
+
+        stats._redis_manager.increment_hashes.assert_awaited_once()
+
+    async def test_failed_flush_keeps_counters(self, stats):
+        """
+        Tests that the counters are kept for the next flush when Redis is not available.
+        """
+        stats._redis_manager.increment_hashes.side_effect = ConnectionError
+        stats.record_event(instance_id=INSTANCE_ID, event_type="task", action="change")
+
+        await stats.flush()
+        stats.record_event(instance_id=INSTANCE_ID, event_type="task", action="change")
+
+        assert stats._pending[INSTANCE_ID]["event:task:change"] == 2
+        assert INSTANCE_ID in stats._last_seen
+
+    async def test_stats_include_pending_counters(self, stats):
+        """
+        Tests that the stored counters are summed up with the ones not written yet.
+        """
+        stats._redis_manager.get_hash.return_value = {"event:task:change": "5", "event:epic:create": "1", "failed": "1"}
+        stats._redis_manager.get_score.return_value = 100.0
+        stats.record_event(instance_id=INSTANCE_ID, event_type="task", action="change")
+
+        result = await stats.get_stats(instance_id=INSTANCE_ID)
+
+        assert result.events == {"epic:create": 1, "task:change": 6}
+        assert (result.skipped, result.failed) == (0, 1)
+        assert result.last_seen > 100.0
+
+    async def test_flush_rolls_up_hours_and_days(self, stats):
+        """
+        Tests that the counters are added to the hourly and daily rollups in one bulk write.
+        """
+        for _ in range(2):
+            stats.record_event(instance_id=INSTANCE_ID, event_type="task", action="change")
+        stats.record_failures(instance_id=INSTANCE_ID)
+
+        await stats.flush()
+
+        updates = stats._mongo_manager.increment_many.await_args.kwargs["updates"]
+        assert [query["granularity"] for query, _, _ in updates] == ["hour", "day"]
+        for query, increments, on_insert in updates:
+            assert query["instance_id"] == INSTANCE_ID
+            assert increments == {"counts.event:task:change": 2, "counts.failed": 1, "total": 2}
+            assert on_insert["expires_at"] > query["bucket"]
+        assert not stats._hourly
+
+    async def test_failed_rollup_keeps_counters(self, stats):
+        """
+        Tests that the rollup counters are kept for the next flush when Mongo is not available.
+        """
+        stats._mongo_manager.increment_many.side_effect = ConnectionError
+        stats.record_skipped(instance_id=INSTANCE_ID)
+
+        await stats.flush()
+
+        assert sum(counters["skipped"] for counters in stats._hourly.values()) == 1
+        assert not stats._pending
+
+    async def test_partial_rollup_failure_retries_only_failed_upserts(self, stats):
+        """
+        Tests that after a partially applied bulk write only the failed upserts are written again.
+        """
+        stats._mongo_manager.increment_many.side_effect = [
+            BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}]}),
+            None,
+        ]
+        stats.record_skipped(instance_id=INSTANCE_ID)
+
+        await stats.flush()
+        stats.record_failures(instance_id=INSTANCE_ID)
+        await stats.flush()
+
+        updates = stats._mongo_manager.increment_many.await_args.kwargs["updates"]
+        increments = {query["granularity"]: increments for query, increments, _ in updates}
+        assert increments == {
+            "hour": {"counts.failed": 1, "total": 0},
+            "day": {"counts.skipped": 1, "counts.failed": 1, "total": 0},
+        }
+        assert not stats._hourly
+        assert not stats._failed_rollups
+
+
+class TestGetBucketStart:
+    """
+    Tests for the get_bucket_start function.
+    """
+
+    def test_day_starts_at_local_midnight(self):
+        """
+        Tests that a day bucket starts at midnight of the configured time zone.
+        """
+        moment = datetime(2025, 3, 10, 22, 30, tzinfo=UTC)
+
+        assert get_bucket_start(moment=moment, granularity=RollupGranularityEnum.HOUR) == datetime(
+            2025, 3, 10, 22, tzinfo=UTC
+        )
+        assert get_bucket_start(moment=moment, granularity=RollupGranularityEnum.DAY) == datetime(
+            2025, 3, 10, 21, tzinfo=UTC
+        )
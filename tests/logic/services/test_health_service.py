@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.startup import StartupOrchestrator
+from src.entities.named_tuples.mongo_tuples import PoolStatsTuple
+from src.logic.services.health_service import HealthService
+
+
+@pytest.fixture
+def health(monkeypatch) -> HealthService:
+    """
+    Provides a fresh HealthService with mocked dependencies and a finished startup.
+
+    :return: A HealthService detached from the singleton.
+    :rtype: HealthService
+    """
+    monkeypatch.setattr(HealthService, "_instance", None)
+    monkeypatch.setattr(StartupOrchestrator, "_instance", None)
+    StartupOrchestrator()._ready = True
+
+    health = HealthService()
+    for name in ("_ping_mongo", "_ping_redis", "_get_me"):
+        monkeypatch.setattr(health, name, AsyncMock(return_value=None))
+    monkeypatch.setattr(health, "_get_queue_depths", AsyncMock(return_value={"lanes": 0}))
+    monkeypatch.setattr(health, "_get_pool_stats", lambda: PoolStatsTuple(checkouts=3)._asdict())
+    return health
+
+
+@pytest.mark.asyncio
+class TestHealthService:
+    """
+    Tests for the HealthService class.
+    """
+
+    async def test_ready_when_dependencies_respond(self, health):
+        """
+        Tests that the process is ready and the probe results are reported.
+        """
+        readiness = await health.get_readiness()
+
+        assert readiness["ready"]
+        assert set(readiness["checks"]) == {"mongo", "redis", "bot_api"}
+        assert readiness["queue"] == {"lanes": 0}
+        assert readiness["mongo_pool"]["checkouts"] == 3
+
+    async def test_probes_are_cached(self, health):
+        """
+        Tests that repeated and concurrent checks run every probe once within the cache time.
+        """
+        await asyncio.gather(*(health.get_readiness() for _ in range(5)))
+        await health.get_readiness()
+
+        health._ping_mongo.assert_awaited_once()
+        health._get_me.assert_awaited_once()
+
+    async def test_not_ready_when_mongo_fails(self, health):
+        """
+        Tests that a failed Mongo probe makes the process not ready, while a failed Bot API probe does not.
+        """
+        health._get_me.side_effect = ConnectionError("telegram")
+        assert (await health.get_readiness())["ready"]
+
+        health._probes.clear()
+        health._ping_mongo.side_effect = ConnectionError("mongo")
+        readiness = await health.get_readiness()
+
+        assert not readiness["ready"]
+        assert not readiness["checks"]["mongo"]["ok"]
+        assert "mongo" in readiness["checks"]["mongo"]["error"]
+
+    async def test_not_ready_before_startup_or_with_loop_lag(self, health):
+        """
+        Tests that the process is not ready before the startup has finished or while the event loop lags.
+        """
+        StartupOrchestrator()._ready = False
+        assert not (await health.get_readiness())["ready"]
+
+        StartupOrchestrator()._ready = True
+        health._loop_lag = 10.0
+        assert not (await health.get_readiness())["ready"]
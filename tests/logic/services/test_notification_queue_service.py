@@ -0,0 +1,184 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.Base.exceptions import DeliveryDeferredError, NotificationDeliveryError
+from src.core.settings import get_settings
+from src.entities.named_tuples.queue_tuples import NotificationEntryTuple
+from src.logic.services.notification_queue_service import NotificationQueueService
+
+PAYLOAD = json.dumps(
+    {
+        "action": "test",
+        "type": "test",
+        "by": {"id": 1, "permalink": "https://taiga.example/u", "username": "u", "full_name": "U", "gravatar_id": "g"},
+        "date": "2025-01-01T00:00:00Z",
+        "data": {"test": "test"},
+    }
+)
+
+
+@pytest.fixture
+def queue_service(monkeypatch) -> NotificationQueueService:
+    """
+    Provides a NotificationQueueService with a mocked stream manager.
+
+    :return: A NotificationQueueService detached from the singleton.
+    :rtype: NotificationQueueService
+    """
+    monkeypatch.setattr(NotificationQueueService, "_instance", None)
+    monkeypatch.setattr(get_settings(), "NOTIFICATIONS_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(get_settings(), "NOTIFICATIONS_BACKOFF_BASE", 2)
+    monkeypatch.setattr(get_settings(), "NOTIFICATIONS_BACKOFF_MAX", 3)
+
+    service = NotificationQueueService()
+    service._stream_manager = AsyncMock()
+    return service
+
+
+def _entry(attempts: int = 0, entry_id: str = "1-0", instance_id: str = "instance") -> NotificationEntryTuple:
+    return NotificationEntryTuple(
+        entry_id=entry_id, instance_id=instance_id, chat_id=42, payload=PAYLOAD, attempts=attempts
+    )
+
+
+@pytest.mark.asyncio
+class TestNotificationQueueService:
+    """
+    Tests for the NotificationQueueService class.
+    """
+
+    async def test_delivered_entry_is_acknowledged(self, queue_service, monkeypatch):
+        """
+        Tests that an entry is acknowledged only after it has been delivered.
+        """
+        monkeypatch.setattr(NotificationQueueService, "deliver", AsyncMock())
+
+        await queue_service._process(entries=[_entry()])
+
+        queue_service._stream_manager.ack.assert_awaited_once_with(
+            stream=queue_service.stream, group=queue_service._group, entry_ids=["1-0"]
+        )
+        queue_service._stream_manager.ack_and_schedule.assert_not_awaited()
+
+    async def test_failed_entry_is_retried_with_backoff(self, queue_service, monkeypatch):
+        """
+        Tests that a failed entry is rescheduled with an exponentially growing, capped delay.
+        """
+        monkeypatch.setattr(NotificationQueueService, "deliver", AsyncMock(side_effect=RuntimeError("boom")))
+        monkeypatch.setattr("src.logic.services.notification_queue_service.time.time", lambda: 1000)
+
+        await queue_service._process(entries=[_entry(attempts=0)])
+        await queue_service._process(entries=[_entry(attempts=1)])
+
+        first, second = queue_service._stream_manager.ack_and_schedule.await_args_list
+        assert first.kwargs["due"] == 1002
+        assert second.kwargs["due"] == 1003
+        assert json.loads(second.kwargs["member"])["attempts"] == "2"
+        queue_service._stream_manager.ack.assert_not_awaited()
+
+    async def test_partially_delivered_batch_retries_only_unsent_entries(self, queue_service, monkeypatch):
+        """
+        Tests that the entries sent before a failure are acknowledged and only the others are retried.
+        """
+        error = NotificationDeliveryError(message="boom", delivered=1)
+        monkeypatch.setattr(NotificationQueueService, "deliver", AsyncMock(side_effect=error))
+
+        await queue_service._process(entries=[_entry(entry_id="1-0"), _entry(entry_id="2-0")])
+
+        queue_service._stream_manager.ack.assert_awaited_once_with(
+            stream=queue_service.stream, group=queue_service._group, entry_ids=["1-0"]
+        )
+        assert queue_service._stream_manager.ack_and_schedule.await_args.kwargs["entry_id"] == "2-0"
+
+    async def test_flood_control_defers_the_chat(self, queue_service, monkeypatch):
+        """
+        Tests that entries under flood control are deferred in their lane and retried once the deferrals are used up.
+        """
+        monkeypatch.setattr(get_settings(), "NOTIFICATIONS_FLOOD_RETRIES", 1)
+        error = NotificationDeliveryError(message="flood", delivered=0, retry_after=5)
+        monkeypatch.setattr(NotificationQueueService, "deliver", AsyncMock(side_effect=error))
+        entries = [_entry(entry_id="1-0", instance_id="a"), _entry(entry_id="2-0", instance_id="b")]
+        queue_service._in_flight = {"1-0", "2-0"}
+
+        with pytest.raises(DeliveryDeferredError) as deferred:
+            await queue_service._process_chat(entries=entries)
+
+        assert deferred.value.items == entries
+        assert deferred.value.delay == 5
+        assert queue_service._in_flight == {"1-0", "2-0"}
+        queue_service._stream_manager.ack_and_schedule.assert_not_awaited()
+
+        await queue_service._process(entries=entries[:1])
+
+        assert queue_service._stream_manager.ack_and_schedule.await_args.kwargs["entry_id"] == "1-0"
+        assert queue_service._in_flight == {"2-0"}
+
+    async def test_exhausted_entry_is_dead_lettered(self, queue_service, monkeypatch):
+        """
+        Tests that an entry is moved to the dead letters once it has used up its attempts.
+        """
+        monkeypatch.setattr(NotificationQueueService, "deliver", AsyncMock(side_effect=RuntimeError("boom")))
+
+        await queue_service._process(entries=[_entry(attempts=2)])
+
+        queue_service._stream_manager.ack_and_schedule.assert_not_awaited()
+        fields = queue_service._stream_manager.ack_and_add.await_args.kwargs["fields"]
+        assert queue_service._stream_manager.ack_and_add.await_args.kwargs["target"] == queue_service.dead_letter_stream
+        assert fields["attempts"] == 3
+        assert "boom" in fields["error"]
+
+    async def test_invalid_payload_is_not_retried(self, queue_service):
+        """
+        Tests that a payload which can never be parsed goes to the dead letters immediately.
+        """
+        await queue_service._process(entries=[_entry()._replace(payload="not json")])
+
+        queue_service._stream_manager.ack_and_schedule.assert_not_awaited()
+        queue_service._stream_manager.ack_and_add.assert_awaited_once()
+
+    async def test_replay_moves_all_dead_letters(self, queue_service):
+        """
+        Tests that replaying moves dead letters in batches until none are left.
+        """
+        queue_service._stream_manager.move.side_effect = [50, 7, 0]
+
+        assert await queue_service.replay_dead_letters() == 57
+        assert queue_service._stream_manager.move.await_args.kwargs["fields_update"]["attempts"] == 0
+
+    async def test_reclaimed_entry_waiting_in_a_lane_is_skipped(self, queue_service):
+        """
+        Tests that an entry still waiting in a lane is not submitted again when it is reclaimed.
+        """
+        queue_service._lanes = AsyncMock()
+        entries = [("1-0", {"instance_id": "instance", "chat_id": "42", "payload": "{}", "attempts": "0"})]
+
+        await queue_service._submit(entries=entries)
+        await queue_service._submit(entries=entries)
+
+        queue_service._lanes.submit.assert_awaited_once()
+        assert queue_service._in_flight == {"1-0"}
+
+    async def test_backlog_is_delivered_per_instance_run(self, queue_service, monkeypatch):
+        """
+        Tests that a chat backlog is delivered in merged runs of consecutive entries of the same instance.
+        """
+        deliver = AsyncMock()
+        monkeypatch.setattr(NotificationQueueService, "deliver", deliver)
+        entries = [
+            _entry(entry_id="1-0", instance_id="a"),
+            _entry(entry_id="2-0", instance_id="a"),
+            _entry(entry_id="3-0", instance_id="b"),
+        ]
+
+        await queue_service._process_chat(entries=entries)
+
+        assert [(call.kwargs["instance_id"], len(call.kwargs["payloads"])) for call in deliver.await_args_list] == [
+            ("a", 2),
+            ("b", 1),
+        ]
+        assert [call.kwargs["entry_ids"] for call in queue_service._stream_manager.ack.await_args_list] == [
+            ["1-0", "2-0"],
+            ["3-0"],
+        ]
@@ -0,0 +1,185 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.settings import get_settings
+from src.entities.enums.archive_codec_enum import ArchiveCodecEnum
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.schemas.archive_data.archive_schemas import ArchivedWebhookModel
+from src.entities.schemas.project_data.project_schemas import (
+    InstanceModel,
+    ProjectSchema,
+)
+from src.logic.services import webhook_replay
+from src.logic.services.event_filter import EventFilter
+from src.logic.services.webhook_archive import WebhookArchive
+from src.logic.services.webhook_replay import replay_webhooks
+from src.utils.compression_utils import compress_bodies, decompress_body
+
+INSTANCE_ID = "67d1a2b3c4d5e6f708192a3b"
+FIXTURES = Path(__file__).parents[2] / "entities" / "fixtures"
+
+
+@pytest.fixture
+def archive(monkeypatch) -> WebhookArchive:
+    """
+    Provides a started WebhookArchive with a mocked Mongo manager.
+
+    :return: A WebhookArchive detached from the singleton.
+    :rtype: WebhookArchive
+    """
+    monkeypatch.setattr(WebhookArchive, "_instance", None)
+    monkeypatch.setattr(get_settings(), "WEBHOOK_ARCHIVE_BATCH_SIZE", 2)
+    monkeypatch.setattr(get_settings(), "WEBHOOK_ARCHIVE_MAX_BUFFER", 3)
+
+    archive = WebhookArchive()
+    archive._mongo_manager = AsyncMock()
+    archive._task = AsyncMock()
+    return archive
+
+
+def _archived(body: bytes, seconds: int = 0) -> ArchivedWebhookModel:
+    return ArchivedWebhookModel(
+        instance_id=INSTANCE_ID,
+        received_at=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(seconds=seconds),
+        codec=ArchiveCodecEnum.ZLIB,
+        body=compress_bodies(bodies=[body], codec=ArchiveCodecEnum.ZLIB, level=3)[0],
+    )
+
+
+class TestCompression:
+    """
+    Tests for the archive compression codecs.
+    """
+
+    @pytest.mark.parametrize("codec", list(ArchiveCodecEnum))
+    def test_round_trip(self, codec):
+        """
+        Tests that compressed bodies are restored unchanged.
+        """
+        body = (FIXTURES / "task_raw.json").read_bytes()
+
+        compressed = compress_bodies(bodies=[body, b"{}"], codec=codec, level=3)
+
+        assert len(compressed[0]) < len(body)
+        assert [decompress_body(body=item, codec=codec) for item in compressed] == [body, b"{}"]
+
+
+@pytest.mark.asyncio
+class TestWebhookArchive:
+    """
+    Tests for the WebhookArchive class.
+    """
+
+    async def test_flush_writes_compressed_batch(self, archive):
+        """
+        Tests that buffered webhooks are written in one batch with compressed bodies.
+        """
+        archive.add(instance_id=INSTANCE_ID, body=b'{"a": 1}')
+        archive.add(instance_id=INSTANCE_ID, body=b'{"a": 2}')
+
+        assert archive._full.is_set()
+        assert await archive.flush() == 2
+
+        documents = archive._mongo_manager.insert_documents.await_args.kwargs["documents"]
+        assert [decompress_body(body=doc["body"], codec=doc["codec"]) for doc in documents] == [
+            b'{"a": 1}',
+            b'{"a": 2}',
+        ]
+        assert all(doc["instance_id"] == INSTANCE_ID for doc in documents)
+        assert not archive._buffer
+
+    async def test_full_buffer_skips_webhooks(self, archive):
+        """
+        Tests that webhooks are not buffered beyond the limit.
+        """
+        for index in range(5):
+            archive.add(instance_id=INSTANCE_ID, body=str(index).encode())
+
+        assert len(archive._buffer) == 3
+        assert archive._skipped == 2
+
+    async def test_failed_write_is_dropped(self, archive):
+        """
+        Tests that a failed batch is dropped instead of being retried forever.
+        """
+        archive._mongo_manager.insert_documents.side_effect = RuntimeError("down")
+        archive.add(instance_id=INSTANCE_ID, body=b"{}")
+
+        assert await archive.flush() == 0
+        assert not archive._buffer
+
+    async def test_disabled_archive_ignores_webhooks(self, archive):
+        """
+        Tests that nothing is buffered while the archive is not started.
+        """
+        archive._task = None
+        archive.add(instance_id=INSTANCE_ID, body=b"{}")
+
+        assert not archive._buffer
+
+
+@pytest.mark.asyncio
+class TestReplayWebhooks:
+    """
+    Tests for the replay_webhooks function.
+    """
+
+    @pytest.fixture(autouse=True)
+    def replay_environment(self, monkeypatch) -> AsyncMock:
+        """
+        Replays two valid webhooks and a malformed one for an instance following tasks only.
+        """
+        monkeypatch.setattr(EventFilter, "_instance", None)
+        archived = [
+            _archived((FIXTURES / "task_raw.json").read_bytes()),
+            _archived((FIXTURES / "milestone_raw.json").read_bytes(), seconds=1),
+            _archived(b'{"type": "task", "action": "change"}', seconds=2),
+        ]
+
+        async def iterate(**kwargs):
+            for item in archived:
+                yield item
+
+        project = ProjectSchema(
+            _id="67d1a2b3c4d5e6f708192a3c",
+            name="project",
+            instances=[
+                InstanceModel(
+                    instance_id=INSTANCE_ID,
+                    instance_name="instance",
+                    project_id="project",
+                    language=LanguageEnum.EN,
+                    fat=["task"],
+                )
+            ],
+        )
+        monkeypatch.setattr(WebhookArchive, "iterate", lambda self, **kwargs: iterate(**kwargs))
+        project_service = AsyncMock(get_instance=AsyncMock(return_value=project))
+        monkeypatch.setattr(webhook_replay, "ProjectService", lambda: project_service)
+        monkeypatch.setattr(webhook_replay, "get_message", lambda **kwargs: ("", []))
+
+        service = AsyncMock()
+        monkeypatch.setattr(webhook_replay.WebhookService, "process_wh_data", service)
+        return service
+
+    async def test_dry_run_renders_without_sending(self, replay_environment):
+        """
+        Tests that a dry run goes through the webhook checks without sending notifications.
+        """
+        stats = await replay_webhooks(since=datetime(2025, 1, 1), until=datetime(2025, 1, 2))
+
+        assert (stats.replayed, stats.skipped, stats.failed) == (1, 1, 1)
+        replay_environment.assert_not_awaited()
+
+    async def test_replay_sends_at_speed(self, replay_environment):
+        """
+        Tests that webhooks are sent with the original gaps shortened by the speed factor.
+        """
+        stats = await replay_webhooks(since=datetime(2025, 1, 1), until=datetime(2025, 1, 2), speed=20, dry_run=False)
+
+        assert stats.replayed == 1
+        assert stats.elapsed >= 0.1
+        replay_environment.assert_awaited_once()
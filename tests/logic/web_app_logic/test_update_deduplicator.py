@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.core.settings import get_settings
+from src.logic.web_app_logic.update_deduplicator import UpdateDeduplicator
+
+
+@pytest.fixture
+def deduplicator(monkeypatch) -> UpdateDeduplicator:
+    """
+    Provides a fresh in-memory UpdateDeduplicator with a small window.
+
+    :return: An UpdateDeduplicator detached from the singleton.
+    :rtype: UpdateDeduplicator
+    """
+    monkeypatch.setattr(UpdateDeduplicator, "_instance", None)
+    monkeypatch.setattr(get_settings(), "UPDATES_DEDUP_WINDOW", 3)
+    monkeypatch.setattr(get_settings(), "UPDATES_DEDUP_REDIS", False)
+
+    return UpdateDeduplicator()
+
+
+@pytest.mark.asyncio
+class TestUpdateDeduplicator:
+    """
+    Tests for the UpdateDeduplicator class.
+    """
+
+    async def test_redelivery_is_detected(self, deduplicator):
+        """
+        Tests that the second delivery of the same update is reported as a duplicate.
+        """
+        assert not await deduplicator.is_duplicate(update_id=1)
+        assert await deduplicator.is_duplicate(update_id=1)
+
+    async def test_window_slides(self, deduplicator):
+        """
+        Tests that only the most recent update ids are remembered.
+        """
+        for update_id in range(1, 5):
+            await deduplicator.is_duplicate(update_id=update_id)
+
+        assert not await deduplicator.is_duplicate(update_id=1)
+        assert await deduplicator.is_duplicate(update_id=4)
+
+    async def test_forgotten_update_is_processed_again(self, deduplicator):
+        """
+        Tests that a failed update is accepted when Telegram redelivers it.
+        """
+        await deduplicator.is_duplicate(update_id=1)
+        await deduplicator.forget(update_id=1)
+
+        assert not await deduplicator.is_duplicate(update_id=1)
+
+    async def test_shared_redis_claim(self, deduplicator):
+        """
+        Tests that an update already claimed by another worker is reported as a duplicate.
+        """
+        deduplicator._redis_manager = AsyncMock()
+        deduplicator._redis_manager.set_if_absent.return_value = False
+
+        assert await deduplicator.is_duplicate(update_id=1)
+
+    async def test_redis_errors_do_not_drop_updates(self, deduplicator):
+        """
+        Tests that the update is processed when Redis is unavailable.
+        """
+        deduplicator._redis_manager = AsyncMock()
+        deduplicator._redis_manager.set_if_absent.side_effect = ConnectionError()
+
+        assert not await deduplicator.is_duplicate(update_id=1)
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.settings import Configuration
+from src.logic.web_app_logic import update_parser
+from src.logic.web_app_logic.update_parser import parse_update
+
+MESSAGE_UPDATE = {
+    "update_id": 1,
+    "message": {
+        "message_id": 1,
+        "date": 1729300000,
+        "chat": {"id": 1, "type": "private"},
+        "text": "/start",
+    },
+}
+EDITED_MESSAGE_UPDATE = {"update_id": 2, "edited_message": MESSAGE_UPDATE["message"]}
+
+
+@pytest.fixture(autouse=True)
+def allowed_update_types(monkeypatch) -> None:
+    """
+    Restricts the allowed update types to messages and callback queries.
+    """
+    monkeypatch.setattr(update_parser, "get_allowed_update_types", lambda: frozenset({"message", "callback_query"}))
+
+
+class TestParseUpdate:
+    """
+    Tests for the parse_update function.
+    """
+
+    def test_update_is_bound_to_bot(self):
+        """
+        Tests that the parsed update and its nested objects are mounted to the bot.
+        """
+        update = parse_update(body=json.dumps(MESSAGE_UPDATE).encode())
+
+        assert update.bot is Configuration.bot
+        assert update.message.bot is Configuration.bot
+
+    def test_unhandled_update_type_is_rejected(self):
+        """
+        Tests that updates of types without handlers are skipped.
+        """
+        assert parse_update(body=json.dumps(EDITED_MESSAGE_UPDATE).encode()) is None
+
+    def test_invalid_body_raises(self):
+        """
+        Tests that an invalid body raises a validation error.
+        """
+        with pytest.raises(ValidationError):
+            parse_update(body=b"{not json")
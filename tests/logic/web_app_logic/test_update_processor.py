@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.methods import AnswerCallbackQuery, SendDocument
+from aiogram.types import BufferedInputFile, Update
+
+from src.core.settings import Configuration
+from src.logic.web_app_logic.update_deduplicator import UpdateDeduplicator
+from src.logic.web_app_logic.update_processor import (
+    UpdateProcessor,
+    build_webhook_reply,
+)
+
+
+@pytest.fixture
+def processor(monkeypatch) -> UpdateProcessor:
+    """
+    Provides a fresh UpdateProcessor with an inline reply timeout.
+
+    :return: An UpdateProcessor detached from the singleton.
+    :rtype: UpdateProcessor
+    """
+    monkeypatch.setattr(UpdateProcessor, "_instance", None)
+    monkeypatch.setattr(Configuration.settings, "UPDATES_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(Configuration.settings, "UPDATES_REPLY_TIMEOUT", 0.5)
+    monkeypatch.setattr(Configuration.dispatcher, "silent_call_request", AsyncMock())
+
+    return UpdateProcessor()
+
+
+@pytest.mark.asyncio
+class TestUpdateProcessor:
+    """
+    Tests for the UpdateProcessor class.
+    """
+
+    async def test_fast_handler_method_is_returned_inline(self, processor, monkeypatch):
+        """
+        Tests that a method returned within the reply timeout is serialised into the webhook response.
+        """
+        method = AnswerCallbackQuery(callback_query_id="42", text="done")
+        monkeypatch.setattr(Configuration.dispatcher, "feed_update", AsyncMock(return_value=method))
+
+        reply = await processor.process(update=Update(update_id=1))
+
+        assert reply == {"method": "answerCallbackQuery", "callback_query_id": "42", "text": "done"}
+        Configuration.dispatcher.silent_call_request.assert_not_awaited()
+
+    async def test_slow_handler_is_acknowledged_immediately(self, processor, monkeypatch):
+        """
+        Tests that a slow handler keeps running in the background and its method is called separately.
+        """
+        release = asyncio.Event()
+        method = AnswerCallbackQuery(callback_query_id="42")
+
+        async def slow_feed_update(*args, **kwargs):
+            await release.wait()
+            return method
+
+        monkeypatch.setattr(Configuration.settings, "UPDATES_REPLY_TIMEOUT", 0)
+        monkeypatch.setattr(UpdateProcessor, "_instance", None)
+        processor = UpdateProcessor()
+        monkeypatch.setattr(Configuration.dispatcher, "feed_update", slow_feed_update)
+
+        assert await processor.process(update=Update(update_id=1)) is None
+        assert processor.pending == 1
+
+        release.set()
+        await processor.close(timeout=1)
+        # the returned method is executed by a follow-up task
+        await processor.close(timeout=1)
+
+        Configuration.dispatcher.silent_call_request.assert_awaited_once()
+        assert processor.pending == 0
+
+    async def test_failed_update_is_forgotten(self, processor, monkeypatch):
+        """
+        Tests that an update failing in the background is released from the deduplication guard.
+        """
+        forget = AsyncMock()
+        monkeypatch.setattr(UpdateDeduplicator, "forget", forget)
+        monkeypatch.setattr(Configuration.dispatcher, "feed_update", AsyncMock(side_effect=RuntimeError("boom")))
+
+        assert await processor.process(update=Update(update_id=7)) is None
+        await asyncio.sleep(0)
+        await processor.close(timeout=1)
+
+        forget.assert_awaited_once_with(update_id=7)
+
+    async def test_pool_is_bounded(self, processor, monkeypatch):
+        """
+        Tests that no more updates than the configured limit are processed at once.
+        """
+        release = asyncio.Event()
+
+        async def blocked_feed_update(*args, **kwargs):
+            await release.wait()
+
+        monkeypatch.setattr(Configuration.dispatcher, "feed_update", blocked_feed_update)
+        processor._reply_timeout = 0
+
+        await processor.process(update=Update(update_id=1))
+        await processor.process(update=Update(update_id=2))
+        third = asyncio.create_task(processor.process(update=Update(update_id=3)))
+        await asyncio.sleep(0.05)
+
+        assert not third.done()
+
+        release.set()
+        await asyncio.wait_for(third, timeout=1)
+        await processor.close(timeout=1)
+
+    async def test_methods_with_files_are_not_inlined(self):
+        """
+        Tests that methods uploading files cannot be returned in the webhook response.
+        """
+        method = SendDocument(chat_id=1, document=BufferedInputFile(b"data", filename="file.txt"))
+
+        assert build_webhook_reply(method=method) is None
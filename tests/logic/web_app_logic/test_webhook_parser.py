@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+
+from src.core.settings import get_settings
+from src.entities.enums.event_enums import EventTypeEnum
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.schemas.project_data.project_schemas import InstanceModel
+from src.logic.web_app_logic.webhook_parser import (
+    is_subscribed,
+    parse_webhook,
+    peek_webhook_event,
+    read_webhook_body,
+    shrink_webhook,
+)
+
+FIXTURES = Path(__file__).parents[2] / "entities" / "fixtures"
+
+
+class TestPeekWebhookEvent:
+    """
+    Tests for the peek_webhook_event function.
+    """
+
+    def test_reads_type_and_action(self):
+        """
+        Tests that the type and the action are read from a full Taiga webhook.
+        """
+        body = (FIXTURES / "task_raw.json").read_bytes()
+
+        assert peek_webhook_event(body=body) == {"type": "task", "action": "change"}
+        assert parse_webhook(body=body).type == "task"
+
+    def test_ignores_invalid_payload(self):
+        """
+        Tests that the rest of the body is not validated, so unfollowed webhooks are rejected cheaply.
+        """
+        assert peek_webhook_event(body=b'{"type": "wikipage", "action": "create", "data": null}') == {
+            "type": "wikipage",
+            "action": "create",
+        }
+
+    @pytest.mark.parametrize("body", [b"not json", b"[]", b'{"type": "task"}', b'{"type": 1, "action": "create"}'])
+    def test_rejects_malformed_body(self, body):
+        """
+        Tests that a body without a string type and action raises a validation error.
+        """
+        with pytest.raises(ValidationError):
+            peek_webhook_event(body=body)
+
+
+class TestIsSubscribed:
+    """
+    Tests for the is_subscribed function.
+    """
+
+    def test_checks_followed_action_types(self):
+        """
+        Tests that only the followed event types pass.
+        """
+        instance = InstanceModel(
+            instance_id="67d1a2b3c4d5e6f708192a3b",
+            instance_name="instance",
+            project_id="project",
+            language=LanguageEnum.EN,
+            fat=[EventTypeEnum.TASK],
+        )
+
+        assert is_subscribed(header={"type": "task", "action": "change"}, instance=instance)
+        assert not is_subscribed(header={"type": "issue", "action": "change"}, instance=instance)
+
+
+def _request(chunks: list[bytes], headers: dict[str, str] | None = None) -> Request:
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    raw_headers = [(key.encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request(scope={"type": "http", "method": "POST", "headers": raw_headers}, receive=receive)
+
+
+@pytest.mark.asyncio
+class TestReadWebhookBody:
+    """
+    Tests for the read_webhook_body function.
+    """
+
+    async def test_reads_body_within_limit(self):
+        """
+        Tests that a body within the limit is read in full.
+        """
+        assert await read_webhook_body(request=_request([b"abc", b"def"]), max_size=6) == b"abcdef"
+
+    async def test_rejects_streamed_body_over_limit(self):
+        """
+        Tests that reading stops with 413 once the streamed body exceeds the limit.
+        """
+        with pytest.raises(HTTPException) as e:
+            await read_webhook_body(request=_request([b"abc", b"def", b"ghi"]), max_size=5)
+
+        assert e.value.status_code == 413
+
+    async def test_rejects_announced_body_over_limit(self):
+        """
+        Tests that a body announced as too large is rejected before it is read.
+        """
+        request = _request([b"abc"], headers={"content-length": "1000"})
+
+        with pytest.raises(HTTPException) as e:
+            await read_webhook_body(request=request, max_size=5)
+
+        assert e.value.status_code == 413
+
+
+class TestShrinkWebhook:
+    """
+    Tests for the shrink_webhook function.
+    """
+
+    def test_small_body_is_unchanged(self):
+        """
+        Tests that a body shorter than the field limit is returned as is.
+        """
+        body = (FIXTURES / "task_raw.json").read_bytes()
+
+        assert shrink_webhook(body=body) is body
+
+    def test_long_fields_are_cut_before_validation(self, monkeypatch):
+        """
+        Tests that long strings are cut and the result is still a valid webhook.
+        """
+        monkeypatch.setattr(get_settings(), "WEBHOOK_MAX_FIELD_LENGTH", 500)
+        raw = json.loads((FIXTURES / "task_raw.json").read_text())
+        raw["data"]["description"] = "<p>" + "ы" * 10000 + "</p>"
+
+        wh_data = parse_webhook(body=shrink_webhook(body=json.dumps(raw).encode()))
+
+        assert wh_data.data.description == "<p>" + "ы" * 497
+        assert wh_data.data.subject == raw["data"]["subject"]
+
+    def test_non_ascii_text_is_not_escaped(self, monkeypatch):
+        """
+        Tests that Cyrillic text is written as UTF-8, so the shrunk body is not larger than the original.
+        """
+        monkeypatch.setattr(get_settings(), "WEBHOOK_MAX_FIELD_LENGTH", 500)
+        raw = json.loads((FIXTURES / "task_raw.json").read_text())
+        raw["data"]["subject"] = "Задача"
+        raw["data"]["description"] = "ы" * 1000
+        body = json.dumps(raw, ensure_ascii=False).encode()
+
+        shrunk = shrink_webhook(body=body)
+
+        assert "Задача".encode() in shrunk
+        assert len(shrunk) < len(body)
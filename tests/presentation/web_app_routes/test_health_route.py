@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.logic.services.health_service import HealthService
+from src.presentation.web_app_routes.health_route import health_router
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """
+    Provides a test client of an application serving the health routes only.
+
+    :return: The test client.
+    :rtype: TestClient
+    """
+    app = FastAPI()
+    app.include_router(health_router)
+    return TestClient(app)
+
+
+class TestHealthRoute:
+    """
+    Tests for the health routes.
+    """
+
+    def test_healthz(self, client):
+        """
+        Tests that the liveness route responds without probing the dependencies.
+        """
+        response = client.get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.parametrize("ready, status_code", [(True, 200), (False, 503)])
+    def test_readyz(self, client, monkeypatch, ready, status_code):
+        """
+        Tests that the readiness route returns 503 when the process is not ready.
+        """
+        monkeypatch.setattr(HealthService, "get_readiness", AsyncMock(return_value={"ready": ready}))
+
+        response = client.get("/readyz")
+
+        assert response.status_code == status_code
+        assert response.json() == {"ready": ready}
@@ -0,0 +1,135 @@
+import pytest
+import pytest_asyncio
+from aiogram import Bot
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.Base.exceptions import AttachmentTooLargeError
+from src.core.settings import Configuration, get_settings
+from src.entities.schemas.webhook_data.diff_webhook_schemas import DiffBaseAttachment
+from src.utils import attachment_utils
+from src.utils.attachment_utils import (
+    CappedURLInputFile,
+    prepare_attachments,
+    send_attachments,
+)
+
+MB = 1024 * 1024
+FILES = {"small.txt": b"a" * 1000, "medium.bin": b"b" * (2 * MB), "large.bin": b"c" * (3 * MB)}
+
+
+async def _serve_file(request: web.Request) -> web.StreamResponse:
+    """
+    Serves a file like Taiga's storage, in chunks and with Content-Length.
+    """
+    if (content := FILES.get(request.match_info["name"])) is None:
+        raise web.HTTPNotFound()
+
+    response = web.StreamResponse(headers={"Content-Length": str(len(content))})
+    await response.prepare(request)
+    if request.method != "HEAD":
+        for start in range(0, len(content), 64 * 1024):
+            await response.write(content[start : start + 64 * 1024])
+    return response
+
+
+@pytest_asyncio.fixture
+async def taiga_storage(monkeypatch):
+    """
+    Starts a local HTTP stand-in for Taiga file storage and a bot with a real HTTP session.
+
+    :return: The running test server.
+    :rtype: TestServer
+    """
+    app = web.Application()
+    app.router.add_get("/media/{name}", _serve_file)
+    server = TestServer(app)
+    await server.start_server()
+
+    bot = Bot(token=get_settings().TELEGRAM_BOT_TOKEN)
+    monkeypatch.setattr(Configuration, "bot", bot)
+    monkeypatch.setattr(get_settings(), "ATTACHMENT_MAX_SIZE_MB", 2)
+    monkeypatch.setattr(get_settings(), "ATTACHMENTS_MAX_TOTAL_SIZE_MB", 5)
+
+    yield server
+
+    await bot.session.close()
+    await server.close()
+
+
+def _attachment(server: TestServer, name: str) -> DiffBaseAttachment:
+    return DiffBaseAttachment(filename=name, url=str(server.make_url(f"/media/{name}")))
+
+
+@pytest.mark.asyncio
+class TestAttachmentUtils:
+    """
+    Tests for streaming Taiga attachments to Telegram.
+    """
+
+    async def test_size_limits_and_unavailable_files(self, taiga_storage):
+        """
+        Tests that attachments above the per-file limit and unavailable ones are skipped.
+        """
+        attachments = [
+            _attachment(taiga_storage, "small.txt"),
+            _attachment(taiga_storage, "large.bin"),
+            _attachment(taiga_storage, "missing.txt"),
+            _attachment(taiga_storage, "medium.bin"),
+        ]
+
+        files = await prepare_attachments(attachments=attachments)
+
+        assert [file.filename for file in files] == ["small.txt", "medium.bin"]
+
+    async def test_total_size_limit(self, taiga_storage, monkeypatch):
+        """
+        Tests that attachments exceeding the total limit of a notification are skipped.
+        """
+        monkeypatch.setattr(get_settings(), "ATTACHMENTS_MAX_TOTAL_SIZE_MB", 3)
+        attachments = [_attachment(taiga_storage, "medium.bin"), _attachment(taiga_storage, "medium.bin")]
+
+        assert len(await prepare_attachments(attachments=attachments)) == 1
+
+    async def test_file_is_streamed_in_chunks(self, taiga_storage):
+        """
+        Tests that a file is read in chunks of the configured size.
+        """
+        file = CappedURLInputFile(
+            url=str(taiga_storage.make_url("/media/medium.bin")), max_size=2 * MB, chunk_size=64 * 1024
+        )
+
+        chunks = [chunk async for chunk in file.read(Configuration.bot)]
+
+        assert b"".join(chunks) == FILES["medium.bin"]
+        assert max(map(len, chunks)) <= 64 * 1024
+
+    async def test_stream_is_aborted_over_limit(self, taiga_storage):
+        """
+        Tests that streaming stops once a file turns out to be larger than the limit.
+        """
+        file = CappedURLInputFile(url=str(taiga_storage.make_url("/media/large.bin")), max_size=2 * MB)
+
+        with pytest.raises(AttachmentTooLargeError):
+            async for _ in file.read(Configuration.bot):
+                pass
+
+    async def test_files_are_grouped(self, taiga_storage, monkeypatch):
+        """
+        Tests that a single file is sent as a document and several files as albums of up to ten.
+        """
+        sent = []
+
+        async def fake_send_document(chat_id, document, **kwargs):
+            sent.append(("document", 1))
+
+        async def fake_send_media_group(chat_id, media, **kwargs):
+            sent.append(("group", len(media)))
+
+        monkeypatch.setattr(attachment_utils, "send_document", fake_send_document)
+        monkeypatch.setattr(attachment_utils, "send_media_group", fake_send_media_group)
+        monkeypatch.setattr(get_settings(), "ATTACHMENTS_MAX_TOTAL_SIZE_MB", 50)
+
+        await send_attachments(chat_id=1, attachments=[_attachment(taiga_storage, "small.txt")] * 12)
+
+        assert sent == [("group", 10), ("group", 2)]
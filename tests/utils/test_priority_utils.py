@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from src.entities.enums.event_enums import EventActionEnum, EventTypeEnum
+from src.entities.enums.lang_enum import LanguageEnum
+from src.entities.enums.notification_priority_enum import NotificationPriorityEnum
+from src.entities.schemas.project_data.project_schemas import (
+    InstanceModel,
+    PriorityRuleModel,
+)
+from src.utils.priority_utils import get_notification_priority, is_rule_matched
+
+
+def _payload(event_type: EventTypeEnum, action: EventActionEnum, data=None, diff=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        type=event_type, action=action, data=data or SimpleNamespace(), change=SimpleNamespace(diff=diff)
+    )
+
+
+def _instance(rules: list[PriorityRuleModel]) -> InstanceModel:
+    return InstanceModel(
+        instance_id="67d1a2b3c4d5e6f708192a3b",
+        instance_name="instance",
+        project_id="project",
+        language=LanguageEnum.EN,
+        priority_rules=rules,
+    )
+
+
+class TestPriorityUtils:
+    """
+    Tests for the notification priority rules.
+    """
+
+    def test_changed_field_rule(self):
+        """
+        Tests that a rule with a field only matches events that change the field.
+        """
+        rule = PriorityRuleModel(priority=NotificationPriorityEnum.HIGH, field="is_blocked")
+
+        assert is_rule_matched(
+            rule=rule,
+            payload=_payload(EventTypeEnum.USERSTORY, EventActionEnum.CHANGE, diff=SimpleNamespace(is_blocked=True)),
+        )
+        assert not is_rule_matched(
+            rule=rule,
+            payload=_payload(EventTypeEnum.USERSTORY, EventActionEnum.CHANGE, diff=SimpleNamespace(is_blocked=None)),
+        )
+
+    def test_field_value_rule(self):
+        """
+        Tests that a rule with values compares the name of the object field.
+        """
+        rule = PriorityRuleModel(
+            priority=NotificationPriorityEnum.HIGH, type=EventTypeEnum.ISSUE, field="severity", values=["Critical"]
+        )
+        critical = SimpleNamespace(severity=SimpleNamespace(name="Critical"))
+        minor = SimpleNamespace(severity=SimpleNamespace(name="Minor"))
+
+        assert is_rule_matched(rule=rule, payload=_payload(EventTypeEnum.ISSUE, EventActionEnum.CREATE, data=critical))
+        assert not is_rule_matched(rule=rule, payload=_payload(EventTypeEnum.ISSUE, EventActionEnum.CREATE, data=minor))
+        assert not is_rule_matched(
+            rule=rule, payload=_payload(EventTypeEnum.TASK, EventActionEnum.CREATE, data=critical)
+        )
+
+    def test_first_matching_rule_wins(self):
+        """
+        Tests that the first matching instance rule decides and unmatched events get normal priority.
+        """
+        instance = _instance(
+            rules=[
+                PriorityRuleModel(priority=NotificationPriorityEnum.LOW, type=EventTypeEnum.WIKIPAGE),
+                PriorityRuleModel(priority=NotificationPriorityEnum.HIGH, action=EventActionEnum.DELETE),
+            ]
+        )
+
+        wiki_delete = _payload(EventTypeEnum.WIKIPAGE, EventActionEnum.DELETE)
+        task_delete = _payload(EventTypeEnum.TASK, EventActionEnum.DELETE)
+        task_create = _payload(EventTypeEnum.TASK, EventActionEnum.CREATE)
+
+        assert get_notification_priority(payload=wiki_delete, instance=instance) == NotificationPriorityEnum.LOW
+        assert get_notification_priority(payload=task_delete, instance=instance) == NotificationPriorityEnum.HIGH
+        assert get_notification_priority(payload=task_create, instance=instance) == NotificationPriorityEnum.NORMAL
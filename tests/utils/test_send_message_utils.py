@@ -2,12 +2,12 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
-from aiogram.methods import DeleteMessage, EditMessageText
+from aiogram.methods import DeleteMessage, EditMessageText, SendMessage
 from aiogram.types import Message
 
-from src.core.Base.exceptions import BotBlocked
+from src.core.Base.exceptions import BotBlocked, ChatUnavailableError
 from src.core.settings import Configuration
-from src.utils.send_message_utils import send_message, try_delete
+from src.utils.send_message_utils import send_message, send_notification, try_delete
 
 
 @pytest.mark.asyncio
@@ -72,3 +72,24 @@ class TestBotMethods:
         result = await send_message(chat_id=123, text="New", message_id=456, try_to_edit=True)
         assert result is None
         self.mock_logger.warning.assert_called_with("The bot is blocked by user: 123")
+
+    async def test_send_notification_chat_not_found(self):
+        self.mock_bot.send_message.side_effect = TelegramBadRequest(
+            message="Bad Request: chat not found", method=SendMessage(chat_id=123, text="New")
+        )
+        with pytest.raises(ChatUnavailableError):
+            await send_notification(chat_id=123, text="New")
+
+    async def test_send_notification_forbidden(self):
+        self.mock_bot.send_message.side_effect = TelegramForbiddenError(
+            message="Forbidden: bot was kicked from the group chat", method=SendMessage(chat_id=123, text="New")
+        )
+        with pytest.raises(ChatUnavailableError):
+            await send_notification(chat_id=123, text="New")
+
+    async def test_send_notification_other_bad_request(self):
+        self.mock_bot.send_message.side_effect = TelegramBadRequest(
+            message="Bad Request: can't parse entities", method=SendMessage(chat_id=123, text="New")
+        )
+        with pytest.raises(TelegramBadRequest):
+            await send_notification(chat_id=123, text="New")
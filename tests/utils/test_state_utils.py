@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from src.core.settings import get_settings
+from src.utils.state_utils import get_info_for_state
+
+
+@pytest.fixture
+def state() -> FSMContext:
+    """
+    Provides an FSMContext backed by the in-memory storage.
+
+    :return: An empty FSMContext.
+    :rtype: FSMContext
+    """
+    return FSMContext(storage=MemoryStorage(), key=StorageKey(bot_id=1, chat_id=1, user_id=1))
+
+
+@pytest.mark.asyncio
+class TestGetInfoForState:
+    """
+    Tests for the navigation history kept by get_info_for_state.
+    """
+
+    async def test_returns_previous_callback(self, state):
+        """
+        Tests that each callback remembers the screen it was opened from.
+        """
+        assert await get_info_for_state(SimpleNamespace(data="projects"), state) == "menu"
+        assert await get_info_for_state(SimpleNamespace(data="project:1"), state) == "projects"
+        assert await get_info_for_state(SimpleNamespace(data="instance:1"), state) == "project:1"
+        assert await get_info_for_state(SimpleNamespace(data="project:1"), state) == "projects"
+
+    async def test_history_is_bounded(self, state, monkeypatch):
+        """
+        Tests that the history keeps only the most recently used callbacks and evicted ones fall back to the current one.
+        """
+        monkeypatch.setattr(get_settings(), "CALLBACK_HISTORY_SIZE", 3)
+        await get_info_for_state(SimpleNamespace(data="menu"), state)
+        for number in range(10):
+            await get_info_for_state(SimpleNamespace(data=f"screen:{number}"), state)
+
+        data = await state.get_data()
+        assert list(data["callback_history"]) == ["screen:7", "screen:8", "screen:9"]
+        assert await get_info_for_state(SimpleNamespace(data="screen:0"), state) == "screen:9"
+
+    async def test_keeps_other_state_data(self, state):
+        """
+        Tests that the rest of the state data is kept when the history is written.
+        """
+        await state.update_data(project_id="1")
+
+        await get_info_for_state(SimpleNamespace(data="projects"), state)
+
+        assert (await state.get_data())["project_id"] == "1"
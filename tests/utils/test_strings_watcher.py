@@ -0,0 +1,80 @@
+import pytest
+
+from src.core.settings import Configuration, get_settings
+from src.utils.strings_watcher import StringsWatcher
+from src.utils.yaml_utils import validate_strings
+
+
+@pytest.fixture
+def strings_path(tmp_path, monkeypatch):
+    """
+    Provides a temporary strings directory watched by a fresh StringsWatcher.
+
+    :return: The path of the strings directory.
+    :rtype: Path
+    """
+    path = tmp_path / "strings"
+    path.mkdir()
+    (path / "texts.yaml").write_text("greeting: Hello, {name}!\n", encoding="utf-8")
+
+    monkeypatch.setattr(get_settings(), "YAML_FILE_PATH", str(path))
+    monkeypatch.setattr(get_settings(), "STRINGS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Configuration, "strings", {"texts": {"greeting": "Hello, {name}!"}})
+    monkeypatch.setattr(StringsWatcher, "_instance", None)
+
+    return path
+
+
+@pytest.mark.asyncio
+class TestStringsWatcher:
+    """
+    Tests for the StringsWatcher class.
+    """
+
+    async def test_changed_strings_are_swapped_in(self, strings_path):
+        """
+        Tests that edited strings replace the loaded ones.
+        """
+        (strings_path / "texts.yaml").write_text("greeting: Hi, {name}!\nfarewell: Bye\n", encoding="utf-8")
+
+        assert await StringsWatcher().reload()
+        assert Configuration.strings == {"texts": {"greeting": "Hi, {name}!", "farewell": "Bye"}}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["farewell: Bye\n", "greeting: Hi, {name!\n", "greeting: [unclosed\n"],
+        ids=["missing_key", "broken_template", "broken_yaml"],
+    )
+    async def test_invalid_strings_are_rejected(self, strings_path, content):
+        """
+        Tests that invalid strings are not swapped in and the current ones are kept.
+        """
+        current = Configuration.strings
+        (strings_path / "texts.yaml").write_text(content, encoding="utf-8")
+
+        assert not await StringsWatcher().reload()
+        assert Configuration.strings is current
+
+    async def test_scan_detects_changes(self, strings_path):
+        """
+        Tests that the modification snapshot changes when a file is edited.
+        """
+        watcher = StringsWatcher()
+        snapshot = watcher._scan()
+
+        (strings_path / "texts.yaml").write_text("greeting: Hello again, {name}!\n", encoding="utf-8")
+
+        assert watcher._scan() != snapshot
+
+
+class TestValidateStrings:
+    """
+    Tests for the validate_strings function.
+    """
+
+    def test_nested_lists_are_validated(self):
+        """
+        Tests that templates inside lists are validated as well.
+        """
+        with pytest.raises(ValueError):
+            validate_strings(strings={"schema": [["{broken"]]}, reference={})